@@ -0,0 +1 @@
+"""Performance benchmarks; run the modules as scripts."""
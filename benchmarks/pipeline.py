@@ -0,0 +1,303 @@
+"""End-to-end benchmark of the trigger -> capture -> save -> log pipeline.
+
+The benchmark runs the same steps as :meth:`main.MainController.on_trigger`
+without the UI:
+
+1. read a serial number and look up its model (:func:`model_api.select_model`)
+2. capture every camera (:meth:`CameraManager.capture_images`)
+3. save each frame (:meth:`CameraManager.save_latest_image`)
+4. write the log entry (:meth:`EventLogger.log_event`)
+5. grab a screenshot (:meth:`ScreenCapture.capture`)
+
+The cameras are ``synthetic`` cameras (see :class:`manager_cam.SyntheticCamera`),
+and screenshots come from an in-memory screen, so the benchmark runs on any
+Linux box without cameras or a display. Everything is written to a
+temporary directory.
+
+Results list the throughput in triggers per second, p50/p95/p99 latency
+per stage and in total, and peak RSS. They are compared against a baseline
+JSON file, and the script exits with status 1 when a metric regressed by
+more than ``--tolerance``. Baselines depend on the machine, so record one
+on the machine that runs the comparison.
+
+Usage
+-----
+::
+
+    python benchmarks/pipeline.py --cameras 6 --triggers 500
+    python benchmarks/pipeline.py --update-baseline   # record a new baseline
+    python benchmarks/pipeline.py --writer            # background ImageWriter
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+import argparse
+import json
+import sys
+import tempfile
+import time
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import numpy as np  # noqa: E402
+
+from event_logger import EventLogger  # noqa: E402
+from image_writer import ImageWriter  # noqa: E402
+from manager_cam import TIMED_OUT, CameraManager  # noqa: E402
+import model_api  # noqa: E402
+from screenshot import ScreenCapture  # noqa: E402
+
+
+DEFAULT_BASELINE = Path(__file__).with_name("baseline.json")
+
+STAGES = ("select_model", "capture", "save", "log", "screenshot", "total")
+
+# Parameters that must match for a baseline comparison to be meaningful
+_PARAMS = ("cameras", "triggers", "resolution", "latency_ms", "jitter_ms", "writer")
+
+
+class _FakeScreenShot:
+    def __init__(self, width: int, height: int) -> None:
+        self.size = (width, height)
+        self.bgra = bytes(width * height * 4)
+
+
+class _FakeScreen:
+    """Stand-in for ``mss.mss()`` returning a blank screen."""
+
+    def __init__(self, width: int, height: int) -> None:
+        self.monitors = [{}, {"left": 0, "top": 0, "width": width, "height": height}]
+        self._shot = _FakeScreenShot(width, height)
+
+    def grab(self, region: dict) -> _FakeScreenShot:
+        return self._shot
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Return the peak resident set size of this process in MiB."""
+    try:
+        import resource
+    except ImportError:  # pragma: no cover - Windows
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    """Return mean and p50/p95/p99 of ``samples`` (seconds) in milliseconds."""
+    if not samples:
+        return {}
+    ms = np.asarray(samples) * 1000.0
+    p50, p95, p99 = np.percentile(ms, [50, 95, 99])
+    return {"mean": float(ms.mean()), "p50": float(p50), "p95": float(p95), "p99": float(p99)}
+
+
+def write_config(
+    path: Path, *, cameras: int, resolution: str, latency_ms: float, jitter_ms: float
+) -> Path:
+    """Write a config with ``cameras`` synthetic cameras to ``path``."""
+    data = {
+        "cameras": [
+            {
+                "id": i,
+                "type": "synthetic",
+                "name": f"Synthetic{i}",
+                "resolution": resolution,
+                "latencyMs": latency_ms,
+                "jitterMs": jitter_ms,
+                "jitterDistribution": "normal",
+                "seed": i,
+            }
+            for i in range(1, cameras + 1)
+        ],
+        "serialMapping": {"AB12": "ModelA", "CD34": "ModelB"},
+    }
+    path.write_text(json.dumps(data))
+    return path
+
+
+def run(
+    *,
+    cameras: int = 4,
+    triggers: int = 200,
+    resolution: str = "1280x720",
+    latency_ms: float = 5.0,
+    jitter_ms: float = 1.0,
+    writer: bool = False,
+    workdir: str | Path | None = None,
+) -> Dict[str, Any]:
+    """Run the pipeline ``triggers`` times and return the results."""
+    with tempfile.TemporaryDirectory(dir=workdir) as tmp:
+        root = Path(tmp)
+        cfg = write_config(
+            root / "config.json",
+            cameras=cameras,
+            resolution=resolution,
+            latency_ms=latency_ms,
+            jitter_ms=jitter_ms,
+        )
+        width, height = (int(v) for v in resolution.split("x"))
+        screen = ScreenCapture(sct=_FakeScreen(width, height))
+        image_writer = ImageWriter() if writer else None
+        samples: Dict[str, List[float]] = {stage: [] for stage in STAGES}
+        timeouts = 0
+
+        logger = EventLogger(root / "logs" / "events.txt")
+        with model_api.temporary_mapping(cfg), logger, CameraManager(config_path=cfg) as manager:
+            manager.connect_all()
+            manager.capture_images()  # warm up: render frames, start workers
+            clock = time.perf_counter
+            start = clock()
+            for n in range(triggers):
+                t0 = clock()
+                serial = f"AB12{n:06d}"
+                model = model_api.select_model(serial) or ""
+                t1 = clock()
+                images = manager.capture_images()
+                t2 = clock()
+                for cam_id, frame in images.items():
+                    if frame is TIMED_OUT:
+                        timeouts += 1
+                    elif frame is not None:
+                        manager.save_latest_image(
+                            cam_id,
+                            root / "images" / f"cam{cam_id}",
+                            serial=serial,
+                            status="OK",
+                            writer=image_writer,
+                        )
+                t3 = clock()
+                logger.log_event("info", "capture complete", {"serial": serial, "model": model})
+                t4 = clock()
+                screen.capture()
+                t5 = clock()
+                for stage, value in zip(
+                    STAGES, (t1 - t0, t2 - t1, t3 - t2, t4 - t3, t5 - t4, t5 - t0)
+                ):
+                    samples[stage].append(value)
+            if image_writer is not None:
+                image_writer.close()  # include draining the queue in the run time
+            elapsed = clock() - start
+
+    return {
+        "params": {
+            "cameras": cameras,
+            "triggers": triggers,
+            "resolution": resolution,
+            "latency_ms": latency_ms,
+            "jitter_ms": jitter_ms,
+            "writer": writer,
+        },
+        "throughput": triggers / elapsed if elapsed else 0.0,
+        "frames_per_second": triggers * cameras / elapsed if elapsed else 0.0,
+        "timeouts": timeouts,
+        "latency_ms": {stage: summarize(values) for stage, values in samples.items()},
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def compare(
+    result: Dict[str, Any], baseline: Dict[str, Any], *, tolerance: float = 0.25
+) -> List[str]:
+    """Return a description of every metric that regressed beyond ``tolerance``.
+
+    Latency percentiles and peak RSS regress when they grow, throughput when
+    it shrinks. Results recorded with different parameters are not compared.
+    """
+    if any(result["params"].get(k) != baseline.get("params", {}).get(k) for k in _PARAMS):
+        raise ValueError("baseline was recorded with different parameters")
+
+    regressions: List[str] = []
+    base_tp = baseline.get("throughput")
+    if base_tp and result["throughput"] < base_tp * (1 - tolerance):
+        regressions.append(
+            f"throughput {result['throughput']:.1f}/s < baseline {base_tp:.1f}/s"
+        )
+    for stage, stats in result["latency_ms"].items():
+        base_stats = baseline.get("latency_ms", {}).get(stage, {})
+        for key in ("p50", "p95", "p99"):
+            base = base_stats.get(key)
+            # ignore sub-0.1 ms stages where timer noise dominates
+            if base and stats.get(key, 0.0) > max(base * (1 + tolerance), base + 0.1):
+                regressions.append(
+                    f"{stage} {key} {stats[key]:.2f} ms > baseline {base:.2f} ms"
+                )
+    base_rss, rss = baseline.get("peak_rss_mb"), result.get("peak_rss_mb")
+    if base_rss and rss and rss > base_rss * (1 + tolerance):
+        regressions.append(f"peak RSS {rss:.0f} MiB > baseline {base_rss:.0f} MiB")
+    return regressions
+
+
+def format_report(result: Dict[str, Any]) -> str:
+    """Return a human readable table of ``result``."""
+    p = result["params"]
+    lines = [
+        f"{p['triggers']} triggers x {p['cameras']} cameras at {p['resolution']}"
+        f" ({'background writer' if p['writer'] else 'inline save'})",
+        f"throughput: {result['throughput']:.1f} triggers/s,"
+        f" {result['frames_per_second']:.1f} frames/s, {result['timeouts']} timeouts",
+        f"{'stage':<14}{'mean':>9}{'p50':>9}{'p95':>9}{'p99':>9}  (ms)",
+    ]
+    for stage, stats in result["latency_ms"].items():
+        lines.append(
+            f"{stage:<14}" + "".join(f"{stats.get(k, 0.0):>9.2f}" for k in ("mean", "p50", "p95", "p99"))
+        )
+    if result["peak_rss_mb"] is not None:
+        lines.append(f"peak RSS: {result['peak_rss_mb']:.1f} MiB")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cameras", type=int, default=4)
+    parser.add_argument("--triggers", type=int, default=200)
+    parser.add_argument("--resolution", default="1280x720")
+    parser.add_argument("--latency-ms", type=float, default=5.0)
+    parser.add_argument("--jitter-ms", type=float, default=1.0)
+    parser.add_argument("--writer", action="store_true", help="save via a background ImageWriter")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--json", type=Path, help="also write the results to this file")
+    args = parser.parse_args(argv)
+
+    result = run(
+        cameras=args.cameras,
+        triggers=args.triggers,
+        resolution=args.resolution,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        writer=args.writer,
+    )
+    print(format_report(result))
+    if args.json:
+        args.json.write_text(json.dumps(result, indent=2))
+
+    if args.update_baseline:
+        args.baseline.write_text(json.dumps(result, indent=2) + "\n")
+        print(f"baseline written to {args.baseline}")
+        return 0
+    if not args.baseline.exists():
+        print(f"no baseline at {args.baseline}; run with --update-baseline")
+        return 0
+    try:
+        regressions = compare(
+            result, json.loads(args.baseline.read_text()), tolerance=args.tolerance
+        )
+    except ValueError as exc:
+        print(f"not compared: {exc}")
+        return 0
+    for line in regressions:
+        print(f"REGRESSION: {line}")
+    if not regressions:
+        print(f"no regressions against {args.baseline}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
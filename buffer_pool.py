@@ -0,0 +1,120 @@
+"""Reusable pool of preallocated NumPy frame buffers.
+
+Continuous capture allocates and frees one large array per frame. A
+:class:`BufferPool` keeps released arrays keyed by ``(shape, dtype)`` and
+hands them out again, up to an explicit memory cap.
+
+Example
+-------
+>>> pool = BufferPool(max_bytes=256 * 1024 * 1024)
+>>> with pool.checkout((1080, 1920, 3)) as frame:
+...     frame[...] = 0
+>>> pool.stats()["hits"]
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Tuple
+import threading
+
+import numpy as np
+
+
+Key = Tuple[Tuple[int, ...], str]
+
+
+class BufferPool:
+    """Hand out and recycle NumPy arrays of a given shape and dtype.
+
+    Parameters
+    ----------
+    max_bytes : int, optional
+        Upper bound on memory held by idle pooled buffers. When releasing a
+        buffer would exceed it, the least recently used idle buffers are
+        evicted, or the released buffer is dropped. Defaults to 256 MiB.
+    """
+
+    def __init__(self, max_bytes: int = 256 * 1024 * 1024) -> None:
+        self.max_bytes = max_bytes
+        self._free: "OrderedDict[Key, List[np.ndarray]]" = OrderedDict()
+        self._outstanding: Dict[int, Key] = {}
+        self._idle_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(shape: Tuple[int, ...], dtype: object) -> Key:
+        return tuple(int(n) for n in shape), np.dtype(dtype).str
+
+    def acquire(self, shape: Tuple[int, ...], dtype: object = np.uint8) -> "np.ndarray":
+        """Return an uninitialised array of ``shape`` and ``dtype``."""
+        key = self._key(shape, dtype)
+        with self._lock:
+            free = self._free.get(key)
+            if free:
+                arr = free.pop()
+                if not free:
+                    del self._free[key]
+                self._idle_bytes -= arr.nbytes
+                self._hits += 1
+            else:
+                arr = None
+                self._misses += 1
+        if arr is None:
+            arr = np.empty(key[0], dtype=np.dtype(key[1]))
+        with self._lock:
+            self._outstanding[id(arr)] = key
+        return arr
+
+    def release(self, arr: "np.ndarray") -> None:
+        """Return ``arr`` to the pool. Arrays not from this pool are ignored."""
+        with self._lock:
+            key = self._outstanding.get(id(arr))
+            if key is None or key != self._key(arr.shape, arr.dtype):
+                return
+            del self._outstanding[id(arr)]
+            while self._idle_bytes + arr.nbytes > self.max_bytes and self._free:
+                old_key, bufs = next(iter(self._free.items()))
+                evicted = bufs.pop(0)
+                if not bufs:
+                    del self._free[old_key]
+                self._idle_bytes -= evicted.nbytes
+                self._evictions += 1
+            if self._idle_bytes + arr.nbytes > self.max_bytes:
+                self._evictions += 1
+                return
+            self._free.setdefault(key, []).append(arr)
+            self._free.move_to_end(key)
+            self._idle_bytes += arr.nbytes
+
+    @contextmanager
+    def checkout(self, shape: Tuple[int, ...], dtype: object = np.uint8) -> Iterator["np.ndarray"]:
+        """Context manager that acquires a buffer and releases it on exit."""
+        arr = self.acquire(shape, dtype)
+        try:
+            yield arr
+        finally:
+            self.release(arr)
+
+    def clear(self) -> None:
+        """Drop all idle buffers."""
+        with self._lock:
+            self._free.clear()
+            self._idle_bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss/eviction counters and memory usage."""
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "idle_bytes": self._idle_bytes,
+                "idle_buffers": sum(len(b) for b in self._free.values()),
+                "outstanding": len(self._outstanding),
+                "max_bytes": self.max_bytes,
+            }
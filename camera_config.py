@@ -19,6 +19,53 @@ class Camera:
     device: str | None = None
     ip: str | None = None
     port: int | None = None
+    buffer_size: int | None = None
+    resolution: str | None = None
+    latency_ms: float | None = None
+    jitter_ms: float | None = None
+    jitter_distribution: str | None = None
+    image_format: str | None = None
+    directory: str | None = None
+    fps: float | None = None
+    loop: bool | None = None
+    seed: int | None = None
+
+    @classmethod
+    def from_dict(cls, cam: Dict) -> "Camera":
+        """Build a :class:`Camera` from one entry of the ``cameras`` list."""
+        return cls(
+            id=cam.get("id"),
+            type=cam.get("type"),
+            name=cam.get("name"),
+            device=cam.get("device"),
+            ip=cam.get("ip"),
+            port=cam.get("port"),
+            buffer_size=cam.get("bufferSize"),
+            resolution=cam.get("resolution"),
+            latency_ms=cam.get("latencyMs"),
+            jitter_ms=cam.get("jitterMs"),
+            jitter_distribution=cam.get("jitterDistribution"),
+            image_format=cam.get("imageFormat"),
+            directory=cam.get("directory"),
+            fps=cam.get("fps"),
+            loop=cam.get("loop"),
+            seed=cam.get("seed"),
+        )
+
+
+JITTER_DISTRIBUTIONS = ("none", "uniform", "normal", "exponential")
+REPLAY_SUFFIXES = (".jpg", ".jpeg", ".png", ".bmp", ".webp")
+
+
+def parse_resolution(value: str) -> tuple[int, int]:
+    """Parse a ``"1920x1080"`` resolution string into ``(width, height)``."""
+    try:
+        width, height = (int(part) for part in str(value).lower().split("x"))
+    except ValueError:
+        raise ValueError(f"Invalid resolution: {value!r}") from None
+    if width < 1 or height < 1:
+        raise ValueError(f"Invalid resolution: {value!r}")
+    return width, height
 
 
 def load_cameras(config_path: str | Path = "config/config.json") -> List[Dict]:
@@ -34,17 +81,7 @@ def load_cameras(config_path: str | Path = "config/config.json") -> List[Dict]:
 def load_camera_objects(config_path: str | Path = "config/config.json") -> List[Camera]:
     """Load camera configuration and return a list of :class:`Camera` objects."""
     camera_dicts = load_cameras(config_path)
-    return [
-        Camera(
-            id=cam.get("id"),
-            type=cam.get("type"),
-            name=cam.get("name"),
-            device=cam.get("device"),
-            ip=cam.get("ip"),
-            port=cam.get("port"),
-        )
-        for cam in camera_dicts
-    ]
+    return [Camera.from_dict(cam) for cam in camera_dicts]
 
 
 def validate_cameras(cameras: List[Dict]) -> None:
@@ -60,6 +97,16 @@ def validate_cameras(cameras: List[Dict]) -> None:
         elif camera_type == "keyence":
             if "ip" not in camera or "port" not in camera:
                 raise ValueError("Keyence camera requires 'ip' and 'port'")
+        elif camera_type == "synthetic":
+            if "resolution" in camera:
+                parse_resolution(camera["resolution"])
+            if camera.get("jitterDistribution", "normal") not in JITTER_DISTRIBUTIONS:
+                raise ValueError("Synthetic camera has unknown 'jitterDistribution'")
+            if camera.get("imageFormat", "jpeg") not in ("jpeg", "raw"):
+                raise ValueError("Synthetic camera 'imageFormat' must be 'jpeg' or 'raw'")
+        elif camera_type == "replay":
+            if "directory" not in camera:
+                raise ValueError("Replay camera missing 'directory' field")
         else:
             raise ValueError("Unknown camera type")
 
@@ -81,4 +128,11 @@ def get_camera_status(camera: Dict) -> str:
         if camera.get("ip") and camera.get("port"):
             return "online"
         return "offline"
+    if camera_type == "synthetic":
+        return "online"
+    if camera_type == "replay":
+        directory = camera.get("directory")
+        if directory and Path(directory).is_dir():
+            return "online"
+        return "not found"
     return "unknown"
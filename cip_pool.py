@@ -0,0 +1,189 @@
+"""Keyed pool of open CIP (EtherNet/IP) sessions.
+
+Opening a :class:`pycomm3.CIPDriver` performs a full connect, register and
+forward-open handshake. :class:`CIPSessionPool` keeps one open session per
+camera IP so repeated triggers only pay for the actual read/write round trip.
+
+Example
+-------
+>>> pool = CIPSessionPool(max_idle=60)
+>>> data = pool.call("192.168.0.10", lambda plc: plc.read_array("Assembly[100]", 196))
+>>> pool.close_all()
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional, TypeVar
+import logging
+import threading
+import time
+
+
+T = TypeVar("T")
+
+
+def _default_driver_factory(ip: str) -> Any:
+    from pycomm3 import CIPDriver
+
+    return CIPDriver(ip)
+
+
+@dataclass
+class _Session:
+    driver: Any
+    last_used: float
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+class CIPSessionPool:
+    """Keep open CIP sessions keyed by IP address.
+
+    Parameters
+    ----------
+    driver_factory : Callable[[str], object], optional
+        Factory returning an unopened driver for an IP. Defaults to
+        :class:`pycomm3.CIPDriver`. The driver must provide ``open()``,
+        ``close()`` and a ``connected`` attribute.
+    max_idle : float, optional
+        Sessions unused for longer than this many seconds are closed.
+        Defaults to ``300``.
+    retries : int, optional
+        Number of times an operation is retried on a freshly opened session
+        after a failure. Defaults to ``1``. A retry runs the whole operation
+        again, so operations with side effects must either tolerate that or
+        pass ``retries=0`` to :meth:`call`.
+    clock : Callable[[], float], optional
+        Monotonic clock, injectable for testing.
+    """
+
+    def __init__(
+        self,
+        *,
+        driver_factory: Callable[[str], Any] | None = None,
+        max_idle: float = 300.0,
+        retries: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.driver_factory = driver_factory or _default_driver_factory
+        self.max_idle = max_idle
+        self.retries = retries
+        self.clock = clock
+        self._sessions: Dict[str, _Session] = {}
+        self._lock = threading.Lock()
+
+    # Internal helpers -------------------------------------------------
+    def _open(self, ip: str) -> Any:
+        driver = self.driver_factory(ip)
+        driver.open()
+        logging.info("Opened CIP session to %s", ip)
+        return driver
+
+    @staticmethod
+    def _close_driver(ip: str, driver: Any) -> None:
+        try:
+            driver.close()
+        except Exception as exc:  # pragma: no cover - best effort
+            logging.error("Failed to close CIP session to %s: %s", ip, exc)
+
+    def _get_session(self, ip: str) -> _Session:
+        self.evict_idle()
+        with self._lock:
+            session = self._sessions.get(ip)
+            if session is None:
+                session = _Session(driver=None, last_used=self.clock())
+                self._sessions[ip] = session
+            return session
+
+    @staticmethod
+    def _is_healthy(driver: Any) -> bool:
+        return driver is not None and bool(getattr(driver, "connected", False))
+
+    # Public API -------------------------------------------------------
+    def call(self, ip: str, func: Callable[[Any], T], *, retries: int | None = None) -> T:
+        """Run ``func(driver)`` on the pooled session for ``ip``.
+
+        Unhealthy sessions are re-opened before use. When ``func`` raises,
+        the session is closed and ``func`` is called again on a new session
+        up to ``retries`` times (the pool's ``retries`` by default) before
+        the error is propagated. Use ``retries=0`` when ``func`` must not
+        run twice, e.g. a write followed by a read that may fail.
+        """
+        if retries is None:
+            retries = self.retries
+        session = self._get_session(ip)
+        session.lock.acquire()
+        while self._sessions.get(ip) is not session:
+            # Evicted or closed between lookup and lock; use the current one
+            session.lock.release()
+            session = self._get_session(ip)
+            session.lock.acquire()
+        try:
+            attempt = 0
+            while True:
+                if not self._is_healthy(session.driver):
+                    if session.driver is not None:
+                        self._close_driver(ip, session.driver)
+                        session.driver = None
+                    session.driver = self._open(ip)
+                try:
+                    result = func(session.driver)
+                    session.last_used = self.clock()
+                    return result
+                except Exception as exc:
+                    logging.error("CIP call to %s failed: %s", ip, exc)
+                    self._close_driver(ip, session.driver)
+                    session.driver = None
+                    if attempt >= retries:
+                        raise
+                    attempt += 1
+        finally:
+            session.lock.release()
+
+    def evict_idle(self) -> int:
+        """Close sessions idle for longer than ``max_idle`` and return the count."""
+        now = self.clock()
+        evicted = []
+        with self._lock:
+            for ip, session in list(self._sessions.items()):
+                if now - session.last_used <= self.max_idle:
+                    continue
+                if not session.lock.acquire(blocking=False):
+                    continue  # in use
+                try:
+                    del self._sessions[ip]
+                    evicted.append((ip, session.driver))
+                finally:
+                    session.lock.release()
+        for ip, driver in evicted:
+            if driver is not None:
+                self._close_driver(ip, driver)
+                logging.info("Evicted idle CIP session to %s", ip)
+        return len(evicted)
+
+    def close(self, ip: str) -> None:
+        """Close and forget the session for ``ip`` if present."""
+        with self._lock:
+            session = self._sessions.pop(ip, None)
+        if session is not None:
+            with session.lock:
+                if session.driver is not None:
+                    self._close_driver(ip, session.driver)
+                    session.driver = None
+
+    def close_all(self) -> None:
+        """Close every pooled session."""
+        with self._lock:
+            ips = list(self._sessions)
+        for ip in ips:
+            self.close(ip)
+
+    def get_driver(self, ip: str) -> Optional[Any]:
+        """Return the currently pooled driver for ``ip`` without opening one."""
+        with self._lock:
+            session = self._sessions.get(ip)
+        return None if session is None else session.driver
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(1 for s in self._sessions.values() if s.driver is not None)
@@ -3,26 +3,92 @@
 Events are stored in memory and appended to ``file_path`` as JSON lines.  The
 log list can also be saved or loaded in CSV/JSON format.
 
+In buffered mode events are queued and appended by a background thread in
+batches, so bursts of events cost one write instead of one open/append/close
+each. Buffered loggers are flushed on :meth:`EventLogger.close` and at
+interpreter exit.
+
+:func:`iter_events` streams large JSON-lines, JSON-array and CSV logs with
+optional filters, and :func:`tail` reads the newest events from the end.
+
+Events can also be written to an indexed SQLite :class:`event_store.EventStore`
+for time-range and type queries without loading the log.
+
 Example
 -------
 >>> logger = EventLogger("logs/events.txt")
 >>> logger.log_event("info", "started")
+>>> fast = EventLogger("logs/events.txt", buffered=True, flush_interval=0.5)
+>>> fast.flush()  # wait until every queued event is on disk
 >>> logger.save_log_json("logs/events.json")
 >>> logger.save_log_csv("logs/events.csv")
 >>> logger.load_log_json("logs/events.json")
+>>> errors = list(iter_events("logs/events.txt", event_type="error"))
+>>> latest = tail("logs/events.txt", 20)
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass, asdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-import json
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    TextIO,
+    Tuple,
+    Union,
+)
+import atexit
+import bisect
+import collections
 import csv
+import json
+import logging
+import mmap
+import os
+import queue
+import sqlite3
+import sys
+import threading
+import weakref
+
+from log_rotation import (
+    COMPRESSORS,
+    RotationPolicy,
+    compress_segment,
+    expired_segments,
+    list_segments,
+    open_segment,
+    remove_segments,
+    segment_exists,
+    segment_path,
+    segment_time,
+    strip_compression,
+)
+
+if TYPE_CHECKING:  # pragma: no cover
+    from event_store import EventStore
+
+
+# Slotted on Python 3.10+, where dataclasses support it
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+FIELDS = ("timestamp", "event_type", "message", "metadata")
 
+# (timestamp, event_type, message, metadata as JSON text or None)
+Row = Tuple[str, str, str, Optional[str]]
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class LogEntry:
     """Data structure representing a single log event."""
 
@@ -32,6 +98,308 @@ class LogEntry:
     metadata: Optional[Dict[str, Any]] = None
 
 
+def entry_from_row(row: Row) -> LogEntry:
+    """Return the :class:`LogEntry` for a ``(timestamp, event_type, message,
+    metadata_json)`` row, decoding the metadata."""
+    ts, event_type, message, meta = row
+    return LogEntry(ts, event_type, message, None if meta is None else json.loads(meta))
+
+
+def _row(data: Dict[str, Any]) -> Row:
+    """Return a row for one decoded event mapping.
+
+    Raises :class:`TypeError` when ``data`` is not a JSON object.
+    """
+    if not isinstance(data, dict):
+        raise TypeError(f"log entries must be JSON objects, not {type(data).__name__}")
+    meta = data.get("metadata")
+    return (
+        data["timestamp"],
+        data["event_type"],
+        data["message"],
+        None if meta is None else json.dumps(meta),
+    )
+
+
+def _json_line(row: Row) -> str:
+    """Serialise ``row`` exactly like ``json.dumps(asdict(entry))``."""
+    ts, event_type, message, meta = row
+    return '{"timestamp": %s, "event_type": %s, "message": %s, "metadata": %s}' % (
+        json.dumps(ts),
+        json.dumps(event_type),
+        json.dumps(message),
+        "null" if meta is None else meta,
+    )
+
+
+class _Columns:
+    """Parallel lists holding log entries column by column.
+
+    Event types come from a small fixed set and are interned; messages are
+    free text and kept as they are. Metadata is kept as its compact JSON
+    text instead of a dict per entry.
+    """
+
+    __slots__ = ("timestamps", "event_types", "messages", "metadata")
+
+    def __init__(self) -> None:
+        self.timestamps: List[str] = []
+        self.event_types: List[str] = []
+        self.messages: List[str] = []
+        self.metadata: List[Optional[str]] = []
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def append(self, row: Row) -> None:
+        self.timestamps.append(row[0])
+        self.event_types.append(sys.intern(row[1]))
+        self.messages.append(row[2])
+        self.metadata.append(row[3])
+
+    def set(self, index: int, row: Row) -> None:
+        self.timestamps[index] = row[0]
+        self.event_types[index] = sys.intern(row[1])
+        self.messages[index] = row[2]
+        self.metadata[index] = row[3]
+
+    def row(self, index: int) -> Row:
+        return (
+            self.timestamps[index],
+            self.event_types[index],
+            self.messages[index],
+            self.metadata[index],
+        )
+
+    def rows(self, start: int = 0) -> List[Row]:
+        """Return the rows from ``start`` followed by those before it."""
+        cols = (self.timestamps, self.event_types, self.messages, self.metadata)
+        return list(zip(*(c[start:] + c[:start] for c in cols)))
+
+
+class LogWindow(Sequence[LogEntry]):
+    """Bounded in-memory window over a logger's full history.
+
+    The newest ``capacity`` entries are kept in memory in a columnar ring
+    (see :class:`_Columns`). Older entries are read back on demand from the
+    JSON-lines file they were appended to, so memory use stays flat no
+    matter how long the logger runs. A byte offset is remembered for every
+    ``checkpoint_every`` th spilled entry, which bounds the scan needed to
+    reach any index.
+
+    Entries loaded with :meth:`EventLogger.load_log_json` or
+    :meth:`EventLogger.load_log_csv` do not come from the log file and are
+    kept in memory in full.
+
+    The window behaves like a read-only list of :class:`LogEntry`: it
+    supports ``len``, indexing, slicing, iteration and comparison with
+    lists. Entries are materialised only when accessed; exporters use
+    :meth:`iter_rows` and :meth:`columns` instead.
+    """
+
+    def __init__(
+        self,
+        file_path: Path,
+        *,
+        capacity: int = 10_000,
+        checkpoint_every: int = 1024,
+        flush: Any = None,
+        reader: Optional[Callable[[int], Iterator[bytes]]] = None,
+    ) -> None:
+        self.file_path = file_path
+        self.capacity = max(1, capacity)
+        self.checkpoint_every = max(1, checkpoint_every)
+        self._flush = flush
+        self._reader = reader or self._read_file
+        self._loaded = _Columns()
+        self._ring = _Columns()
+        self._offsets: List[int] = []
+        self._start = 0
+        # Entries are numbered in append order; _first is the oldest one
+        # still readable from disk
+        self._next = 0
+        self._first = 0
+        self._cp_index: List[int] = []
+        self._cp_offset: List[int] = []
+        self._lock = threading.Lock()
+
+    # Mutation (used by EventLogger) -----------------------------------
+    def append(self, row: Row, offset: int) -> None:
+        """Add ``row`` whose JSON line starts at byte ``offset``."""
+        with self._lock:
+            index = self._next
+            self._next += 1
+            if len(self._ring) < self.capacity:
+                self._ring.append(row)
+                self._offsets.append(offset)
+                return
+            pos = self._start
+            evicted = index - self.capacity
+            if evicted >= self._first and (
+                evicted % self.checkpoint_every == 0 or evicted == self._first
+            ):
+                self._cp_index.append(evicted)
+                self._cp_offset.append(self._offsets[pos])
+            self._ring.set(pos, row)
+            self._offsets[pos] = offset
+            self._start = (pos + 1) % self.capacity
+
+    def reset(self, loaded: Iterable[Row] = ()) -> None:
+        """Forget the history and keep ``loaded`` rows in memory instead."""
+        columns = _Columns()
+        for row in loaded:
+            columns.append(row)
+        with self._lock:
+            self._loaded = columns
+            self._ring = _Columns()
+            self._offsets = []
+            self._start = 0
+            self._first = self._next
+            self._cp_index = []
+            self._cp_offset = []
+
+    def forget_before(self, index: int, offset: int) -> None:
+        """Drop spilled entries numbered below ``index``.
+
+        Called when the log segment holding them is deleted. ``offset`` is
+        the position of entry ``index`` in the log.
+        """
+        with self._lock:
+            index = min(index, self._next - len(self._ring))
+            if index <= self._first:
+                return
+            self._first = index
+            keep = bisect.bisect_left(self._cp_index, index)
+            self._cp_index = self._cp_index[keep:]
+            self._cp_offset = self._cp_offset[keep:]
+            if not self._cp_index or self._cp_index[0] != index:
+                self._cp_index.insert(0, index)
+                self._cp_offset.insert(0, offset)
+
+    # Sequence API -----------------------------------------------------
+    @property
+    def _spilled(self) -> int:
+        return self._next - len(self._ring) - self._first
+
+    def __len__(self) -> int:
+        return len(self._loaded) + self._spilled + len(self._ring)
+
+    @property
+    def spilled(self) -> int:
+        """Number of entries only available from the log file."""
+        return self._spilled
+
+    def _read_file(self, offset: int) -> Iterator[bytes]:
+        with self.file_path.open("rb") as fh:
+            fh.seek(offset)
+            yield from fh
+
+    def _read_spilled(self, start: int, stop: int) -> Iterator[Row]:
+        """Yield spilled rows ``start`` to ``stop`` from the log file."""
+        if start >= stop:
+            return
+        if self._flush is not None:
+            self._flush()
+        with self._lock:
+            index = self._first + start
+            cp = bisect.bisect_right(self._cp_index, index) - 1
+            skip = index - self._cp_index[cp]
+            offset = self._cp_offset[cp]
+        lines = self._reader(offset)
+        try:
+            for _ in range(skip):
+                next(lines)
+            for _ in range(stop - start):
+                yield _row(json.loads(next(lines)))
+        except StopIteration:
+            raise IndexError("log file is shorter than the log window") from None
+        finally:
+            close = getattr(lines, "close", None)
+            if close is not None:
+                close()
+
+    def __getitem__(self, index):  # type: ignore[override]
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        with self._lock:
+            n = len(self)
+            if index < 0:
+                index += n
+            if not 0 <= index < n:
+                raise IndexError("log index out of range")
+            if index < len(self._loaded):
+                return entry_from_row(self._loaded.row(index))
+            index -= len(self._loaded)
+            if index >= self._spilled:
+                pos = (self._start + index - self._spilled) % len(self._ring)
+                return entry_from_row(self._ring.row(pos))
+        return entry_from_row(next(self._read_spilled(index, index + 1)))
+
+    def iter_rows(self) -> Iterator[Row]:
+        """Yield every entry as a ``(timestamp, event_type, message,
+        metadata_json)`` tuple, oldest first."""
+        with self._lock:
+            loaded = self._loaded.rows()
+            spilled = self._spilled
+            recent = self._ring.rows(self._start)
+        yield from loaded
+        yield from self._read_spilled(0, spilled)
+        yield from recent
+
+    def __iter__(self) -> Iterator[LogEntry]:
+        return map(entry_from_row, self.iter_rows())
+
+    def columns(self) -> Dict[str, List[Any]]:
+        """Return the full history as one list per field.
+
+        ``metadata`` holds compact JSON text, or ``None`` for no metadata.
+        """
+        out: Dict[str, List[Any]] = {name: [] for name in FIELDS}
+        cols = [out[name] for name in FIELDS]
+        with self._lock:
+            loaded, ring, start, spilled = self._loaded, self._ring, self._start, self._spilled
+            parts = [
+                (loaded.timestamps, loaded.event_types, loaded.messages, loaded.metadata),
+                tuple(
+                    c[start:] + c[:start]
+                    for c in (ring.timestamps, ring.event_types, ring.messages, ring.metadata)
+                ),
+            ]
+        for col, values in zip(cols, parts[0]):
+            col.extend(values)
+        for row in self._read_spilled(0, spilled):
+            for col, value in zip(cols, row):
+                col.append(value)
+        for col, values in zip(cols, parts[1]):
+            col.extend(values)
+        return out
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (LogWindow, list, tuple)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"LogWindow({len(self)} entries, {self._spilled} on disk)"
+
+
+@dataclass(frozen=True)
+class _RotateTo:
+    """Queued marker: rotate the live file to ``target`` at this point."""
+
+    target: Path
+
+
+# Buffered loggers still open at interpreter exit are flushed by _close_all
+_open_loggers: "weakref.WeakSet[EventLogger]" = weakref.WeakSet()
+
+
+@atexit.register
+def _close_all() -> None:
+    for logger in list(_open_loggers):
+        logger.close()
+
+
 class EventLogger:
     """Store log events in memory and append them to a file.
 
@@ -39,13 +407,77 @@ class EventLogger:
     ----------
     file_path : str or Path
         Path to the file where events are appended.
+    buffered : bool, optional
+        Queue events and append them from a background thread in batches.
+        Defaults to ``False``, which writes every event before
+        :meth:`log_event` returns.
+    flush_interval : float, optional
+        In buffered mode, maximum seconds an event waits in the queue.
+        Defaults to ``1.0``.
+    batch_size : int, optional
+        In buffered mode, number of queued events that triggers a write
+        before ``flush_interval`` expires. Defaults to ``256``.
+    max_entries : int, optional
+        Number of recent events kept in memory in :attr:`logs`. Older
+        events are read back from ``file_path`` when accessed. Defaults to
+        ``10000``.
+    rotation : RotationPolicy, optional
+        Start a new log segment by size, day or shift, compress rotated
+        segments in the background and prune them. :attr:`logs` and
+        :meth:`segments` span all retained segments. See :mod:`log_rotation`.
+    store : EventStore, optional
+        Also write every event to this indexed SQLite store, which answers
+        :meth:`query`. See :mod:`event_store`.
     """
 
-    def __init__(self, file_path: str | Path) -> None:
+    def __init__(
+        self,
+        file_path: str | Path,
+        *,
+        buffered: bool = False,
+        flush_interval: float = 1.0,
+        batch_size: int = 256,
+        max_entries: int = 10_000,
+        rotation: RotationPolicy | None = None,
+        store: EventStore | None = None,
+    ) -> None:
         self.file_path = Path(file_path)
-        self.logs: List[LogEntry] = []
         self.file_path.parent.mkdir(parents=True, exist_ok=True)
         self.file_path.touch(exist_ok=True)
+        self.logs = LogWindow(
+            self.file_path, capacity=max_entries, flush=self.flush, reader=self._read_from
+        )
+        self.rotation = rotation
+        self.store = store
+        stat = self.file_path.stat()
+        # Logical byte offset at which the next event will be appended. It
+        # keeps growing across rotations; _segments maps it back to files.
+        self._end_offset = stat.st_size
+        self._entries = 0
+        # (start offset, first entry number, path) of every segment written
+        # by this logger; the live file is last
+        self._segments: List[Tuple[int, int, Path]] = [(0, 0, self.file_path)]
+        self._segment_started = (
+            datetime.fromtimestamp(stat.st_mtime) if stat.st_size else datetime.now()
+        )
+        self._last_segment: Path | None = None
+        self._compressor: ThreadPoolExecutor | None = None
+        self._log_lock = threading.Lock()
+        self.buffered = buffered
+        self.flush_interval = flush_interval
+        self.batch_size = max(1, batch_size)
+        self._queue: "queue.Queue[Union[Tuple[str, Row], _RotateTo]]" = queue.Queue()
+        self._wake = threading.Event()
+        self._closing = threading.Event()
+        self._lock = threading.Lock()
+        self._fh: TextIO | None = None
+        self._thread: threading.Thread | None = None
+
+    def __enter__(self) -> "EventLogger":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
 
     def log_event(
         self,
@@ -64,53 +496,261 @@ class EventLogger:
         metadata : dict, optional
             Extra metadata associated with the event.
         """
-        entry = LogEntry(
-            timestamp=datetime.now().isoformat(timespec="seconds"),
-            event_type=event_type,
-            message=message,
-            metadata=metadata,
+        now = datetime.now()
+        row: Row = (
+            now.isoformat(timespec="seconds"),
+            event_type,
+            message,
+            None if metadata is None else json.dumps(metadata),
         )
-        self.logs.append(entry)
-        with self.file_path.open("a", encoding="utf-8") as f:
-            f.write(json.dumps(asdict(entry)) + "\n")
+        line = _json_line(row) + "\n"
+        size = len(line.encode("utf-8"))
+        with self._log_lock:
+            if self.rotation is not None and self.rotation.should_rotate(
+                self._end_offset - self._segments[-1][0], size, self._segment_started, now
+            ):
+                self._rotate(now)
+            self.logs.append(row, self._end_offset)
+            self._end_offset += size
+            self._entries += 1
+            if not self.buffered:
+                self._write_lines([line])
+                self._store_rows([row])
+                return
+            self._start()
+            self._queue.put((line, row))
+        if self._queue.qsize() >= self.batch_size:
+            self._wake.set()
+
+    def flush(self) -> None:
+        """Block until every queued event has been written."""
+        if self._thread is None:
+            return
+        self._wake.set()
+        self._queue.join()
+
+    def close(self) -> None:
+        """Write queued events, stop the background writer and wait for
+        pending segment compression."""
+        thread = self._thread
+        if thread is not None:
+            self._closing.set()
+            self._wake.set()
+            thread.join()
+            self._thread = None
+            self._closing.clear()
+        if self._compressor is not None:
+            self._compressor.shutdown(wait=True)
+            self._compressor = None
+        _open_loggers.discard(self)
+
+    def query(self, **filters: Any) -> Iterator[LogEntry]:
+        """Yield events from :attr:`store` matching ``filters``.
+
+        Takes the keyword arguments of :meth:`event_store.EventStore.query`,
+        e.g. ``since``, ``until``, ``event_type`` and ``serial``. Queued
+        events are flushed first.
+        """
+        if self.store is None:
+            raise RuntimeError("EventLogger has no event store")
+        self.flush()
+        return self.store.query(**filters)
+
+    def segments(self) -> List[Path]:
+        """Return every segment of the log on disk, oldest first.
+
+        Includes segments rotated by earlier runs; the live file is last.
+        """
+        self.flush()
+        return list_segments(self.file_path)
+
+    # Rotation ---------------------------------------------------------
+    def _rotate(self, now: datetime) -> None:
+        """Start a new segment before the next line. Holds ``_log_lock``."""
+        taken = [path for _, _, path in self._segments[:-1]]
+        if self._last_segment is not None:
+            taken.append(self._last_segment)
+        target = segment_path(self.file_path, now, taken=taken)
+        self._last_segment = target
+        start, first, _ = self._segments[-1]
+        self._segments[-1] = (start, first, target)
+        self._segments.append((self._end_offset, self._entries, self.file_path))
+        self._segment_started = now
+        if self.buffered:
+            self._start()
+            self._queue.put(_RotateTo(target))
+        else:
+            self._rotate_file(target)
+
+    def _rotate_file(self, target: Path) -> None:
+        """Move the live file to ``target`` and start an empty one."""
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+        try:
+            os.replace(self.file_path, target)
+            self.file_path.touch()
+        except OSError as exc:
+            logging.error("Failed to rotate %s: %s", self.file_path, exc)
+            return
+        if self._compressor is None:
+            self._compressor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="log-compress")
+            _open_loggers.add(self)
+        self._compressor.submit(self._finish_segment, target)
+
+    def _finish_segment(self, target: Path) -> None:
+        """Compress ``target`` and apply retention (compression thread)."""
+        policy = self.rotation
+        if policy is None:  # pragma: no cover - rotation always set here
+            return
+        # Retention run by an earlier job may already have deleted target
+        if policy.compression is not None and target.exists():
+            try:
+                compress_segment(target, policy.compression)
+            except OSError as exc:
+                logging.error("Failed to compress %s: %s", target, exc)
+        expired = expired_segments(self.file_path, policy)
+        if not expired:
+            return
+        # Forget the entries first so that readers stop asking for them
+        # before their files disappear
+        gone = {p.with_name(strip_compression(p.name)) for p in expired}
+        with self._log_lock:
+            while len(self._segments) > 1 and (
+                self._segments[0][2] in gone or not segment_exists(self._segments[0][2])
+            ):
+                self._segments.pop(0)
+            start, first, _ = self._segments[0]
+        self.logs.forget_before(first, start)
+        remove_segments(expired)
+
+    def _read_from(self, offset: int) -> Iterator[bytes]:
+        """Yield log lines from logical ``offset`` on, across segments."""
+        with self._log_lock:
+            segments = list(self._segments)
+        starts = [start for start, _, _ in segments]
+        i = max(0, bisect.bisect_right(starts, offset) - 1)
+        for start, _, path in segments[i:]:
+            with open_segment(path, "rb") as fh:
+                if offset > start:
+                    fh.seek(offset - start)
+                yield from fh
+
+    # Writer -----------------------------------------------------------
+    def _start(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="event-logger", daemon=True
+                )
+                self._thread.start()
+                _open_loggers.add(self)
+
+    def _write_lines(self, lines: List[str]) -> None:
+        if self.buffered:
+            if self._fh is None:
+                self._fh = self.file_path.open("a", encoding="utf-8", newline="")
+            self._fh.write("".join(lines))
+            self._fh.flush()
+        else:
+            with self.file_path.open("a", encoding="utf-8", newline="") as f:
+                f.write("".join(lines))
+
+    def _store_rows(self, rows: List[Row]) -> None:
+        if self.store is None:
+            return
+        try:
+            self.store.add_many(rows)
+        except sqlite3.Error as exc:
+            logging.error("Failed to store %d events in %s: %s", len(rows), self.store.path, exc)
+
+    def _drain(self) -> None:
+        items: List[Union[Tuple[str, Row], _RotateTo]] = []
+        while True:
+            try:
+                items.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        lines: List[str] = []
+        rows: List[Row] = []
+        try:
+            for item in items + [None]:
+                if isinstance(item, tuple):
+                    lines.append(item[0])
+                    rows.append(item[1])
+                    continue
+                if lines:
+                    try:
+                        self._write_lines(lines)
+                    except OSError as exc:
+                        logging.error(
+                            "Failed to write %d events to %s: %s", len(lines), self.file_path, exc
+                        )
+                    self._store_rows(rows)
+                    lines, rows = [], []
+                if isinstance(item, _RotateTo):
+                    self._rotate_file(item.target)
+        finally:
+            for _ in items:
+                self._queue.task_done()
+
+    def _run(self) -> None:
+        try:
+            while not self._closing.is_set():
+                self._wake.wait(self.flush_interval)
+                self._wake.clear()
+                self._drain()
+            self._drain()
+        finally:
+            if self._fh is not None:
+                self._fh.close()
+                self._fh = None
 
     def save_log_json(self, path: str | Path) -> None:
-        """Write all stored logs to ``path`` in JSON format."""
+        """Write all stored logs to ``path`` in JSON format.
+
+        Entries are streamed row by row from :meth:`LogWindow.iter_rows`, so
+        spilled history is never loaded into memory at once and metadata is
+        copied as JSON text without being decoded.
+        """
         file = Path(path)
         with file.open("w", encoding="utf-8") as fh:
-            json.dump([asdict(e) for e in self.logs], fh, indent=2)
+            sep = "[\n  "
+            for row in self.logs.iter_rows():
+                fh.write(sep)
+                fh.write(_json_line(row))
+                sep = ",\n  "
+            fh.write("[]" if sep == "[\n  " else "\n]")
 
     def load_log_json(self, path: str | Path) -> None:
         """Load log entries from a JSON file into memory.
 
-        Missing or invalid files result in an empty log list.
+        The file is streamed with :func:`iter_rows`, so a JSON array or
+        JSON lines are both accepted. Missing or invalid files result in an
+        empty log list.
         """
         file = Path(path)
         if not file.is_file():
-            self.logs = []
+            self.logs.reset()
             return
         try:
-            with file.open("r", encoding="utf-8") as fh:
-                data = json.load(fh)
-            self.logs = [LogEntry(**d) for d in data]
-        except (json.JSONDecodeError, TypeError, KeyError):
-            self.logs = []
+            fmt = "array" if _sniff(file) == "array" else "lines"
+            self.logs.reset(iter_rows(file, fmt=fmt))
+        except (ValueError, TypeError, KeyError):
+            self.logs.reset()
 
     def save_log_csv(self, path: str | Path) -> None:
         """Write all stored logs to ``path`` in CSV format."""
         file = Path(path)
         with file.open("w", newline="", encoding="utf-8") as fh:
-            writer = csv.DictWriter(
-                fh,
-                fieldnames=["timestamp", "event_type", "message", "metadata"],
+            writer = csv.writer(fh)
+            writer.writerow(FIELDS)
+            writer.writerows(
+                (ts, event_type, message, meta or "")
+                for ts, event_type, message, meta in self.logs.iter_rows()
             )
-            writer.writeheader()
-            for entry in self.logs:
-                row = asdict(entry)
-                row["metadata"] = (
-                    json.dumps(row["metadata"]) if row["metadata"] is not None else ""
-                )
-                writer.writerow(row)
 
     def load_log_csv(self, path: str | Path) -> None:
         """Load log entries from a CSV file.
@@ -119,34 +759,21 @@ class EventLogger:
         """
         file = Path(path)
         if not file.is_file():
-            self.logs = []
+            self.logs.reset()
             return
         try:
-            with file.open("r", newline="", encoding="utf-8") as fh:
-                reader = csv.DictReader(fh)
-                logs = []
-                for row in reader:
-                    meta = row.get("metadata") or "null"
-                    logs.append(
-                        LogEntry(
-                            timestamp=row.get("timestamp", ""),
-                            event_type=row.get("event_type", ""),
-                            message=row.get("message", ""),
-                            metadata=json.loads(meta),
-                        )
-                    )
-            self.logs = logs
-        except (csv.Error, json.JSONDecodeError, TypeError, KeyError):
-            self.logs = []
+            self.logs.reset(iter_rows(file, fmt="csv"))
+        except (csv.Error, ValueError, TypeError, KeyError):
+            self.logs.reset()
 
 
-def logs_to_dataframe(logs: List[LogEntry], *, as_html: bool = False):
+def logs_to_dataframe(logs: Iterable[LogEntry], *, as_html: bool = False):
     """Return a pandas DataFrame or HTML table for ``logs``.
 
     Parameters
     ----------
-    logs : list[LogEntry]
-        List of log entries to convert.
+    logs : iterable of LogEntry
+        Log entries to convert, e.g. a list or :attr:`EventLogger.logs`.
     as_html : bool, optional
         When ``True`` return an HTML table string instead of a
         :class:`pandas.DataFrame`.
@@ -163,7 +790,321 @@ def logs_to_dataframe(logs: List[LogEntry], *, as_html: bool = False):
     except Exception as exc:  # pragma: no cover - optional dependency
         raise ImportError("pandas is required for logs_to_dataframe") from exc
 
-    df = pd.DataFrame([asdict(e) for e in logs])
+    if isinstance(logs, LogWindow):
+        columns = logs.columns()
+        columns["metadata"] = [None if m is None else json.loads(m) for m in columns["metadata"]]
+    else:
+        columns = {name: [] for name in FIELDS}
+        for entry in logs:
+            for name in FIELDS:
+                columns[name].append(getattr(entry, name))
+    df = pd.DataFrame(columns, columns=list(FIELDS))
     if as_html:
         return df.to_html(index=False)
     return df
+
+
+# Streaming readers -------------------------------------------------------
+_CHUNK_SIZE = 1024 * 1024
+_TS_PREFIX = b'{"timestamp": "'
+_COMPRESSED = tuple(ext for ext, _ in COMPRESSORS.values())
+_BLANK = " \t\r\n\ufeff"
+
+
+class _Filter:
+    """Filters of :func:`iter_events`, checked as early as possible."""
+
+    def __init__(
+        self,
+        since: datetime | str | None,
+        until: datetime | str | None,
+        event_type: str | None,
+    ) -> None:
+        self.since = _iso(since)
+        self.until = _iso(until)
+        self.event_type = event_type
+        # The quoted event type appears verbatim in every line that has it,
+        # so other lines are skipped without decoding them
+        self.needle = None
+        if event_type is not None and event_type.isascii():
+            self.needle = json.dumps(event_type).encode()
+
+    def __bool__(self) -> bool:
+        return any(v is not None for v in (self.since, self.until, self.event_type))
+
+    def match(self, timestamp: str, event_type: str | None = None) -> bool:
+        if self.since is not None and timestamp < self.since:
+            return False
+        if self.until is not None and timestamp >= self.until:
+            return False
+        return self.event_type is None or event_type is None or event_type == self.event_type
+
+    def match_line(self, line: bytes) -> bool:
+        """Cheap check of a raw JSON line; ``False`` only if it cannot match."""
+        if self.needle is not None and self.needle not in line:
+            return False
+        if (self.since is not None or self.until is not None) and line.startswith(_TS_PREFIX):
+            end = line.find(b'"', len(_TS_PREFIX))
+            if end > 0:
+                return self.match(line[len(_TS_PREFIX) : end].decode("utf-8", "replace"))
+        return True
+
+
+def _iso(value: datetime | str | None) -> Optional[str]:
+    if isinstance(value, datetime):
+        return value.isoformat(timespec="seconds")
+    return value
+
+
+def _sniff(path: Path) -> str:
+    """Return ``"csv"``, ``"array"`` or ``"lines"`` for the log at ``path``."""
+    if strip_compression(path.name).endswith(".csv"):
+        return "csv"
+    with open_segment(path, "rb") as fh:
+        head = fh.read(4096).lstrip(b"\xef\xbb\xbf \t\r\n")
+    return "array" if head.startswith(b"[") else "lines"
+
+
+def _read_lines(path: Path, chunk_size: int, use_mmap: bool) -> Iterator[bytes]:
+    """Yield the lines of ``path`` without their newlines."""
+    if use_mmap and not path.name.endswith(_COMPRESSED) and path.exists():
+        with path.open("rb") as fh:
+            size = os.fstat(fh.fileno()).st_size
+            if not size:
+                return
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                start = 0
+                while start < size:
+                    end = mm.find(b"\n", start)
+                    if end < 0:
+                        end = size
+                    yield mm[start:end]
+                    start = end + 1
+        return
+    with open_segment(path, "rb") as fh:
+        rest = b""
+        while True:
+            chunk = fh.read(chunk_size)
+            if not chunk:
+                break
+            lines = (rest + chunk).split(b"\n")
+            rest = lines.pop()
+            yield from lines
+        if rest:
+            yield rest
+
+
+def _reversed_lines(path: Path, chunk_size: int) -> Iterator[bytes]:
+    """Yield the lines of an uncompressed ``path`` newest first."""
+    with path.open("rb") as fh:
+        pos = fh.seek(0, os.SEEK_END)
+        rest = b""
+        while pos > 0:
+            step = min(chunk_size, pos)
+            pos -= step
+            fh.seek(pos)
+            lines = (fh.read(step) + rest).split(b"\n")
+            rest = lines.pop(0)
+            yield from reversed(lines)
+        yield rest
+
+
+def _array_items(path: Path, chunk_size: int) -> Iterator[Any]:
+    """Yield the items of a JSON array, decoding one chunk at a time."""
+    decoder = json.JSONDecoder()
+    with open_segment(path, "rt") as fh:
+        buf, pos, eof = "", 0, False
+        state = "start"
+        while True:
+            while pos < len(buf) and buf[pos] in _BLANK:
+                pos += 1
+            if pos == len(buf):
+                if eof:
+                    raise ValueError(f"{path} is not a complete JSON array")
+                buf, pos = fh.read(chunk_size), 0
+                eof = not buf
+                continue
+            ch = buf[pos]
+            if state == "start":
+                if ch != "[":
+                    raise ValueError(f"{path} is not a JSON array")
+                pos += 1
+                state = "first"
+            elif ch == "]" and state in ("first", "next"):
+                return
+            elif state == "next":
+                if ch != ",":
+                    raise ValueError(f"expected ',' in {path}")
+                pos += 1
+                state = "item"
+            else:
+                try:
+                    item, end = decoder.raw_decode(buf, pos)
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+                    more = fh.read(chunk_size)
+                    eof = not more
+                    buf, pos = buf[pos:] + more, 0
+                    continue
+                yield item
+                pos = end
+                state = "next"
+
+
+def _csv_rows(path: Path, flt: _Filter) -> Iterator[Row]:
+    with open_segment(path, "rt") as fh:
+        for record in csv.DictReader(fh):
+            timestamp = record.get("timestamp") or ""
+            event_type = record.get("event_type") or ""
+            if flt and not flt.match(timestamp, event_type):
+                continue
+            yield _row(
+                {
+                    "timestamp": timestamp,
+                    "event_type": event_type,
+                    "message": record.get("message") or "",
+                    "metadata": json.loads(record.get("metadata") or "null"),
+                }
+            )
+
+
+def _segment_rows(
+    path: Path, fmt: str, flt: _Filter, chunk_size: int, use_mmap: bool
+) -> Iterator[Row]:
+    if fmt == "csv":
+        yield from _csv_rows(path, flt)
+        return
+    if fmt == "array":
+        items: Iterator[Dict[str, Any]] = _array_items(path, chunk_size)
+    else:
+        items = (
+            json.loads(line)
+            for line in _read_lines(path, chunk_size, use_mmap)
+            if line.strip() and (not flt or flt.match_line(line))
+        )
+    for item in items:
+        row = _row(item)
+        if not flt or flt.match(row[0], row[1]):
+            yield row
+
+
+def iter_rows(
+    path: str | Path,
+    *,
+    since: datetime | str | None = None,
+    until: datetime | str | None = None,
+    event_type: str | None = None,
+    fmt: str | None = None,
+    use_mmap: bool = False,
+    chunk_size: int = _CHUNK_SIZE,
+) -> Iterator[Row]:
+    """Like :func:`iter_events` but yield ``(timestamp, event_type, message,
+    metadata_json)`` tuples, without decoding metadata into dicts. Convert
+    them with :func:`entry_from_row` when needed."""
+    path = Path(path)
+    flt = _Filter(since, until, event_type)
+    for segment in list_segments(path):
+        rotated = _iso(segment_time(segment))
+        # every entry of a rotated segment predates its rotation time
+        if rotated is not None and flt.since is not None and rotated < flt.since:
+            continue
+        yield from _segment_rows(segment, fmt or _sniff(segment), flt, chunk_size, use_mmap)
+        # and every entry of the following segments comes after it
+        if rotated is not None and flt.until is not None and rotated >= flt.until:
+            break
+
+
+def iter_events(
+    path: str | Path,
+    *,
+    since: datetime | str | None = None,
+    until: datetime | str | None = None,
+    event_type: str | None = None,
+    where: Callable[[LogEntry], bool] | None = None,
+    fmt: str | None = None,
+    use_mmap: bool = False,
+    chunk_size: int = _CHUNK_SIZE,
+) -> Iterator[LogEntry]:
+    """Yield the events of a log file one at a time, oldest first.
+
+    Reads the JSON-lines log written by :class:`EventLogger`, JSON arrays
+    written by :meth:`EventLogger.save_log_json` and CSV files written by
+    :meth:`EventLogger.save_log_csv` in chunks, so memory use does not grow
+    with the file. Rotated segments of ``path`` (see :mod:`log_rotation`)
+    are read first, including compressed ones.
+
+    Parameters
+    ----------
+    path : str or Path
+        Log file to read.
+    since, until : datetime or str, optional
+        Time range; ``since`` is inclusive and ``until`` exclusive. Rotated
+        segments outside the range are not opened and JSON lines outside it
+        are skipped without being decoded.
+    event_type : str, optional
+        Only yield events of this type. JSON lines without it are skipped
+        without being decoded.
+    where : callable, optional
+        Further predicate applied to each decoded :class:`LogEntry`.
+    fmt : str, optional
+        ``"lines"``, ``"array"`` or ``"csv"``. Detected from the file name
+        and first bytes by default.
+    use_mmap : bool, optional
+        Memory-map uncompressed JSON-lines files instead of reading them in
+        chunks. Defaults to ``False``.
+    chunk_size : int, optional
+        Bytes read at a time. Defaults to 1 MiB.
+
+    Raises
+    ------
+    TypeError
+        If an item of a JSON array or a JSON line is not an object.
+    """
+    entries = map(
+        entry_from_row,
+        iter_rows(
+            path,
+            since=since,
+            until=until,
+            event_type=event_type,
+            fmt=fmt,
+            use_mmap=use_mmap,
+            chunk_size=chunk_size,
+        ),
+    )
+    if where is None:
+        return entries
+    return filter(where, entries)
+
+
+def tail(path: str | Path, n: int = 10, *, chunk_size: int = 64 * 1024) -> List[LogEntry]:
+    """Return the last ``n`` events of a log, oldest first.
+
+    Uncompressed JSON-lines files are read backwards from the end, so the
+    cost depends on ``n`` rather than the file size. Earlier segments are
+    only opened when the newest ones hold fewer than ``n`` events.
+    Compressed segments, JSON arrays and CSV files are streamed from the
+    start. Raises :class:`TypeError` for items that are not JSON objects.
+    """
+    if n <= 0:
+        return []
+    rows: List[Row] = []
+    for segment in reversed(list_segments(Path(path))):
+        need = n - len(rows)
+        fmt = _sniff(segment)
+        if fmt == "lines" and not segment.name.endswith(_COMPRESSED):
+            found: List[Row] = []
+            for line in _reversed_lines(segment, chunk_size):
+                if line.strip():
+                    found.append(_row(json.loads(line)))
+                    if len(found) == need:
+                        break
+            found.reverse()
+        else:
+            rest = _segment_rows(segment, fmt, _Filter(None, None, None), chunk_size, False)
+            found = list(collections.deque(rest, maxlen=need))
+        rows[:0] = found
+        if len(rows) >= n:
+            break
+    return [entry_from_row(row) for row in rows]
@@ -0,0 +1,186 @@
+"""Indexed SQLite store for event log entries.
+
+:class:`EventStore` keeps events in an SQLite database in WAL mode, with
+indexes on the timestamp, the event type and the ``serial`` and ``model``
+metadata keys, so questions like "all NG events for serial X last week" are
+answered by an index lookup instead of loading and filtering the whole log.
+
+Pass a store to :class:`event_logger.EventLogger` to write every event to it
+alongside the JSON-lines file. Queries return iterators that read the
+database in chunks over their own connection, so large results never sit in
+memory at once and queries do not block the writer.
+
+Example
+-------
+>>> store = EventStore("logs/events.db")
+>>> logger = EventLogger("logs/events.txt", store=store)
+>>> logger.log_event("error", "NG", {"serial": "AB12", "model": "ModelA"})
+>>> for entry in store.query(since=datetime.now() - timedelta(days=7),
+...                          event_type="error", serial="AB12"):
+...     print(entry.timestamp, entry.message)
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Tuple
+import json
+import sqlite3
+import threading
+
+from event_logger import LogEntry, Row, entry_from_row
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY,
+    timestamp TEXT NOT NULL,
+    event_type TEXT NOT NULL,
+    message TEXT NOT NULL,
+    metadata TEXT,
+    serial TEXT,
+    model TEXT
+);
+CREATE INDEX IF NOT EXISTS events_timestamp ON events (timestamp);
+CREATE INDEX IF NOT EXISTS events_type ON events (event_type, timestamp);
+CREATE INDEX IF NOT EXISTS events_serial ON events (serial, timestamp);
+CREATE INDEX IF NOT EXISTS events_model ON events (model, timestamp);
+"""
+
+_INSERT = (
+    "INSERT INTO events (timestamp, event_type, message, metadata, serial, model)"
+    " VALUES (?, ?, ?, ?, ?, ?)"
+)
+
+
+def _record(row: Row) -> Tuple[str, str, str, Optional[str], Optional[str], Optional[str]]:
+    """Return ``row`` with its serial and model metadata split out."""
+    serial = model = None
+    if row[3] is not None:
+        meta = json.loads(row[3])
+        if isinstance(meta, dict):
+            serial, model = meta.get("serial"), meta.get("model")
+    return (*row, None if serial is None else str(serial), None if model is None else str(model))
+
+
+def _timestamp(value: datetime | str) -> str:
+    if isinstance(value, datetime):
+        return value.isoformat(timespec="seconds")
+    return value
+
+
+class EventStore:
+    """SQLite database of log events.
+
+    Parameters
+    ----------
+    path : str or Path
+        Database file. It is created with its parent directory if missing.
+    chunk_size : int, optional
+        Rows fetched per round trip while iterating query results.
+        Defaults to ``500``.
+    """
+
+    def __init__(self, path: str | Path, *, chunk_size: int = 500) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.chunk_size = max(1, chunk_size)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        # WAL with synchronous=NORMAL survives application crashes; only a
+        # power loss can drop the last commits
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+    def __enter__(self) -> "EventStore":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def add(self, row: Row) -> None:
+        """Store one ``(timestamp, event_type, message, metadata_json)`` row."""
+        self.add_many([row])
+
+    def add_many(self, rows: Iterable[Row]) -> int:
+        """Store ``rows`` in a single transaction and return how many.
+
+        ``EventLogger.logs.iter_rows()`` can be passed to import an existing
+        log.
+        """
+        records = map(_record, rows)
+        with self._lock, self._conn:
+            before = self._conn.total_changes
+            self._conn.executemany(_INSERT, records)
+            return self._conn.total_changes - before
+
+    def query(
+        self,
+        *,
+        since: datetime | str | None = None,
+        until: datetime | str | None = None,
+        event_type: str | None = None,
+        serial: str | None = None,
+        model: str | None = None,
+        limit: int | None = None,
+        newest_first: bool = False,
+    ) -> Iterator[LogEntry]:
+        """Yield the events matching every given filter.
+
+        Parameters
+        ----------
+        since, until : datetime or str, optional
+            Time range; ``since`` is inclusive and ``until`` exclusive.
+            Strings are ISO timestamps like those in the log.
+        event_type, serial, model : str, optional
+            Exact matches on the event type or the ``serial``/``model``
+            metadata keys.
+        limit : int, optional
+            Stop after this many events.
+        newest_first : bool, optional
+            Yield the newest events first. Defaults to oldest first.
+        """
+        clauses: List[str] = []
+        params: List[object] = []
+        for column, op, value in (
+            ("timestamp", ">=", since),
+            ("timestamp", "<", until),
+            ("event_type", "=", event_type),
+            ("serial", "=", serial),
+            ("model", "=", model),
+        ):
+            if value is not None:
+                clauses.append(f"{column} {op} ?")
+                params.append(_timestamp(value) if column == "timestamp" else value)
+        sql = "SELECT timestamp, event_type, message, metadata FROM events"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        order = "DESC" if newest_first else "ASC"
+        sql += f" ORDER BY timestamp {order}, id {order}"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return self._iter(sql, params)
+
+    def _iter(self, sql: str, params: List[object]) -> Iterator[LogEntry]:
+        # A separate read-only connection per query: WAL lets it read a
+        # consistent snapshot while the logger keeps writing
+        conn = sqlite3.connect(f"{self.path.resolve().as_uri()}?mode=ro", uri=True)
+        try:
+            cursor = conn.execute(sql, params)
+            while True:
+                rows = cursor.fetchmany(self.chunk_size)
+                if not rows:
+                    break
+                for row in rows:
+                    yield entry_from_row(row)
+        finally:
+            conn.close()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,108 @@
+"""In-memory ring buffer of recently captured camera frames."""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Deque, Iterator, List, Optional, Union
+import itertools
+import threading
+import time
+
+import numpy as np
+
+
+FrameData = Union[bytes, "np.ndarray"]
+
+
+@dataclass(frozen=True)
+class Frame:
+    """A single captured frame.
+
+    ``data`` holds either encoded image bytes (e.g. JPEG) or a raw NumPy
+    array. ``suffix`` is the file extension used when the frame is saved.
+    ``path`` is set when the encoded bytes also exist as a file, which lets
+    savers link or move that file instead of writing the bytes again.
+    ``owned`` is ``False`` when that file belongs to someone else, such as a
+    replay corpus; savers then never move or hard-link it.
+    """
+
+    data: FrameData
+    seq: int
+    timestamp: float
+    suffix: str = ".jpg"
+    path: Optional[Path] = None
+    owned: bool = True
+
+    @property
+    def is_array(self) -> bool:
+        return isinstance(self.data, np.ndarray)
+
+
+class FrameRing:
+    """Thread-safe ring holding the last ``capacity`` frames of a camera.
+
+    Parameters
+    ----------
+    capacity : int, optional
+        Number of frames retained. Older frames are dropped as new ones are
+        pushed. Defaults to ``8``.
+    """
+
+    def __init__(self, capacity: int = 8) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self._frames: Deque[Frame] = deque(maxlen=capacity)
+        self._seq = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def push(
+        self,
+        data: FrameData,
+        *,
+        suffix: str = ".jpg",
+        path: Optional[Path] = None,
+        owned: bool = True,
+    ) -> Frame:
+        """Store ``data`` as the newest frame and return it."""
+        with self._lock:
+            frame = Frame(
+                data=data,
+                seq=next(self._seq),
+                timestamp=time.time(),
+                suffix=suffix,
+                path=path,
+                owned=owned,
+            )
+            self._frames.append(frame)
+        return frame
+
+    def discard(self, frame: Frame) -> None:
+        """Drop ``frame`` from the ring if it is still buffered."""
+        with self._lock:
+            for i, buffered in enumerate(self._frames):
+                if buffered is frame:
+                    del self._frames[i]
+                    break
+
+    def latest(self) -> Optional[Frame]:
+        """Return the newest frame or ``None`` when the ring is empty."""
+        with self._lock:
+            return self._frames[-1] if self._frames else None
+
+    def snapshot(self) -> List[Frame]:
+        """Return the buffered frames, oldest first."""
+        with self._lock:
+            return list(self._frames)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._frames.clear()
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    def __iter__(self) -> Iterator[Frame]:
+        return iter(self.snapshot())
@@ -0,0 +1,235 @@
+"""Continuous frame streaming with a bounded, lossy queue.
+
+A :class:`FrameStream` repeatedly captures frames at a target rate on a
+background thread and hands them to a consumer through a bounded queue.
+When the consumer falls behind, frames are dropped according to the
+stream's policy instead of stalling the camera:
+
+``"drop-oldest"``
+    Discard the oldest queued frame to make room. The consumer always sees
+    the most recent frames (live view, monitoring).
+``"drop-newest"``
+    Discard the incoming frame. The consumer sees an uninterrupted run of
+    frames up to the point it fell behind (recording bursts).
+
+Example
+-------
+>>> with manager.stream(1, fps=15, maxsize=2) as stream:
+...     for frame in stream:
+...         show(frame)
+>>> async for frame in manager.stream(1, fps=15):
+...     await process(frame)
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import Future
+from typing import Callable, Deque, Dict, Optional
+import asyncio
+import logging
+import threading
+import time
+
+from frame_buffer import Frame
+
+
+DROP_POLICIES = ("drop-oldest", "drop-newest")
+
+# Delay between attempts while captures keep failing and no fps is set
+_ERROR_BACKOFF = 0.1
+
+# Default seconds close() waits for a capture in progress
+_CLOSE_TIMEOUT = 5.0
+
+
+class FrameStream:
+    """Capture frames continuously into a bounded queue.
+
+    Parameters
+    ----------
+    capture : Callable[[], Future]
+        Starts one capture and returns a future of the :class:`Frame`.
+        :meth:`CameraManager.stream` passes a function that submits to the
+        camera's pinned worker, so streaming never overlaps other work on
+        the same device.
+    fps : float, optional
+        Target capture rate. ``None`` captures as fast as the camera allows.
+    maxsize : int, optional
+        Number of frames buffered for the consumer. Defaults to ``4``.
+    policy : str, optional
+        ``"drop-oldest"`` (default) or ``"drop-newest"``.
+    on_frame : Callable[[Frame], object], optional
+        Called on the capture thread for every captured frame, dropped or
+        not.
+    name : str, optional
+        Name of the capture thread.
+    """
+
+    def __init__(
+        self,
+        capture: Callable[[], "Future[Frame]"],
+        *,
+        fps: float | None = None,
+        maxsize: int = 4,
+        policy: str = "drop-oldest",
+        on_frame: Callable[[Frame], object] | None = None,
+        name: str = "frame-stream",
+    ) -> None:
+        if policy not in DROP_POLICIES:
+            raise ValueError(f"Unknown drop policy: {policy}")
+        if fps is not None and fps <= 0:
+            raise ValueError("fps must be positive")
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.capture = capture
+        self.fps = fps
+        self.maxsize = maxsize
+        self.policy = policy
+        self.on_frame = on_frame
+        self.name = name
+        self._queue: Deque[Frame] = deque()
+        self._cond = threading.Condition()
+        self._stop = threading.Event()
+        self._captured = 0
+        self._delivered = 0
+        self._dropped = 0
+        self._errors = 0
+        self._thread: threading.Thread | None = None
+
+    def __enter__(self) -> "FrameStream":
+        self.start()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    # Lifecycle --------------------------------------------------------
+    def start(self) -> None:
+        """Start the capture thread."""
+        if self._thread is not None or self._stop.is_set():
+            return
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+
+    def close(self, timeout: float | None = _CLOSE_TIMEOUT) -> None:
+        """Stop capturing. Frames already queued can still be read.
+
+        Waits up to ``timeout`` seconds (``None`` waits forever) for a
+        capture in progress to finish. A capture thread still stuck on a
+        hung camera after that is logged and left to finish on its own.
+        """
+        self._stop.set()
+        with self._cond:
+            self._cond.notify_all()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+            if thread.is_alive():
+                logging.warning("Stream %s capture thread still running after close", self.name)
+
+    @property
+    def closed(self) -> bool:
+        return self._stop.is_set()
+
+    # Consumer API -----------------------------------------------------
+    def get(self, timeout: float | None = None) -> Optional[Frame]:
+        """Return the next frame.
+
+        Blocks until a frame is available. Returns ``None`` when ``timeout``
+        expires or the stream is closed and drained.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while not self._queue:
+                if self._stop.is_set():
+                    return None
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return None
+                self._cond.wait(remaining)
+            self._delivered += 1
+            return self._queue.popleft()
+
+    def __iter__(self) -> "FrameStream":
+        return self
+
+    def __next__(self) -> Frame:
+        frame = self.get()
+        if frame is None:
+            raise StopIteration
+        return frame
+
+    def __aiter__(self) -> "FrameStream":
+        return self
+
+    async def __anext__(self) -> Frame:
+        # Short waits keep the helper thread responsive to cancellation
+        while True:
+            frame = await asyncio.to_thread(self.get, 0.1)
+            if frame is not None:
+                return frame
+            if self._stop.is_set() and not self._queue:
+                raise StopAsyncIteration
+
+    def stats(self) -> Dict[str, int]:
+        """Return capture, delivery and drop counters."""
+        with self._cond:
+            return {
+                "captured": self._captured,
+                "delivered": self._delivered,
+                "dropped": self._dropped,
+                "errors": self._errors,
+                "queued": len(self._queue),
+            }
+
+    @property
+    def dropped(self) -> int:
+        """Number of frames discarded because the consumer fell behind."""
+        return self._dropped
+
+    # Producer ---------------------------------------------------------
+    def _offer(self, frame: Frame) -> None:
+        with self._cond:
+            self._captured += 1
+            if len(self._queue) >= self.maxsize:
+                self._dropped += 1
+                if self.policy == "drop-newest":
+                    return
+                self._queue.popleft()
+            self._queue.append(frame)
+            self._cond.notify()
+
+    def _run(self) -> None:
+        period = 1.0 / self.fps if self.fps else 0.0
+        next_due = time.monotonic()
+        while not self._stop.is_set():
+            try:
+                frame = self.capture().result()
+            except Exception as exc:
+                if self._stop.is_set():
+                    break
+                logging.error("Stream %s capture failed: %s", self.name, exc)
+                with self._cond:
+                    self._errors += 1
+                self._stop.wait(max(period, _ERROR_BACKOFF))
+                next_due = time.monotonic()
+                continue
+            if self._stop.is_set():
+                break  # closed while capturing; the frame stays in the ring
+
+            if self.on_frame is not None:
+                try:
+                    self.on_frame(frame)
+                except Exception as exc:  # pragma: no cover - callback error
+                    logging.error("Stream %s frame callback failed: %s", self.name, exc)
+            self._offer(frame)
+
+            if period:
+                next_due += period
+                now = time.monotonic()
+                if next_due < now:  # fell behind; do not burst to catch up
+                    next_due = now
+                self._stop.wait(next_due - now)
+        with self._cond:
+            self._cond.notify_all()
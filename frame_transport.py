@@ -0,0 +1,238 @@
+"""Shared-memory frame transport between a capture process and the UI.
+
+A :class:`FrameTransport` is a ring of fixed-size slots in one
+:mod:`multiprocessing.shared_memory` block. The capture process publishes
+frames into the ring; any number of reader processes attach by name and map
+the newest frame without copying it.
+
+Memory layout
+-------------
+The block starts with a 32 byte header followed by ``slots`` slots. Each
+slot holds a 64 byte header and ``slot_size`` bytes of payload::
+
+    header: magic "VCFT", version u32, slots u32, pad u32,
+            slot_size u64, last_seq u64
+    slot:   seq_begin u64, seq_end u64, cam_id i32, kind u8, ndim u8,
+            dtype char[2], shape 4*u32, nbytes u64, timestamp f64
+
+A writer sets ``seq_begin`` before touching the payload and ``seq_end``
+after, so readers detect torn reads when the two differ. Views returned by
+:meth:`FrameTransport.latest` stay valid until the slot is reused
+``slots`` frames later; :meth:`TransportFrame.is_valid` reports whether
+that has happened.
+
+Example
+-------
+>>> transport = FrameTransport.create(slots=8, slot_size=1920 * 1080 * 3)
+>>> manager.attach_transport(transport)          # capture process
+>>> ui = FrameTransport.attach(transport.name)     # UI process
+>>> frame = ui.latest(cam_id=1)
+>>> QImage(frame.data, w, h, QImage.Format_RGB888)
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from multiprocessing import resource_tracker, shared_memory
+from typing import Optional, Set, Union
+import multiprocessing
+import struct
+import sys
+import threading
+import time
+
+import numpy as np
+
+
+_MAGIC = b"VCFT"
+_VERSION = 1
+_HEADER = struct.Struct("<4sIIIQQ")
+_SLOT_HEADER = struct.Struct("<QQiBB2s4IQd")
+_SLOT_HEADER_SIZE = 64
+_MAX_DIMS = 4
+
+_KIND_BYTES = 0
+_KIND_ARRAY = 1
+
+assert _HEADER.size == 32 and _SLOT_HEADER.size <= _SLOT_HEADER_SIZE
+
+# Names of the blocks created by this process; see _attach_untracked
+_created: Set[str] = set()
+
+
+def _attach_untracked(name: str) -> shared_memory.SharedMemory:
+    """Attach to block ``name`` without leaving it registered with the
+    resource tracker.
+
+    Every attach registers the block, and the tracker of an unrelated
+    reader process would unlink it on exit. Python 3.13 can skip the
+    registration; older versions register it and this drops it again.
+    The entry is kept when this process created the block, and in
+    multiprocessing children, which share their parent's tracker: there
+    the entry may be the creator's own, and dropping it would stop the
+    tracker from cleaning up after a crashed creator.
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    shm = shared_memory.SharedMemory(name=name)
+    if name not in _created and multiprocessing.parent_process() is None:
+        resource_tracker.unregister(shm._name, "shared_memory")
+    return shm
+
+
+@dataclass(frozen=True)
+class TransportFrame:
+    """Zero-copy view of a frame stored in a :class:`FrameTransport` slot."""
+
+    cam_id: int
+    seq: int
+    timestamp: float
+    data: Union[memoryview, "np.ndarray"]
+    _transport: "FrameTransport"
+    _slot: int
+
+    def is_valid(self) -> bool:
+        """Return ``True`` while the slot still holds this frame."""
+        begin, end = self._transport._slot_seqs(self._slot)
+        return begin == end == self.seq
+
+    def copy(self) -> Union[bytes, "np.ndarray"]:
+        """Return a private copy of the frame data."""
+        if isinstance(self.data, np.ndarray):
+            return self.data.copy()
+        return bytes(self.data)
+
+
+class FrameTransport:
+    """Ring of frame slots in a shared memory block.
+
+    Use :meth:`create` in the publishing process and :meth:`attach` in
+    readers. Only one process may publish.
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory, *, owner: bool) -> None:
+        self._shm = shm
+        self._owner = owner
+        self._lock = threading.Lock()
+        magic, version, slots, _, slot_size, _ = _HEADER.unpack_from(shm.buf, 0)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError(f"{shm.name} is not a frame transport block")
+        self.slots = slots
+        self.slot_size = slot_size
+
+    @classmethod
+    def create(
+        cls, *, slots: int = 8, slot_size: int = 1920 * 1080 * 3, name: str | None = None
+    ) -> "FrameTransport":
+        """Create a new transport with ``slots`` slots of ``slot_size`` bytes."""
+        if slots < 1 or slot_size < 1:
+            raise ValueError("slots and slot_size must be positive")
+        size = _HEADER.size + slots * (_SLOT_HEADER_SIZE + slot_size)
+        shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        _created.add(shm.name)
+        _HEADER.pack_into(shm.buf, 0, _MAGIC, _VERSION, slots, 0, slot_size, 0)
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> "FrameTransport":
+        """Attach to an existing transport created by another process."""
+        return cls(_attach_untracked(name), owner=False)
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    def close(self) -> None:
+        """Release this process's mapping.
+
+        All :class:`TransportFrame` views must be released first.
+        """
+        self._shm.close()
+
+    def unlink(self) -> None:
+        """Destroy the block. Only the creating process should call this."""
+        self._shm.unlink()
+        _created.discard(self._shm.name)
+
+    # Internal helpers -------------------------------------------------
+    def _slot_offset(self, slot: int) -> int:
+        return _HEADER.size + slot * (_SLOT_HEADER_SIZE + self.slot_size)
+
+    def _slot_seqs(self, slot: int) -> tuple[int, int]:
+        return struct.unpack_from("<QQ", self._shm.buf, self._slot_offset(slot))
+
+    def _last_seq(self) -> int:
+        return struct.unpack_from("<Q", self._shm.buf, 24)[0]
+
+    # Public API -------------------------------------------------------
+    def publish(
+        self,
+        cam_id: int,
+        data: Union[bytes, bytearray, memoryview, "np.ndarray"],
+        *,
+        timestamp: float | None = None,
+    ) -> int:
+        """Copy ``data`` into the next slot and return its sequence number."""
+        if isinstance(data, np.ndarray):
+            if data.ndim > _MAX_DIMS:
+                raise ValueError(f"arrays may have at most {_MAX_DIMS} dimensions")
+            array = np.ascontiguousarray(data)
+            kind, payload = _KIND_ARRAY, memoryview(array).cast("B")
+            dtype, shape = array.dtype.char.encode() + b"\0", array.shape
+        else:
+            kind, payload = _KIND_BYTES, memoryview(data).cast("B")
+            dtype, shape = b"\0\0", (payload.nbytes,)
+        if payload.nbytes > self.slot_size:
+            raise ValueError(f"frame of {payload.nbytes} bytes exceeds slot size {self.slot_size}")
+
+        with self._lock:
+            seq = self._last_seq() + 1
+            slot = (seq - 1) % self.slots
+            offset = self._slot_offset(slot)
+            buf = self._shm.buf
+            struct.pack_into("<Q", buf, offset, seq)  # seq_begin: slot is being written
+            start = offset + _SLOT_HEADER_SIZE
+            buf[start : start + payload.nbytes] = payload
+            dims = list(shape) + [0] * (_MAX_DIMS - len(shape))
+            _SLOT_HEADER.pack_into(
+                buf,
+                offset,
+                seq,
+                seq,
+                cam_id,
+                kind,
+                len(shape),
+                dtype[:2],
+                *dims,
+                payload.nbytes,
+                time.time() if timestamp is None else timestamp,
+            )
+            struct.pack_into("<Q", buf, 24, seq)
+        return seq
+
+    def _read_slot(self, slot: int) -> Optional[TransportFrame]:
+        offset = self._slot_offset(slot)
+        (begin, end, cam_id, kind, ndim, dtype, *rest) = _SLOT_HEADER.unpack_from(
+            self._shm.buf, offset
+        )
+        shape, (nbytes, timestamp) = rest[:_MAX_DIMS], rest[_MAX_DIMS:]
+        if begin == 0 or begin != end:
+            return None  # empty or being written
+        start = offset + _SLOT_HEADER_SIZE
+        view = self._shm.buf[start : start + nbytes]
+        data: Union[memoryview, np.ndarray] = view
+        if kind == _KIND_ARRAY:
+            data = np.frombuffer(view, dtype=np.dtype(dtype[:1].decode())).reshape(shape[:ndim])
+        frame = TransportFrame(cam_id, begin, timestamp, data, self, slot)
+        return frame if frame.is_valid() else None
+
+    def latest(self, cam_id: int | None = None) -> Optional[TransportFrame]:
+        """Return a zero-copy view of the newest frame, optionally per camera."""
+        last = self._last_seq()
+        for seq in range(last, max(0, last - self.slots), -1):
+            frame = self._read_slot((seq - 1) % self.slots)
+            if frame is None or frame.seq != seq:
+                continue
+            if cam_id is None or frame.cam_id == cam_id:
+                return frame
+        return None
@@ -0,0 +1,173 @@
+"""Encode raw frames to JPEG/PNG/WebP in a process pool.
+
+Pillow encoding holds the GIL for most of its work, so encoding in the
+capture thread slows capture down. :class:`FrameEncoder` hands frames to a
+pool of worker processes instead. Pixel data travels through
+:mod:`multiprocessing.shared_memory` rather than being pickled; only the
+small encoded result is sent back.
+
+Example
+-------
+>>> with FrameEncoder(fmt="JPEG", quality=85) as encoder:
+...     jpeg = encoder.encode(array)
+...     futures = [encoder.submit(a) for a in arrays]  # encode in parallel
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing import shared_memory
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+import io
+import multiprocessing
+
+import numpy as np
+
+
+FORMATS_BY_SUFFIX = {
+    ".jpg": "JPEG",
+    ".jpeg": "JPEG",
+    ".png": "PNG",
+    ".webp": "WEBP",
+}
+
+SUFFIX_BY_FORMAT = {"JPEG": ".jpg", "PNG": ".png", "WEBP": ".webp"}
+
+
+def format_for_path(path: str | Path, default: str = "PNG") -> str:
+    """Return the Pillow format name matching ``path``'s suffix."""
+    return FORMATS_BY_SUFFIX.get(Path(path).suffix.lower(), default)
+
+
+def _encode_array(array: "np.ndarray", fmt: str, quality: int) -> bytes:
+    from PIL import Image
+
+    image = Image.fromarray(array)
+    if fmt == "JPEG" and image.mode not in ("L", "RGB", "CMYK"):
+        image = image.convert("RGB")
+    params: Dict[str, Any] = {}
+    if fmt in ("JPEG", "WEBP"):
+        params["quality"] = quality
+    buf = io.BytesIO()
+    image.save(buf, format=fmt, **params)
+    return buf.getvalue()
+
+
+def _encode_shared(
+    name: str, shape: Tuple[int, ...], dtype: str, fmt: str, quality: int
+) -> bytes:
+    """Worker entry point: encode the frame stored in shared memory ``name``."""
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        array = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+        try:
+            return _encode_array(array, fmt, quality)
+        finally:
+            del array  # release the buffer export before closing
+    finally:
+        shm.close()
+
+
+def _default_context() -> Any:
+    method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    return multiprocessing.get_context(method)
+
+
+class FrameEncoder:
+    """Encode NumPy frames in worker processes.
+
+    Parameters
+    ----------
+    fmt : str, optional
+        Default output format: ``"JPEG"``, ``"PNG"`` or ``"WEBP"``.
+    quality : int, optional
+        Default JPEG/WebP quality. Defaults to ``90``.
+    max_workers : int, optional
+        Number of worker processes. Defaults to the CPU count.
+    mp_context : multiprocessing context, optional
+        Context used to start workers. Defaults to ``forkserver`` where
+        available and ``spawn`` otherwise; forking a process that already
+        runs camera, writer and logger threads can deadlock the child.
+    """
+
+    def __init__(
+        self,
+        *,
+        fmt: str = "JPEG",
+        quality: int = 90,
+        max_workers: int | None = None,
+        mp_context: Any = None,
+    ) -> None:
+        self.fmt = fmt.upper()
+        if self.fmt not in SUFFIX_BY_FORMAT:
+            raise ValueError(f"Unsupported format: {fmt}")
+        self.quality = quality
+        if mp_context is None:
+            mp_context = _default_context()
+        self._pool = ProcessPoolExecutor(max_workers=max_workers, mp_context=mp_context)
+
+    def __enter__(self) -> "FrameEncoder":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the worker processes."""
+        self._pool.shutdown(wait=True)
+
+    def submit(
+        self,
+        array: "np.ndarray",
+        *,
+        fmt: str | None = None,
+        quality: int | None = None,
+    ) -> "Future[bytes]":
+        """Queue ``array`` for encoding and return a future of the bytes."""
+        fmt = (fmt or self.fmt).upper()
+        if fmt not in SUFFIX_BY_FORMAT:
+            raise ValueError(f"Unsupported format: {fmt}")
+        array = np.asarray(array)
+        shm = shared_memory.SharedMemory(create=True, size=max(1, array.nbytes))
+        try:
+            view = np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)
+            view[...] = array
+            del view
+            future = self._pool.submit(
+                _encode_shared,
+                shm.name,
+                array.shape,
+                array.dtype.str,
+                fmt,
+                self.quality if quality is None else quality,
+            )
+        except BaseException:
+            shm.close()
+            shm.unlink()
+            raise
+
+        def _release(_: Future) -> None:
+            shm.close()
+            shm.unlink()
+
+        future.add_done_callback(_release)
+        return future
+
+    def encode(
+        self,
+        array: "np.ndarray",
+        *,
+        fmt: str | None = None,
+        quality: int | None = None,
+    ) -> bytes:
+        """Encode ``array`` and wait for the result."""
+        return self.submit(array, fmt=fmt, quality=quality).result()
+
+    def encode_image(self, image: Any, *, fmt: str | None = None, quality: int | None = None) -> bytes:
+        """Encode a :class:`PIL.Image.Image` via the worker pool."""
+        return self.encode(np.asarray(image), fmt=fmt, quality=quality)
+
+    def suffix(self, fmt: Optional[str] = None) -> str:
+        """File suffix for ``fmt`` (or the default format)."""
+        return SUFFIX_BY_FORMAT[(fmt or self.fmt).upper()]
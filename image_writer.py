@@ -0,0 +1,373 @@
+"""Write captured frames to their final location.
+
+In-memory frames are written straight to the destination. Frames that are
+already backed by a file can be moved, hard-linked, reflinked or copied,
+falling back to a plain copy when the source and destination live on
+different filesystems or the filesystem does not support the operation.
+
+:class:`ImageWriter` runs the same saves on a bounded background queue so
+callers such as the UI thread never wait on the disk.
+
+Example
+-------
+>>> save_frame(frame, Path("images/SN_OK_20200102_030405.jpg"), strategy="hardlink")
+>>> with ImageWriter(durability="batch") as writer:
+...     writer.submit(frame, Path("images/SN_OK_20200102_030405.jpg"))
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Deque, Dict, List, Optional
+import errno
+import logging
+import os
+import queue
+import shutil
+import threading
+import time
+
+import numpy as np
+
+from frame_buffer import Frame, FrameData
+from image_encoder import FrameEncoder, format_for_path
+
+
+SAVE_STRATEGIES = ("move", "hardlink", "reflink", "copy")
+DURABILITY_POLICIES = ("none", "batch", "file")
+
+# Linux FICLONE ioctl, see ioctl_ficlone(2)
+_FICLONE = 0x40049409
+
+_FALLBACK_ERRNOS = {
+    errno.EXDEV,  # different filesystems
+    errno.EPERM,  # links not permitted (e.g. some network shares)
+    errno.EMLINK,
+    errno.ENOTSUP,
+    errno.EOPNOTSUPP,
+    errno.EINVAL,
+    errno.ENOTTY,
+}
+
+
+def write_data(data: FrameData, path: Path) -> None:
+    """Write frame ``data`` to ``path``, encoding arrays with Pillow."""
+    if isinstance(data, np.ndarray):
+        try:
+            from PIL import Image
+        except Exception as exc:  # pragma: no cover - optional dep
+            raise ImportError("Pillow is required to save array frames") from exc
+        Image.fromarray(data).save(path)
+    else:
+        with open(path, "wb") as fh:
+            fh.write(data)
+
+
+def _reflink(src: Path, dest: Path) -> None:
+    import fcntl  # POSIX only; ImportError falls back to copy
+
+    with open(src, "rb") as fsrc, open(dest, "wb") as fdst:
+        try:
+            fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+        except OSError:
+            fdst.close()
+            dest.unlink()
+            raise
+
+
+def _transfer(src: Path, dest: Path, strategy: str) -> str:
+    """Place ``src`` at ``dest`` using ``strategy`` and return what was used."""
+    try:
+        if strategy == "move":
+            os.replace(src, dest)
+            return "move"
+        if strategy == "hardlink":
+            if dest.exists():
+                dest.unlink()
+            os.link(src, dest)
+            return "hardlink"
+        if strategy == "reflink":
+            _reflink(src, dest)
+            return "reflink"
+    except (OSError, ImportError) as exc:
+        if isinstance(exc, OSError) and exc.errno not in _FALLBACK_ERRNOS:
+            raise
+        logging.debug("%s of %s failed (%s); copying instead", strategy, src, exc)
+        if strategy == "move":
+            shutil.move(str(src), str(dest))
+            return "copy"
+    shutil.copyfile(src, dest)
+    return "copy"
+
+
+def save_frame(frame: Frame, dest: str | Path, *, strategy: str = "hardlink") -> Path:
+    """Save ``frame`` to ``dest`` and return the destination path.
+
+    Parameters
+    ----------
+    frame : Frame
+        Frame to save.
+    dest : str or Path
+        Final file path.
+    strategy : str, optional
+        ``"move"``, ``"hardlink"``, ``"reflink"`` or ``"copy"``. Only used
+        when ``frame.path`` exists; in-memory frames are always written
+        directly. Files the frame does not own are reflinked or copied
+        instead of moved or hard-linked. Defaults to ``"hardlink"``.
+    """
+    if strategy not in SAVE_STRATEGIES:
+        raise ValueError(f"Unknown save strategy: {strategy}")
+    dest = Path(dest)
+    src = frame.path
+    if src is not None and Path(src).is_file():
+        if not frame.owned and strategy in ("move", "hardlink"):
+            strategy = "reflink"
+        _transfer(Path(src), dest, strategy)
+    else:
+        write_data(frame.data, dest)
+    return dest
+
+
+def _fsync_path(path: Path, *, directory: bool = False) -> None:
+    flags = os.O_RDONLY
+    if directory:
+        if os.name == "nt":  # pragma: no cover - directories cannot be fsynced
+            return
+        flags |= getattr(os, "O_DIRECTORY", 0)
+    fd = os.open(path, flags)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+@dataclass
+class WriteJob:
+    """A frame waiting to be written to ``dest``."""
+
+    frame: Frame
+    dest: Path
+    strategy: str
+    submitted: float
+    # Pending encoder result for array frames, see ImageWriter._encode
+    encoded: Optional["Future[bytes]"] = field(default=None, repr=False)
+
+
+class ImageWriter:
+    """Bounded background queue that writes frames to disk.
+
+    Parameters
+    ----------
+    max_queue : int, optional
+        Maximum number of pending jobs. :meth:`submit` blocks (or raises
+        :class:`queue.Full`) when the queue is full. Defaults to ``64``.
+    durability : str, optional
+        ``"none"`` leaves flushing to the OS, ``"batch"`` fsyncs every file of
+        a batch once the whole batch is written, and ``"file"`` fsyncs each
+        file as soon as it is written. Defaults to ``"none"``.
+    batch_size : int, optional
+        Maximum number of jobs written per batch. Defaults to ``16``.
+    strategy : str, optional
+        Default save strategy passed to :func:`save_frame`.
+    on_error : Callable[[WriteJob, Exception], object], optional
+        Called when a job fails. Failures are always logged.
+    encoder : FrameEncoder, optional
+        Encode NumPy frames in the encoder's worker processes instead of
+        the writer thread. All frames of a batch are handed to the encoder
+        before the first one is written, so frames from several cameras are
+        encoded in parallel.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_queue: int = 64,
+        durability: str = "none",
+        batch_size: int = 16,
+        strategy: str = "hardlink",
+        on_error: Callable[[WriteJob, Exception], object] | None = None,
+        encoder: FrameEncoder | None = None,
+    ) -> None:
+        if durability not in DURABILITY_POLICIES:
+            raise ValueError(f"Unknown durability policy: {durability}")
+        if strategy not in SAVE_STRATEGIES:
+            raise ValueError(f"Unknown save strategy: {strategy}")
+        self.durability = durability
+        self.batch_size = max(1, batch_size)
+        self.strategy = strategy
+        self.on_error = on_error
+        self.encoder = encoder
+        self._queue: "queue.Queue[Optional[WriteJob]]" = queue.Queue(maxsize=max_queue)
+        self._latencies: Deque[float] = deque(maxlen=1024)
+        self._written = 0
+        self._failed = 0
+        self._max_depth = 0
+        self._stats_lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    def __enter__(self) -> "ImageWriter":
+        self.start()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    # Lifecycle --------------------------------------------------------
+    def start(self) -> None:
+        """Start the writer thread. Called automatically by :meth:`submit`."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(target=self._run, name="image-writer", daemon=True)
+        self._thread.start()
+
+    def close(self, timeout: float | None = None) -> None:
+        """Write all pending jobs and stop the writer thread."""
+        if self._thread is None:
+            return
+        self._queue.put(None)
+        self._thread.join(timeout)
+        self._thread = None
+
+    def flush(self) -> None:
+        """Block until every submitted job has been written."""
+        self._queue.join()
+
+    # Public API -------------------------------------------------------
+    def submit(
+        self,
+        frame: Frame,
+        dest: str | Path,
+        *,
+        strategy: str | None = None,
+        block: bool = True,
+        timeout: float | None = None,
+    ) -> Path:
+        """Queue ``frame`` to be written to ``dest`` and return ``dest``.
+
+        When the queue is full the call blocks, applying backpressure to the
+        producer. With ``block=False`` or a ``timeout``, :class:`queue.Full`
+        is raised instead.
+        """
+        strategy = strategy or self.strategy
+        if strategy not in SAVE_STRATEGIES:
+            raise ValueError(f"Unknown save strategy: {strategy}")
+        self.start()
+        job = WriteJob(frame, Path(dest), strategy, time.monotonic())
+        self._queue.put(job, block=block, timeout=timeout)
+        depth = self._queue.qsize()
+        with self._stats_lock:
+            self._max_depth = max(self._max_depth, depth)
+        return job.dest
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of jobs waiting to be written."""
+        return self._queue.qsize()
+
+    def metrics(self) -> Dict[str, float]:
+        """Return queue depth, throughput counters and write latencies.
+
+        Latencies are measured from :meth:`submit` to the end of the write
+        (including fsync) over the last 1024 jobs, in seconds.
+        """
+        with self._stats_lock:
+            lat = sorted(self._latencies)
+            data: Dict[str, float] = {
+                "queue_depth": self._queue.qsize(),
+                "max_queue_depth": self._max_depth,
+                "written": self._written,
+                "failed": self._failed,
+            }
+        if lat:
+            data["latency_avg"] = sum(lat) / len(lat)
+            data["latency_p50"] = lat[len(lat) // 2]
+            data["latency_p95"] = lat[min(len(lat) - 1, int(len(lat) * 0.95))]
+            data["latency_max"] = lat[-1]
+        return data
+
+    # Worker -----------------------------------------------------------
+    def _next_batch(self) -> tuple[List[WriteJob], bool]:
+        """Return up to ``batch_size`` jobs and whether close was requested."""
+        first = self._queue.get()
+        if first is None:
+            self._queue.task_done()
+            return [], True
+        batch = [first]
+        stop = False
+        while len(batch) < self.batch_size:
+            try:
+                job = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if job is None:
+                self._queue.task_done()
+                stop = True
+                break
+            batch.append(job)
+        return batch, stop
+
+    def _encode(self, batch: List[WriteJob]) -> None:
+        """Start encoding every array frame of ``batch`` in the encoder."""
+        if self.encoder is None:
+            return
+        for job in batch:
+            if job.frame.is_array:
+                try:
+                    job.encoded = self.encoder.submit(
+                        job.frame.data, fmt=format_for_path(job.dest)
+                    )
+                except Exception as exc:
+                    # Reported by _write like any other encode failure
+                    job.encoded = Future()
+                    job.encoded.set_exception(exc)
+
+    def _write(self, job: WriteJob) -> bool:
+        try:
+            if job.encoded is not None:
+                write_data(job.encoded.result(), job.dest)
+            else:
+                save_frame(job.frame, job.dest, strategy=job.strategy)
+            if self.durability == "file":
+                _fsync_path(job.dest)
+                _fsync_path(job.dest.parent, directory=True)
+            return True
+        except Exception as exc:
+            self._fail(job, exc)
+            return False
+
+    def _fail(self, job: WriteJob, exc: Exception) -> None:
+        logging.error("Failed to write image %s: %s", job.dest, exc)
+        with self._stats_lock:
+            self._failed += 1
+        if self.on_error is not None:
+            try:
+                self.on_error(job, exc)
+            except Exception:  # pragma: no cover - callback error
+                logging.exception("ImageWriter on_error callback failed")
+
+    def _run(self) -> None:
+        while True:
+            batch, stop = self._next_batch()
+            self._encode(batch)
+            written = [job for job in batch if self._write(job)]
+            if self.durability == "batch" and written:
+                try:
+                    for job in written:
+                        _fsync_path(job.dest)
+                    for parent in {job.dest.parent for job in written}:
+                        _fsync_path(parent, directory=True)
+                except OSError as exc:
+                    for job in written:
+                        self._fail(job, exc)
+                    written = []
+            done = time.monotonic()
+            with self._stats_lock:
+                self._written += len(written)
+                self._latencies.extend(done - job.submitted for job in written)
+            for _ in batch:
+                self._queue.task_done()
+            if stop:
+                return
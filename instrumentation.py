@@ -0,0 +1,228 @@
+"""Lightweight per-stage latency instrumentation.
+
+:class:`Instrumentation` times pipeline stages with monotonic-clock spans
+and records them in HDR-style :class:`LatencyHistogram` objects, one per
+stage and optionally one per camera and stage. Recording is a lock and a
+dictionary increment, cheap enough to leave enabled in production.
+
+Example
+-------
+>>> inst = Instrumentation()
+>>> with inst.span("capture", cam_id=1):
+...     manager.capture_images(1)
+>>> inst.snapshot()["stages"]["capture"]["p99_ms"]
+>>> inst.start_periodic_dump(event_logger, interval=60)
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional, Tuple
+import logging
+import math
+import threading
+import time
+
+
+class LatencyHistogram:
+    """Log-linear histogram of latencies with bounded relative error.
+
+    Values are stored in microseconds. Like HdrHistogram, each power of two
+    is split into equally sized sub-buckets, so every recorded value is kept
+    to ``significant_figures`` decimal digits of precision regardless of its
+    magnitude, in constant memory per power of two.
+
+    Parameters
+    ----------
+    significant_figures : int, optional
+        Decimal digits of precision, ``1`` to ``4``. Defaults to ``2``
+        (better than 1% relative error).
+    """
+
+    def __init__(self, significant_figures: int = 2) -> None:
+        if not 1 <= significant_figures <= 4:
+            raise ValueError("significant_figures must be between 1 and 4")
+        self.significant_figures = significant_figures
+        self._sub_bits = math.ceil(math.log2(10**significant_figures)) + 1
+        self._half = 1 << (self._sub_bits - 1)
+        self._counts: Dict[int, int] = {}
+        self.count = 0
+        self._total = 0
+        self._min: Optional[int] = None
+        self._max = 0
+
+    def _index(self, value: int) -> int:
+        shift = value.bit_length() - self._sub_bits
+        if shift <= 0:
+            return value
+        return (shift + 1) * self._half + (value >> shift) - self._half
+
+    def _value(self, index: int) -> int:
+        """Return the midpoint of the values that map to ``index``."""
+        if index < 2 * self._half:
+            return index
+        shift, offset = divmod(index - 2 * self._half, self._half)
+        shift += 1
+        low = (self._half + offset) << shift
+        return low + (1 << shift) // 2
+
+    def record(self, seconds: float) -> None:
+        """Record one latency given in seconds."""
+        value = max(0, int(seconds * 1_000_000))
+        index = self._index(value)
+        self._counts[index] = self._counts.get(index, 0) + 1
+        self.count += 1
+        self._total += value
+        self._max = max(self._max, value)
+        self._min = value if self._min is None else min(self._min, value)
+
+    def percentile(self, p: float) -> float:
+        """Return the ``p`` th percentile (0-100) in seconds."""
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(self.count * p / 100.0))
+        seen = 0
+        for index in sorted(self._counts):
+            seen += self._counts[index]
+            if seen >= rank:
+                value = self._value(index)
+                return min(max(value, self._min or 0), self._max) / 1_000_000
+        return self._max / 1_000_000  # pragma: no cover - unreachable
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Add the values recorded in ``other`` (same precision) to this one."""
+        if other.significant_figures != self.significant_figures:
+            raise ValueError("cannot merge histograms of different precision")
+        for index, n in other._counts.items():
+            self._counts[index] = self._counts.get(index, 0) + n
+        self.count += other.count
+        self._total += other._total
+        self._max = max(self._max, other._max)
+        if other._min is not None:
+            self._min = other._min if self._min is None else min(self._min, other._min)
+
+    def reset(self) -> None:
+        self._counts.clear()
+        self.count = 0
+        self._total = 0
+        self._min = None
+        self._max = 0
+
+    def summary(self) -> Dict[str, float]:
+        """Return count, min, mean, percentiles and max in milliseconds."""
+        if not self.count:
+            return {"count": 0}
+        return {
+            "count": self.count,
+            "min_ms": (self._min or 0) / 1000,
+            "mean_ms": self._total / self.count / 1000,
+            "p50_ms": self.percentile(50) * 1000,
+            "p90_ms": self.percentile(90) * 1000,
+            "p99_ms": self.percentile(99) * 1000,
+            "p999_ms": self.percentile(99.9) * 1000,
+            "max_ms": self._max / 1000,
+        }
+
+
+Key = Tuple[str, Optional[int]]
+
+
+class Instrumentation:
+    """Collect latency histograms per stage and per camera.
+
+    Parameters
+    ----------
+    significant_figures : int, optional
+        Precision of the histograms. See :class:`LatencyHistogram`.
+    """
+
+    def __init__(self, significant_figures: int = 2) -> None:
+        self.significant_figures = significant_figures
+        self._histograms: Dict[Key, LatencyHistogram] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def record(self, stage: str, seconds: float, cam_id: int | None = None) -> None:
+        """Record ``seconds`` for ``stage`` (and ``cam_id`` when given)."""
+        keys = [(stage, None)] if cam_id is None else [(stage, None), (stage, cam_id)]
+        with self._lock:
+            for key in keys:
+                hist = self._histograms.get(key)
+                if hist is None:
+                    hist = self._histograms[key] = LatencyHistogram(self.significant_figures)
+                hist.record(seconds)
+
+    @contextmanager
+    def span(self, stage: str, cam_id: int | None = None) -> Iterator[None]:
+        """Time the ``with`` block and record it under ``stage``.
+
+        The span is recorded even when the block raises.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - start, cam_id)
+
+    def histogram(self, stage: str, cam_id: int | None = None) -> Optional[LatencyHistogram]:
+        """Return the histogram of ``stage``, overall or for ``cam_id``."""
+        return self._histograms.get((stage, cam_id))
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return summaries of every histogram.
+
+        The result has a ``"stages"`` mapping of stage name to summary and a
+        ``"cameras"`` mapping of camera id to per-stage summaries.
+        """
+        with self._lock:
+            items = [(key, hist.summary()) for key, hist in self._histograms.items()]
+        stages: Dict[str, Any] = {}
+        cameras: Dict[int, Dict[str, Any]] = {}
+        for (stage, cam_id), summary in sorted(items, key=lambda kv: (kv[0][0], kv[0][1] or 0)):
+            if cam_id is None:
+                stages[stage] = summary
+            else:
+                cameras.setdefault(cam_id, {})[stage] = summary
+        return {"stages": stages, "cameras": cameras}
+
+    def reset(self) -> None:
+        """Drop all recorded values."""
+        with self._lock:
+            self._histograms.clear()
+
+    # Periodic dump ----------------------------------------------------
+    def dump(self, event_logger: Any, *, reset: bool = False) -> Dict[str, Any]:
+        """Write :meth:`snapshot` to ``event_logger`` as a ``"metrics"`` event."""
+        snapshot = self.snapshot()
+        if reset:
+            self.reset()
+        event_logger.log_event("metrics", "stage latency", snapshot)
+        return snapshot
+
+    def start_periodic_dump(
+        self, event_logger: Any, interval: float = 60.0, *, reset: bool = False
+    ) -> None:
+        """Call :meth:`dump` every ``interval`` seconds on a daemon thread.
+
+        With ``reset=True`` each dump covers only the preceding interval.
+        """
+        self.stop_periodic_dump()
+        self._stop.clear()
+
+        def _run() -> None:
+            while not self._stop.wait(interval):
+                try:
+                    self.dump(event_logger, reset=reset)
+                except Exception as exc:  # pragma: no cover - logger error
+                    logging.error("Failed to dump latency metrics: %s", exc)
+
+        self._thread = threading.Thread(target=_run, name="metrics-dump", daemon=True)
+        self._thread.start()
+
+    def stop_periodic_dump(self) -> None:
+        """Stop the periodic dump thread if it is running."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
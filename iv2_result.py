@@ -0,0 +1,123 @@
+"""Decode the Keyence IV2 EtherNet/IP input assembly.
+
+The camera answers a trigger with the input assembly (instance 100), read
+by :func:`manager_cam.trigger_iv2_camera` as :data:`IV2_INPUT_SIZE`
+elements. The only field this project has verified against a camera is
+the overall judgement: bit 0 of element 4 is set when the inspection
+passed (see :data:`IV2_OVERALL_OK`). What the other elements hold depends
+on the sensor firmware and on the EtherNet/IP data assignment configured
+in IV-Navigator, so they are not hard-coded here. Describe them with
+:class:`IV2Field` from the manual of the installed sensor and pass them
+to :meth:`IV2Result.get` or :func:`extract`.
+
+Assemblies are handled element-wise as NumPy arrays, so decoding never
+loops over fields in Python, and stored assemblies can be analysed in
+bulk with :func:`decode_iv2_batch` and :func:`load_iv2_batch`.
+
+Example
+-------
+>>> ok, raw = trigger_iv2_camera("192.168.0.10")
+>>> result = decode_iv2_result(raw)
+>>> result.overall_ok
+>>> program = IV2Field("program", 12)  # element taken from the sensor manual
+>>> result.get(program)
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Iterable, NamedTuple, Optional, Sequence, Union
+
+import numpy as np
+
+
+IV2_INPUT_SIZE = 196
+
+Buffer = Union[bytes, bytearray, memoryview, "np.ndarray", Sequence[int]]
+
+
+class IV2Field(NamedTuple):
+    """One element of the input assembly, or a single bit of it."""
+
+    name: str
+    index: int
+    bit: Optional[int] = None
+
+
+IV2_OVERALL_OK = IV2Field("overall_ok", 4, 0)
+
+
+def as_iv2_array(data: Buffer) -> "np.ndarray":
+    """Return the elements of one or more assemblies as a NumPy array.
+
+    Byte buffers are viewed as ``uint8`` without copying; the list of ints
+    returned by pycomm3 is converted once, keeping element values as they
+    are. The result has shape ``(n, IV2_INPUT_SIZE)``.
+    """
+    if isinstance(data, np.ndarray):
+        arr = data
+    elif isinstance(data, (bytes, bytearray, memoryview)):
+        arr = np.frombuffer(data, dtype=np.uint8)
+    else:
+        arr = np.asarray(data)
+    if arr.size % IV2_INPUT_SIZE:
+        raise ValueError(f"IV2 input assemblies must be {IV2_INPUT_SIZE} elements long")
+    return arr.reshape(-1, IV2_INPUT_SIZE)
+
+
+def extract(records: "np.ndarray", field: IV2Field) -> "np.ndarray":
+    """Return ``field`` of every assembly in ``records``.
+
+    Bit fields are returned as booleans, element fields as integers.
+    """
+    values = records[..., field.index]
+    if field.bit is None:
+        return values
+    return (values >> field.bit & 1).astype(bool)
+
+
+def overall_ok(records: "np.ndarray") -> "np.ndarray":
+    """Return a boolean array of overall OK flags for ``records``."""
+    return extract(records, IV2_OVERALL_OK)
+
+
+class IV2Result(NamedTuple):
+    """Decoded IV2 input assembly."""
+
+    elements: "np.ndarray"
+
+    @property
+    def overall_ok(self) -> bool:
+        return bool(extract(self.elements, IV2_OVERALL_OK))
+
+    def get(self, field: IV2Field) -> Union[int, bool]:
+        """Return ``field`` of this assembly."""
+        return extract(self.elements, field).item()
+
+
+def decode_iv2_result(data: Buffer) -> IV2Result:
+    """Decode a single input assembly returned by ``trigger_iv2_camera``."""
+    records = as_iv2_array(data)
+    if len(records) != 1:
+        raise ValueError("expected a single IV2 input assembly")
+    return IV2Result(records[0])
+
+
+def decode_iv2_batch(assemblies: Union[Buffer, Iterable[Buffer]]) -> "np.ndarray":
+    """Stack many stored assemblies into one ``(n, IV2_INPUT_SIZE)`` array.
+
+    ``assemblies`` may be a concatenated buffer, a 2-D array with one
+    assembly per row, or an iterable of individual assemblies.
+    """
+    if isinstance(assemblies, (bytes, bytearray, memoryview, np.ndarray)):
+        return as_iv2_array(assemblies)
+    rows = [as_iv2_array(a) for a in assemblies]
+    if not rows:
+        return np.empty((0, IV2_INPUT_SIZE), dtype=np.uint8)
+    return np.concatenate(rows)
+
+
+def load_iv2_batch(path: str | Path, dtype: "np.typing.DTypeLike" = np.uint8) -> "np.ndarray":
+    """Memory-map a file of concatenated assemblies as an
+    ``(n, IV2_INPUT_SIZE)`` array of ``dtype`` elements."""
+    return np.memmap(Path(path), dtype=dtype, mode="r").reshape(-1, IV2_INPUT_SIZE)
@@ -0,0 +1,284 @@
+"""Rotation, compression and retention of JSON-lines event logs.
+
+A :class:`RotationPolicy` tells :class:`event_logger.EventLogger` when to
+start a new segment of its log file:
+
+``"size"``
+    once the current segment would exceed ``max_bytes``
+``"day"``
+    at the first event of a new calendar day
+``"shift"``
+    at the first event after one of the ``shift_starts`` times
+
+A rotated segment is renamed with a timestamp, e.g. ``events.txt`` becomes
+``events.20261017-060000.txt``, and then compressed to ``.gz`` or ``.xz``
+in a background thread. Segments beyond ``max_segments`` or older than
+``retention_days`` are deleted.
+
+:func:`list_segments` returns every segment of a log oldest first, and
+:func:`open_segment` opens one whether or not it has been compressed yet,
+so readers can walk the whole history.
+
+Example
+-------
+>>> policy = RotationPolicy(when="shift", compression="lzma", retention_days=90)
+>>> logger = EventLogger("logs/events.txt", rotation=policy)
+>>> for segment in list_segments("logs/events.txt"):
+...     with open_segment(segment) as fh:
+...         ...
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, time as dtime, timedelta
+from pathlib import Path
+from typing import IO, Iterable, List, Optional, Tuple
+import gzip
+import logging
+import lzma
+import os
+import re
+import shutil
+import time
+
+
+ROTATE_WHEN = ("size", "day", "shift")
+
+COMPRESSORS = {"gzip": (".gz", gzip.open), "lzma": (".xz", lzma.open)}
+
+_STAMP = "%Y%m%d-%H%M%S"
+_SEGMENT_RE = re.compile(r"\.(\d{8}-\d{6})(?:-(\d+))?$")
+_STAMP_RE = re.compile(r"\.(\d{8}-\d{6})(?:-\d+)?(?=\.|$)")
+
+
+@dataclass(frozen=True)
+class RotationPolicy:
+    """When to rotate a log file and what to do with old segments.
+
+    Parameters
+    ----------
+    when : str, optional
+        ``"size"``, ``"day"`` or ``"shift"``. Defaults to ``"size"``.
+    max_bytes : int, optional
+        Segment size limit for ``"size"`` rotation. Defaults to 10 MiB.
+    shift_starts : tuple of str, optional
+        ``"HH:MM"`` start times of the production shifts for ``"shift"``
+        rotation. Defaults to ``("06:00", "14:00", "22:00")``.
+    compression : str, optional
+        ``"gzip"``, ``"lzma"`` or ``None`` to keep segments uncompressed.
+        Defaults to ``"gzip"``.
+    max_segments : int, optional
+        Keep at most this many rotated segments.
+    retention_days : float, optional
+        Delete rotated segments older than this many days.
+    """
+
+    when: str = "size"
+    max_bytes: int = 10 * 1024 * 1024
+    shift_starts: Tuple[str, ...] = ("06:00", "14:00", "22:00")
+    compression: Optional[str] = "gzip"
+    max_segments: Optional[int] = None
+    retention_days: Optional[float] = None
+
+    def __post_init__(self) -> None:
+        if self.when not in ROTATE_WHEN:
+            raise ValueError(f"Unknown rotation trigger: {self.when}")
+        if self.compression is not None and self.compression not in COMPRESSORS:
+            raise ValueError(f"Unknown compression: {self.compression}")
+        if self.when == "shift":
+            if not self.shift_starts:
+                raise ValueError("shift rotation needs at least one shift start")
+            self._shift_times()  # validate
+
+    def _shift_times(self) -> List[dtime]:
+        return sorted(dtime.fromisoformat(s) for s in self.shift_starts)
+
+    def period(self, moment: datetime) -> object:
+        """Return an identifier of the day or shift containing ``moment``.
+
+        Returns ``None`` for size-based rotation.
+        """
+        if self.when == "day":
+            return moment.date()
+        if self.when == "shift":
+            starts = self._shift_times()
+            current = [s for s in starts if s <= moment.time()]
+            if current:
+                return (moment.date(), current[-1])
+            # before the first shift of the day: still in yesterday's last shift
+            return (moment.date() - timedelta(days=1), starts[-1])
+        return None
+
+    def should_rotate(self, segment_bytes: int, line_bytes: int, started: datetime, now: datetime) -> bool:
+        """Return ``True`` when a new segment should start before the next line."""
+        if segment_bytes == 0:
+            return False
+        if self.when == "size":
+            return segment_bytes + line_bytes > self.max_bytes
+        return self.period(started) != self.period(now)
+
+
+def segment_path(path: str | Path, moment: datetime, *, taken: Iterable[Path] = ()) -> Path:
+    """Return an unused name for the segment of ``path`` rotated at ``moment``.
+
+    Names in ``taken`` are treated as used even if no such file exists yet,
+    and the new name sorts after them, so segments rotated within the same
+    second keep their order even when older ones have been deleted.
+    """
+    path = Path(path)
+    stamp = moment.strftime(_STAMP)
+    base = f"{path.stem}.{stamp}"
+    n = 0
+    for other in taken:
+        key = _segment_key(Path(other), len(path.suffix))
+        if key[0] == stamp:
+            n = max(n, key[1] + 1)
+    while True:
+        candidate = path.with_name(f"{base}-{n}{path.suffix}" if n else base + path.suffix)
+        if not segment_exists(candidate):
+            return candidate
+        n += 1
+
+
+def segment_exists(path: str | Path) -> bool:
+    """Return ``True`` if segment ``path`` exists, compressed or not."""
+    path = Path(path)
+    return path.exists() or any(
+        path.with_name(path.name + ext).exists() for ext, _ in COMPRESSORS.values()
+    )
+
+
+def segment_time(path: str | Path) -> Optional[datetime]:
+    """Return the rotation time encoded in a segment name.
+
+    Every entry of the segment was logged at or before this time. Returns
+    ``None`` for names without a timestamp, such as the live file.
+    """
+    match = _STAMP_RE.search(Path(path).name)
+    if match is None:
+        return None
+    return datetime.strptime(match.group(1), _STAMP)
+
+
+def strip_compression(name: str) -> str:
+    """Return file ``name`` without a ``.gz`` or ``.xz`` extension."""
+    for ext, _ in COMPRESSORS.values():
+        if name.endswith(ext):
+            return name[: -len(ext)]
+    return name
+
+
+def _segment_key(path: Path, suffix_len: int) -> Tuple[str, int]:
+    match = _SEGMENT_RE.search(path.name[: len(path.name) - suffix_len])
+    if match is None:
+        return ("", 0)
+    return (match.group(1), int(match.group(2) or 0))
+
+
+def list_segments(path: str | Path, *, include_current: bool = True) -> List[Path]:
+    """Return the rotated segments of ``path`` oldest first.
+
+    Compressed segments are returned under their compressed name. The live
+    file ``path`` is appended last when it exists and ``include_current``
+    is ``True``.
+    """
+    path = Path(path)
+    segments = {}
+    if path.parent.is_dir():
+        for candidate in path.parent.glob(f"{path.stem}.*"):
+            name = strip_compression(candidate.name)
+            if not name.endswith(path.suffix):
+                continue
+            logical = path.with_name(name)
+            if logical == path:
+                continue
+            key = _segment_key(logical, len(path.suffix))
+            if key[0]:
+                # prefer the plain file while compression is in progress
+                if logical not in segments or candidate == logical:
+                    segments[logical] = (key, candidate)
+    ordered = [p for _, p in sorted(segments.values())]
+    if include_current and path.exists():
+        ordered.append(path)
+    return ordered
+
+
+def open_segment(path: str | Path, mode: str = "rt") -> IO:
+    """Open a segment for reading, compressed or not.
+
+    ``path`` may name the plain segment even after it has been compressed;
+    the compressed file is opened instead. ``mode`` is ``"rt"`` for text or
+    ``"rb"`` for bytes.
+    """
+    path = Path(path)
+    text = {"encoding": "utf-8", "newline": ""} if mode == "rt" else {}
+    for ext, opener in COMPRESSORS.values():
+        if path.name.endswith(ext):
+            return opener(path, mode, **text)
+    try:
+        return path.open(mode[0] + ("b" if mode == "rb" else ""), **text)
+    except FileNotFoundError:
+        for ext, opener in COMPRESSORS.values():
+            compressed = path.with_name(path.name + ext)
+            if compressed.exists():
+                return opener(compressed, mode, **text)
+        raise
+
+
+def compress_segment(path: str | Path, method: str = "gzip") -> Path:
+    """Compress ``path`` next to itself, delete the original and return the
+    compressed path.
+
+    The compressed file is written under a temporary name and renamed into
+    place, so a crash never leaves a truncated segment behind.
+    """
+    path = Path(path)
+    ext, opener = COMPRESSORS[method]
+    target = path.with_name(path.name + ext)
+    tmp = path.with_name(path.name + ext + ".tmp")
+    with path.open("rb") as src, opener(tmp, "wb") as dst:
+        shutil.copyfileobj(src, dst, 1024 * 1024)
+    os.replace(tmp, target)
+    path.unlink()
+    return target
+
+
+def expired_segments(path: str | Path, policy: RotationPolicy) -> List[Path]:
+    """Return the rotated segments of ``path`` that ``policy`` no longer
+    keeps, oldest first."""
+    segments = list_segments(path, include_current=False)
+    doomed = []
+    if policy.max_segments is not None and len(segments) > policy.max_segments:
+        doomed = segments[: len(segments) - policy.max_segments]
+    if policy.retention_days is not None:
+        cutoff = time.time() - policy.retention_days * 86400
+        for segment in segments[len(doomed):]:
+            try:
+                if segment.stat().st_mtime < cutoff:
+                    doomed.append(segment)
+            except FileNotFoundError:
+                continue
+    return doomed
+
+
+def remove_segments(segments: Iterable[Path]) -> List[Path]:
+    """Delete ``segments`` and return those that were deleted."""
+    deleted = []
+    for segment in segments:
+        try:
+            segment.unlink()
+            deleted.append(segment)
+        except FileNotFoundError:
+            continue
+        except OSError as exc:
+            logging.error("Failed to delete log segment %s: %s", segment, exc)
+    return deleted
+
+
+def apply_retention(path: str | Path, policy: RotationPolicy) -> List[Path]:
+    """Delete rotated segments of ``path`` that ``policy`` no longer keeps.
+
+    Returns the deleted paths, oldest first.
+    """
+    return remove_segments(expired_segments(path, policy))
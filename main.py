@@ -5,9 +5,11 @@ from __future__ import annotations
 import tkinter as tk
 
 from ui_main import MainUI
-from manager_cam import CameraManager
+from manager_cam import CameraManager, TIMED_OUT
 from input_manager import InputManager
 from event_logger import EventLogger
+from image_writer import ImageWriter
+from instrumentation import Instrumentation
 import model_api
 from pathlib import Path
 
@@ -22,14 +24,27 @@ class MainController:
         camera_manager: CameraManager | None = None,
         input_manager: InputManager | None = None,
         event_logger: EventLogger | None = None,
+        image_writer: ImageWriter | None = None,
+        instrumentation: Instrumentation | None = None,
+        metrics_interval: float | None = None,
         image_dir: str | Path = "images",
         log_file: str | Path = "logs/events.txt",
     ) -> None:
         self.ui = ui
-        self.camera_manager = camera_manager or CameraManager()
+        # Per-stage latency histograms of each trigger cycle
+        self.instrumentation = instrumentation or Instrumentation()
+        if camera_manager is None:
+            # Injected managers are left as configured by the caller
+            camera_manager = CameraManager()
+            camera_manager.instrumentation = self.instrumentation
+        self.camera_manager = camera_manager
         self.input_manager = input_manager or InputManager()
         self.event_logger = event_logger or EventLogger(log_file)
+        # When set, images are written in the background instead of inline
+        self.image_writer = image_writer
         self.image_dir = Path(image_dir)
+        if metrics_interval:
+            self.instrumentation.start_periodic_dump(self.event_logger, metrics_interval)
         self.active_camera: int | None = None
 
         # Wire up button commands
@@ -43,6 +58,13 @@ class MainController:
         if hasattr(self.ui, "export_btn"):
             self.ui.export_btn.configure(command=self.on_export_logs)
 
+    def close(self) -> None:
+        """Stop the metrics dump and write out queued images and events."""
+        self.instrumentation.stop_periodic_dump()
+        if self.image_writer is not None:
+            self.image_writer.close()
+        self.event_logger.close()
+
     def log_and_status(self, msg: str, level: str = "info") -> None:
         """Log *msg* via :class:`EventLogger` and show it on the status bar."""
         self.event_logger.log_event(level, msg)
@@ -53,24 +75,37 @@ class MainController:
     # ------------------------------------------------------------------
     def on_trigger(self) -> None:
         """Handle trigger button clicks."""
+        span = self.instrumentation.span
         try:
-            serial = self.input_manager.read_serial()
-            model = model_api.select_model(serial) or ""
-            self.ui.update_serial(serial)
-            if model:
-                self.ui.update_model(model)
-
-            images = self.camera_manager.capture_images(self.active_camera)
-            for cam_id, path in images.items():
-                if path is not None:
-                    saved = self.camera_manager.save_latest_image(
-                        cam_id, self.image_dir, serial=serial, status="OK"
+            with span("cycle"):
+                with span("serial_read"):
+                    serial = self.input_manager.read_serial()
+                with span("model_lookup"):
+                    model = model_api.select_model(serial) or ""
+                self.ui.update_serial(serial)
+                if model:
+                    self.ui.update_model(model)
+
+                with span("capture"):
+                    images = self.camera_manager.capture_images(self.active_camera)
+                for cam_id, frame in images.items():
+                    if frame is TIMED_OUT:
+                        self.log_and_status(f"Camera {cam_id} timed out", level="warn")
+                    elif frame is not None:
+                        with span("save", cam_id):
+                            saved = self.camera_manager.save_latest_image(
+                                cam_id,
+                                self.image_dir,
+                                serial=serial,
+                                status="OK",
+                                writer=self.image_writer,
+                            )
+                        self.ui.add_log(str(saved))
+
+                with span("log"):
+                    self.event_logger.log_event(
+                        "info", "capture complete", {"serial": serial, "model": model}
                     )
-                    self.ui.add_log(str(saved))
-
-            self.event_logger.log_event(
-                "info", "capture complete", {"serial": serial, "model": model}
-            )
             self.ui.update_status("Capture complete")
         except Exception as exc:  # pragma: no cover - error path
             self.log_and_status(f"Capture failed: {exc}", level="error")
@@ -112,8 +147,12 @@ def run() -> None:
     """Entry point to start the application."""
     root = tk.Tk()
     ui = MainUI(root)
-    MainController(ui)
-    root.mainloop()
+    # Save images on a background thread so triggers never wait on the disk
+    controller = MainController(ui, image_writer=ImageWriter())
+    try:
+        root.mainloop()
+    finally:
+        controller.close()
 
 
 if __name__ == "__main__":
@@ -1,34 +1,185 @@
 
 from __future__ import annotations
 import numpy as np
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple, TypeVar, Union
+import asyncio
+import io
 import logging
-import tempfile
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import queue
+import random
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
 from datetime import datetime
-import shutil
 
+from buffer_pool import BufferPool
+from cip_pool import CIPSessionPool
 from camera_config import load_camera_objects, Camera as CameraConfig
-from camera_config import validate_cameras
+from camera_config import REPLAY_SUFFIXES, parse_resolution, validate_cameras
 from config_loader import ConfigLoader
+from frame_buffer import Frame, FrameData, FrameRing
+from frame_stream import FrameStream
+from frame_transport import FrameTransport
+from image_writer import SAVE_STRATEGIES, ImageWriter, save_frame
+from instrumentation import Instrumentation
 from pycomm3 import CIPDriver
 
-def trigger_iv2_camera(ip):
+
+class _TimedOut:
+    """Sentinel marking a camera that missed the capture deadline."""
+
+    def __repr__(self) -> str:
+        return "TIMED_OUT"
+
+
+TIMED_OUT = _TimedOut()
+
+
+class _CaptureJob:
+    """Run one capture and drop its frame if the deadline already passed."""
+
+    def __init__(self, cam: "BaseCamera", instrumentation: Instrumentation | None = None) -> None:
+        self.cam = cam
+        self.instrumentation = instrumentation
+        self.submitted = time.monotonic()
+        # Set when the job starts running on the camera's worker
+        self.started: float | None = None
+        self._lock = threading.Lock()
+        self._done = False
+        self._expired = False
+
+    def __call__(self) -> Frame:
+        self.started = time.monotonic()
+        if self.instrumentation is None:
+            frame = self.cam.capture()
+        else:
+            with self.instrumentation.span("camera_capture", self.cam.id):
+                frame = self.cam.capture()
+        with self._lock:
+            if self._expired:
+                self.cam.frames.discard(frame)
+            else:
+                self._done = True
+        return frame
+
+    def expire(self) -> bool:
+        """Mark the job late. Return ``False`` if its frame already arrived."""
+        with self._lock:
+            if self._done:
+                return False
+            self._expired = True
+            return True
+
+    def deadline(self, per_camera_timeout: float) -> float:
+        """Return when the job is late under ``per_camera_timeout``.
+
+        The limit runs from when the job started on the worker, or from
+        submission while it is still queued behind other work.
+        """
+        started = self.started
+        return (self.submitted if started is None else started) + per_camera_timeout
+
+
+def _late_jobs(
+    jobs: Iterable[Future],
+    job_of: Dict[Future, _CaptureJob],
+    deadline: float | None,
+    per_camera_timeout: float | None,
+) -> Tuple[List[Future], float | None]:
+    """Return the pending futures past their deadline and the seconds until
+    the next deadline (``None`` when there is none)."""
+    now = time.monotonic()
+    late: List[Future] = []
+    next_due: float | None = None
+    for future in jobs:
+        due = deadline
+        if per_camera_timeout is not None:
+            own = job_of[future].deadline(per_camera_timeout)
+            due = own if due is None else min(due, own)
+        if due is None:
+            continue
+        if due <= now:
+            late.append(future)
+        elif next_due is None or due < next_due:
+            next_due = due
+    return late, None if next_due is None else next_due - now
+
+
+_cip_pool = CIPSessionPool(driver_factory=CIPDriver)
+
+
+@dataclass(frozen=True)
+class Preview:
+    """Downscaled RGB888 preview of a frame.
+
+    ``data`` can be wrapped without copying as
+    ``QImage(preview.data, preview.width, preview.height,
+    preview.bytes_per_line, QImage.Format_RGB888)``.
+    """
+
+    data: bytes
+    width: int
+    height: int
+    seq: int
+
+    @property
+    def bytes_per_line(self) -> int:
+        return self.width * 3
+
+
+@dataclass
+class ConnectResult:
+    """Outcome of connecting a single camera in :meth:`CameraManager.connect_all`."""
+
+    cam_id: int
+    status: str  # "connected", "failed", "timeout" or "error"
+    duration: float
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.status == "connected"
+
+
+def _timed_connect(cam: "BaseCamera") -> tuple[bool, float]:
+    """Connect ``cam`` and return ``(result, seconds taken)``."""
+    start = time.monotonic()
+    ok = cam.connect()
+    return ok, time.monotonic() - start
+
+
+def trigger_iv2_camera(ip, *, pool: CIPSessionPool | None = None):
     INPUT_ASSEMBLY = 100
     OUTPUT_ASSEMBLY = 101
     INPUT_SIZE = 196
     OUTPUT_SIZE = 6
-    with CIPDriver(ip) as plc:
-        # Trigger กล้อง
-        output_data = [0b00000001] + [0]*(OUTPUT_SIZE-1)
-        plc.write_array(f"Assembly[{OUTPUT_ASSEMBLY}]", output_data)
+
+    triggered = False
+
+    def _trigger(plc):
+        nonlocal triggered
+        # Trigger กล้อง; a retry after a failed read only reads again so
+        # the camera is never fired twice
+        if not triggered:
+            output_data = [0b00000001] + [0]*(OUTPUT_SIZE-1)
+            plc.write_array(f"Assembly[{OUTPUT_ASSEMBLY}]", output_data)
+            triggered = True
         # อ่านผลลัพธ์
-        input_data = plc.read_array(f"Assembly[{INPUT_ASSEMBLY}]", INPUT_SIZE)
-        word4 = input_data[4]
-        overall_ok = bool(word4 & 0b00000001)
-        return overall_ok, input_data
+        return plc.read_array(f"Assembly[{INPUT_ASSEMBLY}]", INPUT_SIZE)
+
+    # Reuse an open session per IP instead of a new handshake per trigger
+    if pool is None:
+        pool = _cip_pool
+    input_data = pool.call(ip, _trigger)
+    # Bit 0 of element 4 is the overall judgement; decode the rest with
+    # iv2_result.decode_iv2_result when needed
+    overall_ok = bool(input_data[4] & 0b00000001)
+    return overall_ok, input_data
+
+
+T = TypeVar("T")
 
 
 @dataclass
@@ -39,14 +190,27 @@ class BaseCamera:
     name: str
     type: str
     status: str = "disconnected"
-    last_image: Optional[object] = None
+    buffer_size: int = 8
+    frames: FrameRing = field(init=False, repr=False)
+    # Set by CameraManager to run blocking calls on the camera's pinned worker
+    submit: Optional[Callable[[Callable[[], object]], Future]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        self.frames = FrameRing(self.buffer_size)
+
+    @property
+    def last_image(self) -> Optional[Frame]:
+        """Most recent frame held in the camera's ring buffer."""
+        return self.frames.latest()
 
     def connect(self) -> bool:  # pragma: no cover - base
         """Connect to the camera. Should be implemented by subclasses."""
         raise NotImplementedError
 
-    def capture(self) -> Path:  # pragma: no cover - base
-        """Capture an image and return the file path."""
+    def capture(self) -> Frame:  # pragma: no cover - base
+        """Capture an image into the ring buffer and return the frame."""
         raise NotImplementedError
 
     def disconnect(self) -> bool:  # pragma: no cover - base
@@ -54,6 +218,36 @@ class BaseCamera:
         self.status = "disconnected"
         return True
 
+    def probe(self) -> bool:
+        """Cheap liveness check used by :class:`CameraHealthMonitor`."""
+        return self.status == "connected"
+
+    async def _run_blocking(self, fn: Callable[[], T]) -> T:
+        """Await ``fn()`` on the pinned worker, or a helper thread when the
+        camera is not managed by a :class:`CameraManager`."""
+        if self.submit is None:
+            return await asyncio.to_thread(fn)
+        return await asyncio.wrap_future(self.submit(fn))
+
+    async def connect_async(self) -> bool:
+        """Connect without blocking the event loop.
+
+        The camera drivers are blocking, so :meth:`connect` still needs a
+        thread: the camera's pinned worker when it belongs to a
+        :class:`CameraManager`, a helper thread otherwise. The coroutine
+        only lets one event loop await many cameras concurrently.
+        """
+        return await self._run_blocking(self.connect)
+
+    async def capture_async(self) -> Frame:
+        """Capture without blocking the event loop.
+
+        Runs :meth:`capture` like :meth:`connect_async` runs
+        :meth:`connect`, so it never overlaps other work queued on the
+        camera's pinned worker.
+        """
+        return await self._run_blocking(self.capture)
+
 
 class USBCamera(BaseCamera):
     """Mock implementation of a USB camera."""
@@ -70,14 +264,17 @@ class USBCamera(BaseCamera):
             self.status = "disconnected"
         return self.status == "connected"
 
-    def capture(self) -> Path:
+    def probe(self) -> bool:
+        """Mark the camera disconnected when its device node disappears."""
+        if self.status == "connected" and not Path(self.device).exists():
+            self.status = "disconnected"
+        return self.status == "connected"
+
+    def capture(self) -> Frame:
         """Simulate capturing an image from a USB camera."""
         if self.status != "connected":
             raise RuntimeError("Camera not connected")
-        fd, path = tempfile.mkstemp(suffix=".jpg")
-        Path(path).write_bytes(b"usb image")
-        self.last_image = Path(path)
-        return Path(path)
+        return self.frames.push(b"usb image")
 
 
 class KeyenceCamera(BaseCamera):
@@ -94,14 +291,174 @@ class KeyenceCamera(BaseCamera):
         self.status = "connected"
         return True
 
-    def capture(self) -> Path:
+    def capture(self) -> Frame:
         """Simulate capturing an image from a Keyence camera."""
         if self.status != "connected":
             raise RuntimeError("Camera not connected")
-        fd, path = tempfile.mkstemp(suffix=".jpg")
-        Path(path).write_bytes(b"keyence image")
-        self.last_image = Path(path)
-        return Path(path)
+        return self.frames.push(b"keyence image")
+
+
+class SyntheticCamera(BaseCamera):
+    """Hardware-free camera producing frames of a given size and timing.
+
+    Each capture sleeps for ``latency_ms`` plus a random jitter drawn from
+    ``jitter_distribution`` (``"none"``, ``"uniform"``, ``"normal"`` or
+    ``"exponential"`` with scale ``jitter_ms``), then returns one of a few
+    pre-rendered gradient frames. With ``image_format="jpeg"`` the frames are
+    JPEG bytes like a real camera sends; ``"raw"`` returns RGB arrays.
+    Frames are rendered once, so capture cost is dominated by the simulated
+    latency rather than by image generation.
+    """
+
+    _VARIANTS = 8
+
+    def __init__(
+        self,
+        *,
+        resolution: Tuple[int, int] = (1920, 1080),
+        latency_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        jitter_distribution: str = "normal",
+        image_format: str = "jpeg",
+        seed: int | None = None,
+        **kwargs: object,
+    ) -> None:
+        super().__init__(**kwargs)
+        self.resolution = resolution
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.jitter_distribution = jitter_distribution
+        self.image_format = image_format
+        self._rng = random.Random(seed)
+        self._images: List[FrameData] = []
+        self._count = 0
+
+    def connect(self) -> bool:
+        self.status = "connected"
+        return True
+
+    def sample_latency(self) -> float:
+        """Return one simulated capture latency in seconds."""
+        jitter, dist = self.jitter_ms, self.jitter_distribution
+        if dist == "uniform":
+            delay = self.latency_ms + self._rng.uniform(-jitter, jitter)
+        elif dist == "normal":
+            delay = self.latency_ms + self._rng.gauss(0.0, jitter)
+        elif dist == "exponential" and jitter > 0:
+            delay = self.latency_ms + self._rng.expovariate(1.0 / jitter)
+        else:
+            delay = self.latency_ms
+        return max(0.0, delay) / 1000.0
+
+    def _render(self) -> List[FrameData]:
+        width, height = self.resolution
+        x = np.linspace(0, 255, width, dtype=np.uint8)
+        y = np.linspace(0, 255, height, dtype=np.uint8)[:, None]
+        images: List[FrameData] = []
+        for i in range(self._VARIANTS):
+            array = np.empty((height, width, 3), dtype=np.uint8)
+            array[..., 0] = x + i * 32
+            array[..., 1] = y
+            array[..., 2] = i * 32
+            array.flags.writeable = False
+            if self.image_format == "raw":
+                images.append(array)
+            else:
+                from PIL import Image
+
+                buf = io.BytesIO()
+                Image.fromarray(array).save(buf, format="JPEG", quality=85)
+                images.append(buf.getvalue())
+        return images
+
+    def capture(self) -> Frame:
+        """Wait for the simulated latency and return the next frame."""
+        if self.status != "connected":
+            raise RuntimeError("Camera not connected")
+        if not self._images:
+            self._images = self._render()
+        time.sleep(self.sample_latency())
+        data = self._images[self._count % len(self._images)]
+        self._count += 1
+        return self.frames.push(data, suffix=".png" if self.image_format == "raw" else ".jpg")
+
+
+class ReplayCamera(BaseCamera):
+    """Camera that plays back the images in ``directory`` in name order.
+
+    Captures are paced to at most ``fps`` frames per second. Frames keep a
+    reference to their source file, marked as not owned, so savers reflink
+    or copy it and the replay directory is never moved or linked into. When ``loop`` is ``False`` capture raises
+    :class:`RuntimeError` after the last image.
+    """
+
+    def __init__(
+        self,
+        *,
+        directory: str | Path,
+        fps: float | None = None,
+        loop: bool = True,
+        **kwargs: object,
+    ) -> None:
+        super().__init__(**kwargs)
+        self.directory = Path(directory)
+        self.fps = fps
+        self.loop = loop
+        self._files: List[Path] = []
+        self._index = 0
+        self._next_due = 0.0
+
+    def connect(self) -> bool:
+        """Scan ``directory`` for images; fail when there are none."""
+        if self.directory.is_dir():
+            self._files = sorted(
+                p for p in self.directory.iterdir() if p.suffix.lower() in REPLAY_SUFFIXES
+            )
+        else:
+            self._files = []
+        self._index = 0
+        self.status = "connected" if self._files else "disconnected"
+        return bool(self._files)
+
+    def capture(self) -> Frame:
+        """Return the next image, waiting to honour ``fps``."""
+        if self.status != "connected":
+            raise RuntimeError("Camera not connected")
+        if self._index >= len(self._files):
+            if not self.loop:
+                raise RuntimeError("Replay finished")
+            self._index = 0
+        if self.fps:
+            now = time.monotonic()
+            if self._next_due > now:
+                time.sleep(self._next_due - now)
+            self._next_due = max(self._next_due, now) + 1.0 / self.fps
+        path = self._files[self._index]
+        self._index += 1
+        return self.frames.push(
+            path.read_bytes(), suffix=path.suffix.lower(), path=path, owned=False
+        )
+
+
+@dataclass(frozen=True)
+class _CameraIndex:
+    """Immutable lookup tables over the managed cameras."""
+
+    cameras: Tuple[BaseCamera, ...]
+    by_id: Dict[int, BaseCamera]
+    by_type: Dict[str, Tuple[BaseCamera, ...]]
+
+    @classmethod
+    def build(cls, cameras: Iterable[BaseCamera]) -> "_CameraIndex":
+        cams = tuple(cameras)
+        by_type: Dict[str, List[BaseCamera]] = {}
+        for cam in cams:
+            by_type.setdefault(cam.type, []).append(cam)
+        return cls(
+            cameras=cams,
+            by_id={cam.id: cam for cam in cams},
+            by_type={t: tuple(group) for t, group in by_type.items()},
+        )
 
 
 class CameraManager:
@@ -111,21 +468,157 @@ class CameraManager:
         loader = ConfigLoader(config_path)
         config = loader.load_config()
         self.auto_reconnect = bool(config.get("autoReconnect", False))
+        self.frame_buffer_size = int(config.get("frameBufferSize", 8))
+        self.capture_timeout: float | None = config.get("captureTimeout")
+        self.connect_timeout: float | None = config.get("connectTimeout")
+        self.save_strategy = str(config.get("saveStrategy", "hardlink"))
+        if self.save_strategy not in SAVE_STRATEGIES:
+            raise ValueError(f"Unknown save strategy: {self.save_strategy}")
         configs = load_camera_objects(config_path)
-        self.cameras: List[BaseCamera] = [self._create_camera(cfg) for cfg in configs]
+        self._index_lock = threading.Lock()
+        self._index = _CameraIndex.build(self._create_camera(cfg) for cfg in configs)
+        self._workers: Dict[int, ThreadPoolExecutor] = {}
+        self._workers_lock = threading.Lock()
+        self._inflight: Dict[int, Future] = {}
+        self.health_monitor: CameraHealthMonitor | None = None
+        self.transport: FrameTransport | None = None
+        # When set, each camera's capture time is recorded as "camera_capture"
+        self.instrumentation: Instrumentation | None = None
+        self._previews: Dict[Tuple[int, Tuple[int, int]], Preview] = {}
+        self._previews_lock = threading.Lock()
+        self._streams: List[Tuple[int, FrameStream]] = []
+        self._streams_lock = threading.Lock()
 
-    @staticmethod
-    def _create_camera(cfg: CameraConfig) -> BaseCamera:
+    def __enter__(self) -> "CameraManager":
+        self.start()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.shutdown()
+
+    # Worker lifecycle -------------------------------------------------
+    def start(self) -> None:
+        """Start one long-lived worker thread per camera.
+
+        Workers are reused by :meth:`capture_images`, :meth:`connect_all` and
+        :meth:`check_all_statuses`. Calling ``start`` is optional; workers are
+        created lazily on first use.
+        """
+        for cam in self.cameras:
+            self._worker(cam)
+
+    def shutdown(self, *, wait: bool = True) -> None:
+        """Stop the health monitor, open streams and all camera workers.
+
+        Workers are recreated on next use.
+        """
+        self.stop_health_monitor()
+        self._close_streams()
+        with self._workers_lock:
+            workers = list(self._workers.values())
+            self._workers.clear()
+        for worker in workers:
+            worker.shutdown(wait=wait)
+
+    def _worker(self, cam: BaseCamera) -> ThreadPoolExecutor:
+        """Return the worker pinned to ``cam``, creating it when missing."""
+        with self._workers_lock:
+            worker = self._workers.get(cam.id)
+            if worker is None:
+                worker = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix=f"camera-{cam.id}"
+                )
+                self._workers[cam.id] = worker
+            return worker
+
+    def _submit(self, cam: BaseCamera, fn, *args: object) -> Future:
+        """Run ``fn(*args)`` on the worker pinned to ``cam``."""
+        return self._worker(cam).submit(fn, *args)
+
+    def _stop_worker(self, cam_id: int) -> None:
+        with self._workers_lock:
+            worker = self._workers.pop(cam_id, None)
+        if worker is not None:
+            worker.shutdown(wait=False)
+
+    def _create_camera(self, cfg: CameraConfig) -> BaseCamera:
+        cam = self._build_camera(cfg)
+        cam.submit = lambda fn: self._submit(cam, fn)
+        return cam
+
+    def _build_camera(self, cfg: CameraConfig) -> BaseCamera:
+        common = {
+            "id": cfg.id,
+            "name": cfg.name,
+            "type": cfg.type,
+            "buffer_size": cfg.buffer_size or self.frame_buffer_size,
+        }
         if cfg.type == "usb":
-            return USBCamera(id=cfg.id, name=cfg.name, type=cfg.type, device=cfg.device or "")
+            return USBCamera(device=cfg.device or "", **common)
         if cfg.type == "keyence":
-            return KeyenceCamera(id=cfg.id, name=cfg.name, type=cfg.type, ip=cfg.ip or "", port=cfg.port or 0)
+            return KeyenceCamera(ip=cfg.ip or "", port=cfg.port or 0, **common)
+        if cfg.type == "synthetic":
+            return SyntheticCamera(
+                resolution=parse_resolution(cfg.resolution or "1920x1080"),
+                latency_ms=float(cfg.latency_ms or 0.0),
+                jitter_ms=float(cfg.jitter_ms or 0.0),
+                jitter_distribution=cfg.jitter_distribution or "normal",
+                image_format=cfg.image_format or "jpeg",
+                seed=cfg.seed,
+                **common,
+            )
+        if cfg.type == "replay":
+            return ReplayCamera(
+                directory=cfg.directory or "",
+                fps=cfg.fps,
+                loop=True if cfg.loop is None else bool(cfg.loop),
+                **common,
+            )
         raise ValueError(f"Unsupported camera type: {cfg.type}")
 
-    def connect_all(self) -> None:
-        """Connect every camera managed by this instance."""
-        for cam in self.cameras:
-            cam.connect()
+    def connect_all(self, *, timeout: float | None = None) -> Dict[int, ConnectResult]:
+        """Connect every camera concurrently and report the outcome.
+
+        Each camera connects on its own worker, so startup is bounded by the
+        slowest camera rather than the sum of all of them.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Seconds to wait for each camera. Defaults to the
+            ``connectTimeout`` config value; no limit when unset. Cameras
+            still connecting afterwards are reported as ``"timeout"``.
+
+        Returns
+        -------
+        dict
+            Mapping of camera id to :class:`ConnectResult`.
+        """
+        if timeout is None:
+            timeout = self.connect_timeout
+
+        start = time.monotonic()
+        future_map = {self._submit(cam, _timed_connect, cam): cam for cam in self.cameras}
+        done, not_done = wait(future_map, timeout=timeout)
+
+        report: Dict[int, ConnectResult] = {}
+        for future in not_done:
+            cam = future_map[future]
+            future.cancel()
+            logging.error("Connecting camera %s timed out", cam.id)
+            report[cam.id] = ConnectResult(cam.id, "timeout", time.monotonic() - start)
+        for future in done:
+            cam = future_map[future]
+            try:
+                ok, duration = future.result()
+            except Exception as exc:
+                logging.error("Failed to connect camera %s: %s", cam.id, exc)
+                report[cam.id] = ConnectResult(
+                    cam.id, "error", time.monotonic() - start, error=str(exc)
+                )
+                continue
+            report[cam.id] = ConnectResult(cam.id, "connected" if ok else "failed", duration)
+        return {cam.id: report[cam.id] for cam in future_map.values()}
 
     def connect_camera(self, cam_id: int) -> bool:
         """Connect the camera with the given ``cam_id`` if found."""
@@ -202,56 +695,123 @@ class CameraManager:
         except Exception as exc:  # pragma: no cover - validation error
             return f"error: {exc}"
 
-        if any(cam.id == config.get("id") for cam in self.cameras):
+        if config.get("id") in self._index.by_id:
             return "error: camera id already exists"
 
         try:
-            cfg = CameraConfig(
-                id=config.get("id"),
-                type=config.get("type"),
-                name=config.get("name"),
-                device=config.get("device"),
-                ip=config.get("ip"),
-                port=config.get("port"),
-            )
-            cam = self._create_camera(cfg)
+            cam = self._create_camera(CameraConfig.from_dict(config))
         except Exception as exc:  # pragma: no cover - creation error
             return f"error: {exc}"
 
-        self.cameras.append(cam)
+        with self._index_lock:
+            if cam.id in self._index.by_id:
+                return "error: camera id already exists"
+            self._index = _CameraIndex.build(self._index.cameras + (cam,))
         return "added"
 
     def remove_camera(self, cam_id: int) -> str:
         """Remove the camera with ``cam_id`` from the manager."""
 
-        for i, cam in enumerate(self.cameras):
-            if cam.id == cam_id:
-                self.cameras.pop(i)
-                return "removed"
-        return f"error: camera {cam_id} not found"
+        with self._index_lock:
+            if cam_id not in self._index.by_id:
+                return f"error: camera {cam_id} not found"
+            self._index.by_id[cam_id].submit = None
+            self._index = _CameraIndex.build(
+                cam for cam in self._index.cameras if cam.id != cam_id
+            )
+        self._close_streams(cam_id)
+        self._stop_worker(cam_id)
+        self._inflight.pop(cam_id, None)
+        with self._previews_lock:
+            for key in [k for k in self._previews if k[0] == cam_id]:
+                del self._previews[key]
+        return "removed"
+
+    @property
+    def cameras(self) -> Tuple[BaseCamera, ...]:
+        """Immutable snapshot of the managed cameras in configuration order.
+
+        The snapshot is replaced, never mutated, by :meth:`add_camera` and
+        :meth:`remove_camera`, so it is safe to iterate from any thread.
+        """
+        return self._index.cameras
 
     def get_camera(self, cam_id: int) -> Optional[BaseCamera]:
         """Return camera instance with ``cam_id`` or ``None``."""
-        for cam in self.cameras:
-            if cam.id == cam_id:
-                return cam
-        return None
+        return self._index.by_id.get(cam_id)
+
+    def get_cameras_by_type(self, cam_type: str) -> Tuple[BaseCamera, ...]:
+        """Return all cameras of ``cam_type`` (e.g. ``"usb"``)."""
+        return self._index.by_type.get(cam_type, ())
+
+    def attach_transport(self, transport: FrameTransport | None) -> None:
+        """Publish every captured frame to ``transport`` (``None`` detaches).
+
+        This lets the UI run in another process and map the newest frames
+        from shared memory. See :mod:`frame_transport`.
+        """
+        self.transport = transport
+
+    def _publish(self, cam: BaseCamera, frame: Frame) -> None:
+        if self.transport is None:
+            return
+        try:
+            self.transport.publish(cam.id, frame.data, timestamp=frame.timestamp)
+        except Exception as exc:  # pragma: no cover - error path
+            logging.error("Failed to publish frame from camera %s: %s", cam.id, exc)
+
+    def start_health_monitor(self, **kwargs: object) -> "CameraHealthMonitor":
+        """Start a background :class:`CameraHealthMonitor` for this manager.
+
+        Keyword arguments are passed to :class:`CameraHealthMonitor`. While it
+        runs, :meth:`check_all_statuses` returns its cached snapshot.
+        """
+        self.stop_health_monitor()
+        self.health_monitor = CameraHealthMonitor(self, **kwargs)
+        self.health_monitor.start()
+        return self.health_monitor
+
+    def stop_health_monitor(self) -> None:
+        """Stop the background health monitor if one is running."""
+        if self.health_monitor is not None:
+            self.health_monitor.stop()
+            self.health_monitor = None
 
     def check_all_statuses(self) -> List[Dict[str, str]]:
         """Return status information for all cameras.
 
-        If ``auto_reconnect`` is enabled, attempt to reconnect any camera that
-        is not currently connected. Errors are logged when a connection fails.
+        When a health monitor is running its cached snapshot is returned
+        without any I/O. Otherwise, if ``auto_reconnect`` is enabled, attempt
+        to reconnect any camera that is not currently connected. Errors are
+        logged when a connection fails.
         """
-        statuses: List[Dict[str, str]] = []
-        for cam in self.cameras:
-            if cam.status != "connected" and self.auto_reconnect:
-                if not cam.connect():
+        if self.health_monitor is not None and self.health_monitor.running:
+            return self.health_monitor.snapshot()
+        cameras = self.cameras
+        if self.auto_reconnect:
+            future_map = {
+                self._submit(cam, cam.connect): cam
+                for cam in cameras
+                if cam.status != "connected"
+            }
+            for future in as_completed(future_map):
+                cam = future_map[future]
+                try:
+                    ok = future.result()
+                except Exception as exc:  # pragma: no cover - error path
+                    logging.error("Failed to connect camera %s: %s", cam.id, exc)
+                    continue
+                if not ok:
                     logging.error("Failed to connect camera %s", cam.id)
-            statuses.append({"id": cam.id, "status": cam.status})
-        return statuses
+        return [{"id": cam.id, "status": cam.status} for cam in cameras]
 
-    def capture_images(self, cam_id: Optional[int] = None) -> Dict[int, Optional[Path]]:
+    def capture_images(
+        self,
+        cam_id: Optional[int] = None,
+        *,
+        timeout: float | None = None,
+        per_camera_timeout: float | None = None,
+    ) -> Dict[int, Union[Frame, None, _TimedOut]]:
         """Capture an image from one camera or all cameras.
 
         Parameters
@@ -259,12 +819,24 @@ class CameraManager:
         cam_id : int, optional
             When provided, only the camera matching ``cam_id`` will be used.
             When ``None``, all cameras are triggered.
+        timeout : float, optional
+            Overall deadline in seconds. Frames that have not arrived by then
+            are reported as :data:`TIMED_OUT`. Defaults to the
+            ``captureTimeout`` config value; no deadline when unset.
+        per_camera_timeout : float, optional
+            Seconds each camera gets, measured from when its capture starts
+            on the camera's worker. A capture still queued behind other work
+            on that worker (a probe or stream capture) times out this long
+            after the call.
 
         Returns
         -------
         dict
-            Mapping of camera id to captured file path or ``None`` when the
-            capture failed.
+            Mapping of camera id to the captured :class:`Frame`, ``None``
+            when the capture failed, or :data:`TIMED_OUT` when the camera
+            missed its deadline. Late frames are dropped from the camera's
+            ring buffer and cameras still busy with a late capture are not
+            triggered again.
         """
 
         if cam_id is not None:
@@ -273,27 +845,150 @@ class CameraManager:
                 raise ValueError(f"Camera {cam_id} not found")
             cameras = [cam]
         else:
-            cameras = list(self.cameras)
+            cameras = self.cameras
 
-        results: Dict[int, Optional[Path]] = {}
-        with ThreadPoolExecutor() as executor:
-            future_map = {executor.submit(cam.capture): cam for cam in cameras}
-            for future in as_completed(future_map):
-                cam = future_map[future]
-                try:
-                    results[cam.id] = future.result()
-                except Exception as exc:  # pragma: no cover - error path
-                    logging.error("Failed to capture image from camera %s: %s", cam.id, exc)
-                    results[cam.id] = None
+        if timeout is None:
+            timeout = self.capture_timeout
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        results, jobs = self._start_captures(cameras)
+        done: Set[Future] = set()
+        pending = set(jobs)
+        while pending:
+            pending, remaining = self._expire_late(
+                pending, jobs, done, results, deadline, per_camera_timeout
+            )
+            if not pending:
+                break
+            finished, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+            done |= finished
+        self._collect(done, jobs, results)
         return results
 
+    async def capture_images_async(
+        self,
+        cam_id: Optional[int] = None,
+        *,
+        timeout: float | None = None,
+        per_camera_timeout: float | None = None,
+    ) -> Dict[int, Union[Frame, None, _TimedOut]]:
+        """Asynchronous counterpart of :meth:`capture_images`.
+
+        Captures run on each camera's pinned worker exactly like
+        :meth:`capture_images`, so they never overlap a synchronous
+        capture, a stream or a health probe of the same camera, and a hung
+        camera ties up only its own worker. The event loop awaits them
+        without blocking, but the drivers are blocking, so each camera still
+        needs its own worker thread. ``timeout`` and ``per_camera_timeout`` behave as in
+        :meth:`capture_images`.
+        """
+
+        if cam_id is not None:
+            cam = self.get_camera(cam_id)
+            if cam is None:
+                raise ValueError(f"Camera {cam_id} not found")
+            cameras = [cam]
+        else:
+            cameras = self.cameras
+
+        if timeout is None:
+            timeout = self.capture_timeout
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        results, jobs = self._start_captures(cameras)
+        waiters = {asyncio.wrap_future(future): future for future in jobs}
+        for waiter in waiters:
+            # Results are read from the concurrent futures; mark the
+            # wrappers' exceptions retrieved so asyncio does not warn
+            waiter.add_done_callback(lambda w: w.cancelled() or w.exception())
+        done: Set[Future] = set()
+        pending = set(jobs)
+        while pending:
+            pending, remaining = self._expire_late(
+                pending, jobs, done, results, deadline, per_camera_timeout
+            )
+            if not pending:
+                break
+            finished, _ = await asyncio.wait(
+                [w for w, f in waiters.items() if f in pending],
+                timeout=remaining,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            for waiter in finished:
+                pending.discard(waiters[waiter])
+                done.add(waiters[waiter])
+        self._collect(done, jobs, results)
+        return results
+
+    def _start_captures(
+        self, cameras: Iterable[BaseCamera]
+    ) -> Tuple[Dict[int, Union[Frame, None, _TimedOut]], Dict[Future, _CaptureJob]]:
+        """Submit a capture job to the worker of every camera not still busy
+        with a late capture."""
+        results: Dict[int, Union[Frame, None, _TimedOut]] = {}
+        jobs: Dict[Future, _CaptureJob] = {}
+        for cam in cameras:
+            busy = self._inflight.get(cam.id)
+            if busy is not None and not busy.done():
+                logging.warning("Camera %s still busy with a late capture", cam.id)
+                results[cam.id] = TIMED_OUT
+                continue
+            job = _CaptureJob(cam, self.instrumentation)
+            future = self._submit(cam, job)
+            self._inflight[cam.id] = future
+            jobs[future] = job
+        return results, jobs
+
+    @staticmethod
+    def _expire_late(
+        pending: Set[Future],
+        jobs: Dict[Future, _CaptureJob],
+        done: Set[Future],
+        results: Dict[int, Union[Frame, None, _TimedOut]],
+        deadline: float | None,
+        per_camera_timeout: float | None,
+    ) -> Tuple[Set[Future], float | None]:
+        """Time out the late jobs in ``pending``.
+
+        Returns the jobs still pending and the seconds until the next one
+        is due.
+        """
+        late, remaining = _late_jobs(pending, jobs, deadline, per_camera_timeout)
+        for future in late:
+            job = jobs[future]
+            if future.cancel() or job.expire():
+                logging.error("Capture from camera %s timed out", job.cam.id)
+                results[job.cam.id] = TIMED_OUT
+            else:  # finished right at the deadline
+                done.add(future)
+        return pending.difference(late), remaining
+
+    def _collect(
+        self,
+        done: Iterable[Future],
+        jobs: Dict[Future, _CaptureJob],
+        results: Dict[int, Union[Frame, None, _TimedOut]],
+    ) -> None:
+        for future in done:
+            cam = jobs[future].cam
+            try:
+                results[cam.id] = future.result()
+            except Exception as exc:  # pragma: no cover - error path
+                logging.error("Failed to capture image from camera %s: %s", cam.id, exc)
+                results[cam.id] = None
+            else:
+                self._publish(cam, results[cam.id])
+
     def get_latest_image(
-        self, cam_id: int, *, as_array: bool = False
-    ) -> Optional[Union[Path, "np.ndarray"]]:
-        """Return the most recently captured image for ``cam_id``.
+        self, cam_id: int, *, as_array: bool = False, pool: BufferPool | None = None
+    ) -> Optional[Union[Frame, "np.ndarray"]]:
+        """Return the most recently captured frame for ``cam_id``.
 
+        The frame is read straight from the camera's in-memory ring buffer.
         When ``as_array`` is ``True`` the image is returned as a NumPy array.
-        ``numpy`` and ``Pillow`` must be installed for this option.
+        ``numpy`` and ``Pillow`` must be installed for this option. Encoded
+        frames are decoded into a buffer from ``pool`` when given; the caller
+        returns it with ``pool.release`` once done.
         ``None`` is returned when the camera has not captured an image.
         """
 
@@ -301,22 +996,91 @@ class CameraManager:
         if cam is None:
             raise ValueError(f"Camera {cam_id} not found")
 
-        path = cam.last_image
-        if path is None or not Path(path).is_file():
+        frame = cam.last_image
+        if frame is None:
             return None
-
-        image_path = Path(path)
         if not as_array:
-            return image_path
+            return frame
+        return _frame_to_array(frame.data, pool)
 
-        try:  # Lazy import only when needed
-            from PIL import Image
-            import numpy as np
-        except Exception as exc:  # pragma: no cover - optional dep
-            raise ImportError("numpy and Pillow are required for as_array") from exc
+    def stream(
+        self,
+        cam_id: int,
+        *,
+        fps: float | None = None,
+        maxsize: int = 4,
+        policy: str = "drop-oldest",
+    ) -> FrameStream:
+        """Start streaming frames from ``cam_id`` and return the stream.
 
-        with Image.open(image_path) as img:
-            return np.array(img)
+        Captures run on the camera's pinned worker at up to ``fps`` frames
+        per second and are queued for the consumer, which iterates the
+        returned :class:`~frame_stream.FrameStream` synchronously or with
+        ``async for``. When the consumer falls behind, frames are dropped
+        according to ``policy`` (``"drop-oldest"`` or ``"drop-newest"``) and
+        counted in ``stream.stats()``. Close the stream when done; open
+        streams are closed by :meth:`shutdown`.
+        """
+
+        cam = self.get_camera(cam_id)
+        if cam is None:
+            raise ValueError(f"Camera {cam_id} not found")
+        stream = FrameStream(
+            lambda: self._submit(cam, cam.capture),
+            fps=fps,
+            maxsize=maxsize,
+            policy=policy,
+            on_frame=lambda frame: self._publish(cam, frame),
+            name=f"camera-{cam_id}-stream",
+        )
+        with self._streams_lock:
+            self._streams = [(cid, s) for cid, s in self._streams if not s.closed]
+            self._streams.append((cam_id, stream))
+        stream.start()
+        return stream
+
+    def _close_streams(self, cam_id: int | None = None) -> None:
+        with self._streams_lock:
+            closing = [s for cid, s in self._streams if cam_id is None or cid == cam_id]
+            self._streams = [
+                (cid, s) for cid, s in self._streams if cam_id is not None and cid != cam_id
+            ]
+        for stream in closing:
+            stream.close()
+
+    def get_preview(
+        self, cam_id: int, size: Tuple[int, int] = (240, 180)
+    ) -> Optional[Preview]:
+        """Return a downscaled preview of the latest frame of ``cam_id``.
+
+        JPEG frames are decoded with Pillow's draft mode, which lets the
+        decoder scale by 1/2, 1/4 or 1/8 instead of producing a full
+        resolution image first. The result fits in ``size`` and is cached
+        per camera and size until a new frame arrives. ``None`` is returned
+        when there is no frame or it cannot be decoded.
+        """
+
+        cam = self.get_camera(cam_id)
+        if cam is None:
+            raise ValueError(f"Camera {cam_id} not found")
+        frame = cam.last_image
+        if frame is None:
+            return None
+
+        key = (cam_id, (int(size[0]), int(size[1])))
+        with self._previews_lock:
+            cached = self._previews.get(key)
+        if cached is not None and cached.seq == frame.seq:
+            return cached
+
+        try:
+            preview = _make_preview(frame, key[1])
+        except Exception as exc:
+            logging.debug("Cannot build preview for camera %s: %s", cam_id, exc)
+            return None
+        with self._previews_lock:
+            self._previews[key] = preview
+        return preview
 
     def save_latest_image(
         self,
@@ -326,11 +1090,23 @@ class CameraManager:
         serial: str | None = None,
         status: str | None = None,
         timestamp: datetime | None = None,
+        strategy: str | None = None,
+        writer: ImageWriter | None = None,
     ) -> Path:
-        """Save the most recent image to ``dest_dir`` and return the path."""
+        """Write the most recent frame to ``dest_dir`` and return the path.
+
+        In-memory frames are written straight to their final path. Frames
+        backed by a file are placed with ``strategy`` (``"move"``,
+        ``"hardlink"``, ``"reflink"`` or ``"copy"``), defaulting to the
+        ``saveStrategy`` config value. See :func:`image_writer.save_frame`.
+
+        When ``writer`` is given the frame is queued on that
+        :class:`~image_writer.ImageWriter` and the destination path is
+        returned before the file has been written.
+        """
 
-        image_path = self.get_latest_image(cam_id)
-        if image_path is None:
+        frame = self.get_latest_image(cam_id)
+        if frame is None:
             raise RuntimeError("No image available")
 
         dest = Path(dest_dir)
@@ -342,8 +1118,251 @@ class CameraManager:
 
         parts = [p for p in [serial, status, ts] if p]
         filename = "_".join(parts) if parts else ts
-        filename += Path(image_path).suffix
+        filename += frame.suffix
+
+        strategy = strategy or self.save_strategy
+        if writer is not None:
+            return writer.submit(frame, dest / filename, strategy=strategy)
+        return save_frame(frame, dest / filename, strategy=strategy)
+
+
+def _frame_to_array(data: FrameData, pool: BufferPool | None = None) -> "np.ndarray":
+    """Return ``data`` as a NumPy array, decoding encoded bytes if needed."""
+    if isinstance(data, np.ndarray):
+        return data
+    try:  # Lazy import only when needed
+        from PIL import Image
+    except Exception as exc:  # pragma: no cover - optional dep
+        raise ImportError("Pillow is required for as_array") from exc
+
+    with Image.open(io.BytesIO(data)) as img:
+        if pool is None:
+            return np.array(img)
+        return _decode_into(img, pool)
+
+
+def _decode_into(img: "Image.Image", pool: BufferPool) -> "np.ndarray":
+    """Decode ``img`` into an array from ``pool``.
+
+    Uses :func:`_pack_into` when this Pillow still provides the internals it
+    needs, and otherwise copies through the public ``np.asarray`` route.
+    """
+    img.load()
+    try:
+        return _pack_into(img, pool)
+    except AttributeError:
+        logging.debug("Pillow internals unavailable; decoding through np.asarray")
+    decoded = np.asarray(img)
+    out = pool.acquire(decoded.shape, decoded.dtype)
+    np.copyto(out, decoded)
+    return out
+
+
+def _pack_into(img: "Image.Image", pool: BufferPool) -> "np.ndarray":
+    """Pack the pixels of a loaded ``img`` straight into a pooled array.
+
+    Pillow packs the pixels chunk by chunk, the same way ``Image.tobytes``
+    does, but each chunk lands directly in the pooled array instead of an
+    intermediate full-frame ``bytes`` object. This relies on private Pillow
+    names and raises :class:`AttributeError` when they are missing.
+    """
+    from PIL import Image, ImageFile
+
+    conv_type_shape, getencoder, core = Image._conv_type_shape, Image._getencoder, img.im
+    shape, typestr = conv_type_shape(img)
+    out = pool.acquire(shape, np.dtype(typestr))
+    if out.size == 0:
+        return out
+    try:
+        # Mode "1" is exposed to NumPy as one bool per pixel
+        encoder = getencoder(img.mode, "raw", "L" if img.mode == "1" else img.mode)
+        encoder.setimage(core, (0, 0) + img.size)
+        target = memoryview(out).cast("B")
+        bufsize = max(ImageFile.MAXBLOCK, img.width * 4)
+        offset = 0
+        while True:
+            _, errcode, chunk = encoder.encode(bufsize)
+            target[offset : offset + len(chunk)] = chunk
+            offset += len(chunk)
+            if errcode:
+                break
+        if errcode < 0:
+            raise RuntimeError(f"encoder error {errcode} while decoding frame")
+    except BaseException:
+        pool.release(out)
+        raise
+    return out
+
+
+def _make_preview(frame: Frame, size: Tuple[int, int]) -> Preview:
+    """Decode ``frame`` at reduced resolution and return an RGB888 preview."""
+    from PIL import Image
+
+    if isinstance(frame.data, np.ndarray):
+        img = Image.fromarray(frame.data)
+    else:
+        img = Image.open(io.BytesIO(frame.data))
+        img.draft("RGB", size)  # JPEG: decode at 1/2, 1/4 or 1/8 scale
+    with img:
+        img.thumbnail(size)
+        rgb = img if img.mode == "RGB" else img.convert("RGB")
+        return Preview(rgb.tobytes(), rgb.width, rgb.height, frame.seq)
+
+
+class CameraHealthMonitor:
+    """Probe cameras in the background and cache their status.
+
+    Each camera is probed on its pinned worker, so probes never overlap a
+    capture on the same device. Healthy cameras are probed every
+    ``interval`` seconds. Failing cameras back off exponentially up to
+    ``max_backoff`` with random ``jitter`` so a rack of dead cameras is not
+    retried in lockstep. Disconnected cameras are reconnected when
+    ``reconnect`` is enabled.
+
+    Status changes are delivered to callbacks registered with
+    :meth:`subscribe` and put on :attr:`events` as
+    ``(cam_id, old_status, new_status)`` tuples. Readers call
+    :meth:`snapshot`, which never blocks on I/O.
+
+    Parameters
+    ----------
+    manager : CameraManager
+        Manager owning the cameras and their workers.
+    interval : float, optional
+        Probe period for healthy cameras in seconds. Defaults to ``1.0``.
+    max_backoff : float, optional
+        Upper bound of the retry delay for failing cameras. Defaults to ``30``.
+    jitter : float, optional
+        Relative random jitter applied to every delay. Defaults to ``0.1``.
+    probe_timeout : float, optional
+        Seconds to wait for a single probe. Defaults to ``5``.
+    reconnect : bool, optional
+        Reconnect disconnected cameras. Defaults to ``manager.auto_reconnect``.
+    """
+
+    def __init__(
+        self,
+        manager: CameraManager,
+        *,
+        interval: float = 1.0,
+        max_backoff: float = 30.0,
+        jitter: float = 0.1,
+        probe_timeout: float = 5.0,
+        reconnect: bool | None = None,
+    ) -> None:
+        self.manager = manager
+        self.interval = interval
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.probe_timeout = probe_timeout
+        self.reconnect = manager.auto_reconnect if reconnect is None else reconnect
+        self.events: "queue.Queue[tuple[int, str, str]]" = queue.Queue()
+        self._callbacks: List = []
+        self._status: Dict[int, str] = {cam.id: cam.status for cam in manager.cameras}
+        self._failures: Dict[int, int] = {}
+        self._next_due: Dict[int, float] = {}
+        self._pending: Dict[int, Future] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start the background probing thread."""
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="camera-health-monitor", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Stop probing and wait for the thread to exit."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def subscribe(self, callback) -> None:
+        """Call ``callback(cam_id, old_status, new_status)`` on every change."""
+        self._callbacks.append(callback)
+
+    def snapshot(self) -> List[Dict[str, str]]:
+        """Return the cached status of every camera."""
+        with self._lock:
+            return [{"id": cid, "status": status} for cid, status in self._status.items()]
+
+    def delay_for(self, cam_id: int) -> float:
+        """Return the delay before the next probe of ``cam_id``."""
+        failures = self._failures.get(cam_id, 0)
+        base = min(self.max_backoff, self.interval * (2 ** failures)) if failures else self.interval
+        return base * (1 + random.uniform(-self.jitter, self.jitter))
+
+    def probe_once(self) -> None:
+        """Probe every camera that is due and publish status changes."""
+        now = time.monotonic()
+        cameras = self.manager.cameras
+        known = {cam.id for cam in cameras}
+        with self._lock:
+            for cid in list(self._status):
+                if cid not in known:
+                    del self._status[cid]
+                    self._failures.pop(cid, None)
+                    self._next_due.pop(cid, None)
+                    self._pending.pop(cid, None)
+
+        futures: Dict[Future, BaseCamera] = {}
+        for cam in cameras:
+            if self._next_due.get(cam.id, 0.0) > now:
+                continue
+            pending = self._pending.get(cam.id)
+            if pending is not None and not pending.done():
+                continue  # worker still stuck on an earlier probe or capture
+            future = self.manager._submit(cam, self._probe, cam)
+            self._pending[cam.id] = future
+            futures[future] = cam
+        done, not_done = wait(futures, timeout=self.probe_timeout)
+        for future, cam in futures.items():
+            healthy = False
+            if future in done:
+                try:
+                    healthy = future.result()
+                except Exception as exc:
+                    logging.error("Health probe of camera %s failed: %s", cam.id, exc)
+            else:
+                logging.error("Health probe of camera %s timed out", cam.id)
+            self._failures[cam.id] = 0 if healthy else self._failures.get(cam.id, 0) + 1
+            self._next_due[cam.id] = time.monotonic() + self.delay_for(cam.id)
+            self._publish(cam.id, cam.status)
+
+    def _probe(self, cam: BaseCamera) -> bool:
+        if cam.probe():
+            return True
+        if self.reconnect and cam.connect():
+            logging.info("Reconnected camera %s", cam.id)
+            return True
+        return False
+
+    def _publish(self, cam_id: int, status: str) -> None:
+        with self._lock:
+            old = self._status.get(cam_id)
+            if old == status:
+                return
+            self._status[cam_id] = status
+        self.events.put((cam_id, old, status))
+        for callback in list(self._callbacks):
+            try:
+                callback(cam_id, old, status)
+            except Exception as exc:  # pragma: no cover - callback error
+                logging.error("Health monitor callback failed: %s", exc)
 
-        final_path = dest / filename
-        shutil.copy(image_path, final_path)
-        return final_path
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self.probe_once()
+            now = time.monotonic()
+            next_due = min(self._next_due.values(), default=now + self.interval)
+            self._stop.wait(max(0.0, min(next_due - now, self.interval)))
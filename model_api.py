@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 from model_selector import ModelSelector
 from serial_mapping import SerialMappingManager
@@ -29,6 +30,21 @@ def reload_mapping(config_path: str | Path | None = None) -> None:
     _load()
 
 
+@contextmanager
+def temporary_mapping(config_path: str | Path) -> Iterator[None]:
+    """Use the mapping from ``config_path`` within a ``with`` block.
+
+    The previously loaded path and mapping are restored on exit.
+    """
+    global _config_path, _mapping_manager, _selector
+    saved = (_config_path, _mapping_manager, _selector)
+    reload_mapping(config_path)
+    try:
+        yield
+    finally:
+        _config_path, _mapping_manager, _selector = saved
+
+
 def select_model(serial: str, *, unknown: Optional[str] = None) -> Optional[str]:
     """Return the model name for ``serial`` using the loaded mapping."""
     if _selector is None:
@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Tuple, Optional, Union, Callable
+from typing import Any, Tuple, Optional, Union, Callable
 import tempfile
 
 from PIL import Image  # type: ignore    
 import numpy as np  # type: ignore
+
+from buffer_pool import BufferPool
+from image_encoder import FrameEncoder, format_for_path
     
 
 try:
@@ -22,10 +25,30 @@ except Exception:
 
 
 class ScreenCapture:
-    """Capture screenshots of the desktop or application windows."""
+    """Capture screenshots of the desktop or application windows.
+
+    Parameters
+    ----------
+    encoder : FrameEncoder, optional
+        When provided, ``to_file`` captures are encoded in its worker
+        processes instead of the calling thread.
+    pool : BufferPool, optional
+        When provided, ``as_numpy`` captures are converted straight into a
+        pooled array. Return it with ``pool.release`` when done.
+    sct : mss.mss, optional
+        Screen grabber to use. Defaults to a new ``mss.mss()`` instance.
+    """
 
-    def __init__(self) -> None:
-        self._sct = mss.mss()
+    def __init__(
+        self,
+        *,
+        encoder: FrameEncoder | None = None,
+        pool: BufferPool | None = None,
+        sct: Any = None,
+    ) -> None:
+        self._sct = sct if sct is not None else mss.mss()
+        self.encoder = encoder
+        self.pool = pool
 
     # Internal helpers -------------------------------------------------
     def _grab(self, region: dict) -> Image.Image:
@@ -33,6 +56,15 @@ class ScreenCapture:
         img = self._sct.grab(region)
         return Image.frombytes("RGB", img.size, img.bgra, "raw", "BGRX")
 
+    def _grab_array(self, region: dict) -> np.ndarray:
+        """Return an RGB array for ``region`` in a buffer from :attr:`pool`."""
+        img = self._sct.grab(region)
+        width, height = img.size
+        bgra = np.frombuffer(img.bgra, dtype=np.uint8).reshape(height, width, 4)
+        out = self.pool.acquire((height, width, 3), np.uint8)
+        out[...] = bgra[..., 2::-1]
+        return out
+
     def _get_window_box(self, title: str) -> dict:
         """Return bounding box for the first window matching ``title``."""
         if pyautogui is None:
@@ -77,11 +109,17 @@ class ScreenCapture:
         else:
             box = self._sct.monitors[1]
 
+        if as_numpy and not to_file and self.pool is not None:
+            return self._grab_array(box)
+
         image = self._grab(box)
 
         if to_file:
             with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp:
-                image.save(tmp.name)
+                if self.encoder is not None:
+                    tmp.write(self.encoder.encode_image(image, fmt="PNG"))
+                else:
+                    image.save(tmp.name)
             return Path(tmp.name)
 
         if as_numpy:
@@ -97,6 +135,7 @@ def save_screenshot(
     filename: str,
     *,
     log_func: Callable[[str], object] | None = None,
+    encoder: FrameEncoder | None = None,
 ) -> Path:
     """Save ``image`` to ``directory`` with ``filename``.
 
@@ -115,6 +154,9 @@ def save_screenshot(
     log_func : callable, optional
         Function used to log errors. It receives the error message as a
         single argument.
+    encoder : FrameEncoder, optional
+        Encode the image in the encoder's worker processes. The format is
+        chosen from the ``filename`` suffix.
 
     Returns
     -------
@@ -132,7 +174,11 @@ def save_screenshot(
 
     path = dest / filename
     try:
-        image.save(path)
+        if encoder is not None:
+            data = encoder.encode_image(image, fmt=format_for_path(path))
+            path.write_bytes(data)
+        else:
+            image.save(path)
     except OSError as exc:
         if log_func:
             log_func(f"Failed to save image to {path}: {exc}")
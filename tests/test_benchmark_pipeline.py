@@ -0,0 +1,44 @@
+import copy
+
+import pytest
+
+pytest.importorskip("mss")
+
+from benchmarks.pipeline import compare, format_report, run
+
+
+def test_pipeline_benchmark_runs_headless(tmp_path):
+    import model_api
+
+    before = model_api._config_path
+    result = run(cameras=2, triggers=5, resolution="64x48", latency_ms=0, jitter_ms=0,
+                 workdir=tmp_path)
+    assert result["timeouts"] == 0
+    assert result["throughput"] > 0
+    assert set(result["latency_ms"]) >= {"capture", "save", "log", "screenshot", "total"}
+    assert "p99" in result["latency_ms"]["total"]
+    assert "triggers/s" in format_report(result)
+    assert list(tmp_path.iterdir()) == []  # temporary files removed
+    assert model_api._config_path == before
+
+
+def test_compare_flags_regressions():
+    baseline = {
+        "params": {"cameras": 2, "triggers": 5, "resolution": "64x48",
+                   "latency_ms": 0, "jitter_ms": 0, "writer": False},
+        "throughput": 100.0,
+        "latency_ms": {"total": {"p50": 5.0, "p95": 8.0, "p99": 10.0}},
+        "peak_rss_mb": 100.0,
+    }
+    assert compare(copy.deepcopy(baseline), baseline) == []
+
+    slow = copy.deepcopy(baseline)
+    slow["throughput"] = 50.0
+    slow["latency_ms"]["total"]["p99"] = 20.0
+    slow["peak_rss_mb"] = 200.0
+    assert len(compare(slow, baseline, tolerance=0.25)) == 3
+
+    other = copy.deepcopy(baseline)
+    other["params"]["cameras"] = 6
+    with pytest.raises(ValueError):
+        compare(other, baseline)
@@ -0,0 +1,44 @@
+import numpy as np
+
+from buffer_pool import BufferPool
+
+
+def test_reuses_released_buffers():
+    pool = BufferPool()
+    a = pool.acquire((4, 4, 3))
+    pool.release(a)
+    b = pool.acquire((4, 4, 3), np.uint8)
+    assert b is a
+    c = pool.acquire((4, 4), np.float32)
+    assert c.dtype == np.float32 and c is not a
+
+    stats = pool.stats()
+    assert (stats["hits"], stats["misses"], stats["outstanding"]) == (1, 2, 2)
+
+
+def test_memory_cap_evicts_least_recently_used():
+    pool = BufferPool(max_bytes=100)
+    small = [pool.acquire((40,)) for _ in range(2)]
+    big = pool.acquire((60,))
+    for arr in small:
+        pool.release(arr)
+    assert pool.stats()["idle_bytes"] == 80
+
+    pool.release(big)  # needs room: evicts one 40 byte buffer
+    stats = pool.stats()
+    assert stats["idle_bytes"] == 100
+    assert stats["evictions"] == 1
+
+    huge = pool.acquire((200,))
+    pool.release(huge)  # can never fit; dropped
+    assert pool.stats()["idle_bytes"] <= 100
+
+
+def test_foreign_arrays_are_ignored():
+    pool = BufferPool()
+    pool.release(np.zeros(3))
+    with pool.checkout((2, 2)) as buf:
+        buf[...] = 1
+    assert pool.stats()["idle_buffers"] == 1
+    pool.clear()
+    assert pool.stats()["idle_bytes"] == 0
@@ -28,6 +28,7 @@ def test_validate_cameras_errors():
         validate_cameras([{"type": "keyence", "ip": "1.2.3.4"}])
     with pytest.raises(ValueError):
         validate_cameras([{"type": "unknown"}])
+    validate_cameras([{"type": "synthetic"}])
 
 
 def test_validate_cameras_length_errors():
@@ -77,3 +78,16 @@ def test_load_camera_objects(tmp_path: Path):
     assert cameras[1].ip == "1.2.3.4"
     assert cameras[1].port == 8500
 
+
+
+def test_validate_test_camera_types(tmp_path: Path):
+    validate_cameras([{"type": "synthetic", "resolution": "640x480"}])
+    validate_cameras([{"type": "replay", "directory": str(tmp_path)}])
+    with pytest.raises(ValueError):
+        validate_cameras([{"type": "synthetic", "resolution": "640"}])
+    with pytest.raises(ValueError):
+        validate_cameras([{"type": "synthetic", "jitterDistribution": "pareto"}])
+    with pytest.raises(ValueError):
+        validate_cameras([{"type": "replay"}])
+    assert get_camera_status({"type": "replay", "directory": str(tmp_path)}) == "online"
+    assert get_camera_status({"type": "replay", "directory": str(tmp_path / "x")}) == "not found"
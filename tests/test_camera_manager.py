@@ -1,11 +1,13 @@
 import json
+import time
 from pathlib import Path
 from datetime import datetime
 from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 
-from camera_manager import CameraManager, USBCamera, KeyenceCamera
+from manager_cam import CameraManager, USBCamera, KeyenceCamera
+from frame_buffer import Frame
 
 
 def create_config(tmp_path: Path) -> Path:
@@ -97,11 +99,11 @@ def test_capture_single_and_all(tmp_path: Path):
 
     single = manager.capture_images(1)
     assert set(single) == {1}
-    assert single[1] is not None and single[1].is_file()
+    assert single[1] is not None and single[1].data == b"usb image"
 
     all_caps = manager.capture_images()
     assert set(all_caps) == {1, 2}
-    assert all(path is not None and path.is_file() for path in all_caps.values())
+    assert all(isinstance(frame, Frame) for frame in all_caps.values())
 
 
 def test_capture_error_handling(tmp_path: Path):
@@ -124,9 +126,9 @@ def test_latest_image_helpers(tmp_path: Path):
     assert manager.get_latest_image(1) is None
 
     caps = manager.capture_images()
-    img_path = manager.get_latest_image(1)
-    assert img_path == caps[1]
-    assert isinstance(img_path, Path) and img_path.is_file()
+    frame = manager.get_latest_image(1)
+    assert frame == caps[1]
+    assert isinstance(frame, Frame)
 
     assert manager.get_latest_image(2) == caps[2]
     with pytest.raises(ValueError):
@@ -136,7 +138,53 @@ def test_latest_image_helpers(tmp_path: Path):
     saved = manager.save_latest_image(1, out_dir, serial="SN", status="OK", timestamp=fixed_time)
     expected = out_dir / "SN_OK_20200102_030405.jpg"
     assert saved == expected
-    assert saved.is_file()
+    assert saved.read_bytes() == b"usb image"
+
+
+def test_capture_keeps_frames_in_memory(tmp_path: Path):
+    cfg = tmp_path / "cfg.json"
+    device = tmp_path / "video0"
+    device.touch()
+    data = {
+        "frameBufferSize": 3,
+        "cameras": [
+            {"id": 1, "type": "usb", "name": "USB", "device": str(device)},
+            {
+                "id": 2,
+                "type": "keyence",
+                "name": "Key",
+                "ip": "1.2.3.4",
+                "port": 8500,
+                "bufferSize": 1,
+            },
+        ],
+    }
+    cfg.write_text(json.dumps(data))
+    manager = CameraManager(config_path=cfg)
+    manager.connect_all()
+
+    for _ in range(5):
+        manager.capture_images()
+
+    cam1, cam2 = manager.get_camera(1), manager.get_camera(2)
+    assert [f.seq for f in cam1.frames] == [3, 4, 5]
+    assert len(cam2.frames) == 1
+    assert cam1.last_image.seq == 5
+    # Nothing is written to disk until an image is saved
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["cfg.json", "video0"]
+
+
+def test_latest_image_as_array(tmp_path: Path):
+    np = pytest.importorskip("numpy")
+    cfg = create_config(tmp_path)
+    manager = CameraManager(config_path=cfg)
+
+    arr = np.zeros((4, 6, 3), dtype=np.uint8)
+    manager.get_camera(1).frames.push(arr, suffix=".png")
+    assert manager.get_latest_image(1, as_array=True) is arr
+
+    saved = manager.save_latest_image(1, tmp_path / "out", serial="SN")
+    assert saved.suffix == ".png" and saved.is_file()
 
 
 def test_disconnect_reconnect(tmp_path: Path):
@@ -230,3 +278,481 @@ def test_add_and_remove_camera(tmp_path: Path):
 
     missing = manager.remove_camera(99)
     assert missing.startswith("error")
+
+
+def test_capture_workers_are_reused(tmp_path: Path):
+    cfg = create_config(tmp_path)
+    manager = CameraManager(config_path=cfg)
+    manager.start()
+    manager.connect_all()
+
+    workers = dict(manager._workers)
+    assert set(workers) == {1, 2}
+
+    manager.capture_images()
+    manager.check_all_statuses()
+    manager.capture_images()
+    assert manager._workers == workers
+
+    manager.shutdown()
+    assert manager._workers == {}
+
+    # Workers are recreated lazily after shutdown
+    assert manager.capture_images(1)[1] is not None
+    assert set(manager._workers) == {1}
+    manager.shutdown()
+
+
+def test_remove_camera_stops_worker(tmp_path: Path):
+    cfg = create_config(tmp_path)
+    with CameraManager(config_path=cfg) as manager:
+        assert set(manager._workers) == {1, 2}
+        manager.remove_camera(2)
+        assert set(manager._workers) == {1}
+
+
+def test_capture_deadline_returns_partial_results(tmp_path: Path):
+    import threading
+    from manager_cam import TIMED_OUT
+
+    cfg = create_config(tmp_path)
+    manager = CameraManager(config_path=cfg)
+    manager.connect_all()
+
+    slow = manager.get_camera(2)
+    release = threading.Event()
+    original = slow.capture
+
+    def hung_capture():
+        release.wait(5)
+        return original()
+
+    slow.capture = hung_capture
+
+    results = manager.capture_images(timeout=0.5, per_camera_timeout=0.1)
+    assert results[1] is not None and results[1] is not TIMED_OUT
+    assert results[2] is TIMED_OUT
+
+    # The hung camera is not triggered again while its capture is pending
+    assert manager.capture_images(2, timeout=0.1)[2] is TIMED_OUT
+
+    release.set()
+    manager._inflight[2].result(timeout=5)
+    # The late frame was dropped instead of becoming the latest image
+    assert manager.get_latest_image(2) is None
+
+    assert isinstance(manager.capture_images(2, timeout=1)[2], Frame)
+    manager.shutdown()
+
+
+def test_per_camera_timeout_starts_on_worker(tmp_path: Path):
+    import threading
+    from manager_cam import TIMED_OUT
+
+    cfg = create_config(tmp_path)
+    manager = CameraManager(config_path=cfg)
+    manager.connect_all()
+
+    slow = manager.get_camera(2)
+    original = slow.capture
+
+    def slow_capture():
+        time.sleep(0.2)
+        return original()
+
+    slow.capture = slow_capture
+    # Camera 2's worker is busy for a while before its capture starts
+    manager._submit(slow, time.sleep, 0.3)
+
+    results = manager.capture_images(per_camera_timeout=0.4)
+    assert isinstance(results[2], Frame)
+
+    # A capture queued behind hung work times out without an overall limit
+    release = threading.Event()
+    manager._submit(slow, release.wait, 5)
+    assert manager.capture_images(2, per_camera_timeout=0.1)[2] is TIMED_OUT
+    release.set()
+    manager.shutdown()
+
+
+def test_capture_images_async(tmp_path: Path):
+    import asyncio
+    import threading
+    from manager_cam import TIMED_OUT
+
+    cfg = create_config(tmp_path)
+    manager = CameraManager(config_path=cfg)
+
+    async def scenario():
+        cams = manager.cameras
+        assert await asyncio.gather(*(cam.connect_async() for cam in cams)) == [True, True]
+        results = await manager.capture_images_async()
+        assert results[1].data == b"usb image"
+        assert results[2].data == b"keyence image"
+
+        slow = manager.get_camera(2)
+        release = threading.Event()
+        original = slow.capture
+
+        def hung_capture():
+            release.wait(5)
+            return original()
+
+        slow.capture = hung_capture
+        partial = await manager.capture_images_async(per_camera_timeout=0.1)
+        assert isinstance(partial[1], Frame)
+        assert partial[2] is TIMED_OUT
+        # The hung camera is busy on its own worker and not triggered again
+        again = await manager.capture_images_async(2, timeout=0.1)
+        assert again[2] is TIMED_OUT
+        # The loop and asyncio's default executor stay free meanwhile
+        assert await asyncio.to_thread(lambda: 42) == 42
+        release.set()
+
+    asyncio.run(scenario())
+    manager.shutdown()
+
+
+def test_camera_async_api_runs_on_pinned_worker(tmp_path: Path):
+    import asyncio
+    import threading
+    from manager_cam import KeyenceCamera
+
+    cfg = create_config(tmp_path)
+    manager = CameraManager(config_path=cfg)
+    cam = manager.get_camera(2)
+    threads = []
+    original = cam.capture
+
+    def capture():
+        threads.append(threading.current_thread().name)
+        return original()
+
+    cam.capture = capture
+
+    async def scenario():
+        assert await cam.connect_async()
+        frame = await cam.capture_async()
+        assert frame.data == b"keyence image"
+        assert threads[0].startswith("camera-2")
+
+        # Cameras outside a manager fall back to a helper thread
+        loose = KeyenceCamera(id=9, name="Loose", type="keyence", ip="ip", port=1)
+        assert await loose.connect_async()
+        assert (await loose.capture_async()).data == b"keyence image"
+
+    asyncio.run(scenario())
+    manager.remove_camera(2)
+    assert cam.submit is None
+    manager.shutdown()
+
+
+def test_connect_all_report_and_timeout(tmp_path: Path):
+    import threading
+    import time
+
+    cfg = create_config(tmp_path)
+    manager = CameraManager(config_path=cfg)
+
+    report = manager.connect_all()
+    assert set(report) == {1, 2}
+    assert all(r.ok and r.duration >= 0 for r in report.values())
+
+    manager.disconnect_camera(1)
+    manager.disconnect_camera(2)
+    release = threading.Event()
+    slow = manager.get_camera(2)
+    original = slow.connect
+
+    def unreachable():
+        release.wait(5)
+        return original()
+
+    slow.connect = unreachable
+    start = time.monotonic()
+    report = manager.connect_all(timeout=0.2)
+    assert time.monotonic() - start < 2
+    assert report[1].status == "connected"
+    assert report[2].status == "timeout"
+    release.set()
+    manager.shutdown()
+
+
+def test_health_monitor_publishes_changes(tmp_path: Path):
+    from manager_cam import CameraHealthMonitor
+
+    cfg = create_config(tmp_path)
+    manager = CameraManager(config_path=cfg)
+    manager.connect_all()
+
+    monitor = CameraHealthMonitor(manager, interval=0.01, jitter=0, reconnect=True)
+    changes = []
+    monitor.subscribe(lambda *change: changes.append(change))
+    assert {d["id"]: d["status"] for d in monitor.snapshot()} == {1: "connected", 2: "connected"}
+
+    device = Path(manager.get_camera(1).device)
+    device.unlink()
+    monitor.probe_once()
+    assert changes == [(1, "connected", "disconnected")]
+    assert monitor.events.get_nowait() == (1, "connected", "disconnected")
+    assert monitor._failures[1] == 1
+
+    # Failing cameras back off exponentially, capped at max_backoff
+    monitor._failures[1] = 3
+    assert monitor.delay_for(1) == pytest.approx(0.08)
+    monitor._failures[1] = 50
+    assert monitor.delay_for(1) == monitor.max_backoff
+
+    device.touch()
+    monitor._next_due.clear()
+    monitor.probe_once()
+    assert changes[-1] == (1, "disconnected", "connected")
+    assert monitor._failures[1] == 0
+    manager.shutdown()
+
+
+def test_check_all_statuses_uses_monitor_snapshot(tmp_path: Path):
+    cfg = create_config(tmp_path)
+    manager = CameraManager(config_path=cfg)
+    manager.auto_reconnect = True
+    monitor = manager.start_health_monitor(interval=0.01)
+
+    import time
+
+    deadline = time.monotonic() + 2
+    while time.monotonic() < deadline:
+        if all(d["status"] == "connected" for d in manager.check_all_statuses()):
+            break
+        time.sleep(0.01)
+    assert all(d["status"] == "connected" for d in manager.check_all_statuses())
+
+    manager.shutdown()
+    assert manager.health_monitor is None and not monitor.running
+
+
+def test_camera_index_stays_in_sync(tmp_path: Path):
+    cfg = create_config(tmp_path)
+    manager = CameraManager(config_path=cfg)
+    snapshot = manager.cameras
+
+    assert [cam.id for cam in manager.get_cameras_by_type("usb")] == [1]
+    assert manager.get_cameras_by_type("missing") == ()
+
+    dev = tmp_path / "video1"
+    dev.touch()
+    assert manager.add_camera({"id": 3, "type": "usb", "name": "U2", "device": str(dev)}) == "added"
+    assert manager.add_camera({"id": 3, "type": "usb", "name": "U3", "device": str(dev)}).startswith("error")
+    assert [cam.id for cam in manager.get_cameras_by_type("usb")] == [1, 3]
+    assert manager.get_camera(3).name == "U2"
+
+    # Earlier snapshots are never mutated by configuration edits
+    assert [cam.id for cam in snapshot] == [1, 2]
+
+    manager.remove_camera(1)
+    assert [cam.id for cam in manager.cameras] == [2, 3]
+    assert [cam.id for cam in manager.get_cameras_by_type("usb")] == [3]
+    assert manager.get_camera(1) is None
+
+
+def test_save_latest_image_strategy(tmp_path: Path):
+    import os
+
+    cfg = create_config(tmp_path)
+    manager = CameraManager(config_path=cfg)
+    src = tmp_path / "frame.jpg"
+    src.write_bytes(b"jpeg")
+    manager.get_camera(1).frames.push(b"jpeg", path=src)
+
+    linked = manager.save_latest_image(1, tmp_path / "out", serial="A")
+    assert os.stat(linked).st_ino == os.stat(src).st_ino
+
+    moved = manager.save_latest_image(1, tmp_path / "out", serial="B", strategy="move")
+    assert moved.read_bytes() == b"jpeg" and not src.exists()
+
+
+def test_save_latest_image_with_writer(tmp_path: Path):
+    from image_writer import ImageWriter
+
+    cfg = create_config(tmp_path)
+    manager = CameraManager(config_path=cfg)
+    manager.connect_all()
+    manager.capture_images(1)
+
+    with ImageWriter() as writer:
+        path = manager.save_latest_image(1, tmp_path / "out", serial="SN", writer=writer)
+        writer.flush()
+    assert path.read_bytes() == b"usb image"
+
+
+def test_captures_are_published_to_transport(tmp_path: Path):
+    from frame_transport import FrameTransport
+
+    cfg = create_config(tmp_path)
+    manager = CameraManager(config_path=cfg)
+    manager.connect_all()
+    transport = FrameTransport.create(slots=4, slot_size=64)
+    try:
+        manager.attach_transport(transport)
+        manager.capture_images()
+        frame = transport.latest(cam_id=2)
+        assert bytes(frame.data) == b"keyence image"
+        assert frame.timestamp == manager.get_camera(2).last_image.timestamp
+        del frame
+    finally:
+        transport.close()
+        transport.unlink()
+
+
+def test_latest_image_decodes_into_pool(tmp_path: Path):
+    import io
+    np = pytest.importorskip("numpy")
+    Image = pytest.importorskip("PIL.Image")
+    from buffer_pool import BufferPool
+
+    cfg = create_config(tmp_path)
+    manager = CameraManager(config_path=cfg)
+    buf = io.BytesIO()
+    Image.new("RGB", (6, 4), "red").save(buf, format="PNG")
+    manager.get_camera(1).frames.push(buf.getvalue(), suffix=".png")
+
+    pool = BufferPool()
+    arr = manager.get_latest_image(1, as_array=True, pool=pool)
+    assert arr.shape == (4, 6, 3) and arr[0, 0].tolist() == [255, 0, 0]
+    pool.release(arr)
+    assert manager.get_latest_image(1, as_array=True, pool=pool) is arr
+
+
+@pytest.mark.parametrize("mode", ["RGB", "RGBA", "L", "1", "I;16"])
+def test_pooled_decode_matches_numpy(mode):
+    import io
+    np = pytest.importorskip("numpy")
+    Image = pytest.importorskip("PIL.Image")
+    from buffer_pool import BufferPool
+    import manager_cam
+    from manager_cam import _frame_to_array
+
+    def missing_internals(img, pool):
+        raise AttributeError("module 'PIL.Image' has no attribute '_getencoder'")
+
+    rng = np.random.default_rng(0)
+    img = Image.fromarray(rng.integers(0, 256, (200, 300, 3), dtype=np.uint8)).convert(mode)
+    buf = io.BytesIO()
+    img.save(buf, format="PNG")
+
+    expected = _frame_to_array(buf.getvalue())
+    for internals in (True, False):
+        with pytest.MonkeyPatch.context() as mp:
+            if not internals:  # a Pillow release without the private names
+                mp.setattr(manager_cam, "_pack_into", missing_internals)
+            arr = _frame_to_array(buf.getvalue(), BufferPool())
+        assert arr.dtype == expected.dtype
+        assert np.array_equal(arr, expected)
+
+
+def test_get_preview_downscales_and_caches(tmp_path: Path):
+    import io
+    Image = pytest.importorskip("PIL.Image")
+
+    cfg = create_config(tmp_path)
+    manager = CameraManager(config_path=cfg)
+    buf = io.BytesIO()
+    Image.new("RGB", (1920, 1080), "green").save(buf, format="JPEG")
+    cam = manager.get_camera(1)
+    cam.frames.push(buf.getvalue())
+
+    preview = manager.get_preview(1, (240, 180))
+    assert (preview.width, preview.height) == (240, 135)
+    assert len(preview.data) == preview.bytes_per_line * preview.height
+    assert manager.get_preview(1, (240, 180)) is preview
+
+    cam.frames.push(buf.getvalue())
+    assert manager.get_preview(1, (240, 180)) is not preview
+
+    # Mock frames are not decodable images
+    manager.get_camera(2).status = "connected"
+    manager.capture_images(2)
+    assert manager.get_preview(2) is None
+    with pytest.raises(ValueError):
+        manager.get_preview(99)
+
+
+def test_stream_from_synthetic_camera(tmp_path: Path):
+    cfg = tmp_path / "cfg.json"
+    cfg.write_text(json.dumps({"cameras": [
+        {"id": 5, "type": "synthetic", "name": "Sim", "resolution": "8x6", "imageFormat": "raw"}
+    ]}))
+    manager = CameraManager(config_path=cfg)
+    manager.connect_camera(5)
+
+    stream = manager.stream(5, fps=200, maxsize=2)
+    frames = [next(stream) for _ in range(3)]
+    assert all(f.data.shape == (6, 8, 3) for f in frames)
+    assert manager.get_camera(5).last_image.seq >= frames[-1].seq
+
+    manager.shutdown()
+    assert stream.closed
+    assert stream.stats()["delivered"] == 3
+    with pytest.raises(ValueError):
+        manager.stream(99)
+
+
+def test_synthetic_camera_frames_and_latency(tmp_path: Path):
+    cfg = tmp_path / "cfg.json"
+    cams = [
+        {"id": 1, "type": "synthetic", "name": "Raw", "resolution": "64x48",
+         "imageFormat": "raw", "latencyMs": 5, "jitterMs": 2,
+         "jitterDistribution": "uniform", "seed": 1},
+        {"id": 2, "type": "synthetic", "name": "Jpeg", "resolution": "64x48"},
+    ]
+    cfg.write_text(json.dumps({"cameras": cams}))
+    manager = CameraManager(config_path=cfg)
+    manager.connect_all()
+
+    raw = manager.get_camera(1)
+    delays = [raw.sample_latency() for _ in range(200)]
+    assert 0.003 <= min(delays) and max(delays) <= 0.007
+
+    frames = manager.capture_images()
+    assert frames[1].data.shape == (48, 64, 3)
+    assert frames[2].data[:2] == b"\xff\xd8"  # JPEG SOI marker
+    assert manager.get_latest_image(2, as_array=True).shape == (48, 64, 3)
+
+
+def test_replay_camera_plays_directory_without_touching_it(tmp_path: Path):
+    src = tmp_path / "replay"
+    src.mkdir()
+    for name in ("b.jpg", "a.jpg", "notes.txt"):
+        (src / name).write_bytes(name.encode())
+    cfg = tmp_path / "cfg.json"
+    cfg.write_text(json.dumps({"cameras": [
+        {"id": 3, "type": "replay", "name": "Replay", "directory": str(src), "fps": 50}
+    ]}))
+    manager = CameraManager(config_path=cfg)
+    assert manager.connect_camera(3)
+
+    start = time.monotonic()
+    data = [manager.capture_images(3)[3].data for _ in range(3)]
+    assert data == [b"a.jpg", b"b.jpg", b"a.jpg"]
+    assert time.monotonic() - start >= 0.035  # paced to 50 fps
+
+    saved = manager.save_latest_image(3, tmp_path / "out", serial="SN")
+    assert saved.read_bytes() == b"a.jpg"
+    assert saved.stat().st_ino != (src / "a.jpg").stat().st_ino
+
+    moved = manager.save_latest_image(3, tmp_path / "moved", serial="SN", strategy="move")
+    assert moved.read_bytes() == b"a.jpg"
+    assert (src / "a.jpg").read_bytes() == b"a.jpg"
+    assert manager.connect_camera(3) and len(manager.get_camera(3)._files) == 2
+
+
+def test_capture_records_per_camera_latency(tmp_path: Path):
+    from instrumentation import Instrumentation
+
+    cfg = create_config(tmp_path)
+    manager = CameraManager(config_path=cfg)
+    manager.instrumentation = Instrumentation()
+    manager.connect_all()
+    manager.capture_images()
+    cameras = manager.instrumentation.snapshot()["cameras"]
+    assert cameras[1]["camera_capture"]["count"] == 1
+    assert cameras[2]["camera_capture"]["count"] == 1
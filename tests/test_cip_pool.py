@@ -0,0 +1,146 @@
+import pytest
+
+from cip_pool import CIPSessionPool
+
+
+class FakeCIPEndpoint:
+    """In-process stand-in for an IV2 camera's CIP endpoint."""
+
+    def __init__(self):
+        self.opens = 0
+        self.closes = 0
+        self.writes = []
+        self.fail_next = 0
+        self.fail_reads = 0
+        self.result = [0] * 196
+        self.result[4] = 1
+
+    def driver(self, ip):
+        return FakeDriver(self, ip)
+
+
+class FakeDriver:
+    def __init__(self, endpoint, ip):
+        self.endpoint = endpoint
+        self.ip = ip
+        self.connected = False
+
+    def open(self):
+        self.endpoint.opens += 1
+        self.connected = True
+
+    def close(self):
+        self.endpoint.closes += 1
+        self.connected = False
+
+    def write_array(self, tag, data):
+        if self.endpoint.fail_next:
+            self.endpoint.fail_next -= 1
+            raise ConnectionError("link down")
+        self.endpoint.writes.append((self.ip, tag, list(data)))
+
+    def read_array(self, tag, size):
+        if self.endpoint.fail_reads:
+            self.endpoint.fail_reads -= 1
+            raise ConnectionError("read timed out")
+        return list(self.endpoint.result[:size])
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_session_is_reused():
+    endpoint = FakeCIPEndpoint()
+    pool = CIPSessionPool(driver_factory=endpoint.driver)
+
+    for _ in range(3):
+        pool.call("10.0.0.1", lambda plc: plc.write_array("Assembly[101]", [1]))
+    pool.call("10.0.0.2", lambda plc: plc.write_array("Assembly[101]", [1]))
+
+    assert endpoint.opens == 2
+    assert len(endpoint.writes) == 4
+    assert len(pool) == 2
+
+    pool.close_all()
+    assert endpoint.closes == 2
+    assert len(pool) == 0
+
+
+def test_unhealthy_session_is_reopened():
+    endpoint = FakeCIPEndpoint()
+    pool = CIPSessionPool(driver_factory=endpoint.driver)
+    pool.call("ip", lambda plc: None)
+
+    pool.get_driver("ip").connected = False  # peer dropped the connection
+    pool.call("ip", lambda plc: None)
+    assert endpoint.opens == 2
+
+
+def test_failure_reopens_and_retries():
+    endpoint = FakeCIPEndpoint()
+    pool = CIPSessionPool(driver_factory=endpoint.driver, retries=1)
+    pool.call("ip", lambda plc: None)
+
+    endpoint.fail_next = 1
+    pool.call("ip", lambda plc: plc.write_array("tag", [1]))
+    assert endpoint.opens == 2
+    assert len(endpoint.writes) == 1
+
+    endpoint.fail_next = 2
+    with pytest.raises(ConnectionError):
+        pool.call("ip", lambda plc: plc.write_array("tag", [1]))
+    assert pool.get_driver("ip") is None
+
+    endpoint.fail_next = 1
+    with pytest.raises(ConnectionError):
+        pool.call("ip", lambda plc: plc.write_array("tag", [1]), retries=0)
+    assert len(endpoint.writes) == 1
+
+
+def test_idle_sessions_are_evicted():
+    endpoint = FakeCIPEndpoint()
+    clock = FakeClock()
+    pool = CIPSessionPool(driver_factory=endpoint.driver, max_idle=10, clock=clock)
+    pool.call("a", lambda plc: None)
+    clock.now = 5
+    pool.call("b", lambda plc: None)
+
+    clock.now = 12
+    assert pool.evict_idle() == 1
+    assert pool.get_driver("a") is None
+    assert pool.get_driver("b") is not None
+    assert endpoint.closes == 1
+
+
+def test_trigger_iv2_camera_uses_pool():
+    from manager_cam import trigger_iv2_camera
+
+    endpoint = FakeCIPEndpoint()
+    pool = CIPSessionPool(driver_factory=endpoint.driver)
+
+    ok, raw = trigger_iv2_camera("192.168.0.10", pool=pool)
+    ok2, _ = trigger_iv2_camera("192.168.0.10", pool=pool)
+
+    assert ok is True and ok2 is True
+    assert len(raw) == 196
+    assert endpoint.opens == 1
+    assert endpoint.writes[0] == ("192.168.0.10", "Assembly[101]", [1, 0, 0, 0, 0, 0])
+
+
+def test_trigger_iv2_camera_retries_read_without_refiring():
+    from manager_cam import trigger_iv2_camera
+
+    endpoint = FakeCIPEndpoint()
+    pool = CIPSessionPool(driver_factory=endpoint.driver, retries=1)
+
+    endpoint.fail_reads = 1
+    ok, _ = trigger_iv2_camera("192.168.0.10", pool=pool)
+
+    assert ok is True
+    assert len(endpoint.writes) == 1
+    assert endpoint.opens == 2
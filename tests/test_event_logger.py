@@ -1,5 +1,8 @@
 from pathlib import Path
 import json
+
+import pytest
+
 from event_logger import EventLogger
 
 
@@ -86,6 +89,16 @@ def test_load_json_invalid_or_missing(tmp_path: Path):
     assert logger.logs == []
 
 
+def test_load_json_rejects_non_object_items(tmp_path: Path):
+    logger = EventLogger(tmp_path / "log.txt")
+    logger.log_event("info", "kept until reload")
+
+    items = tmp_path / "items.json"
+    items.write_text("[1, 2]")
+    logger.load_log_json(items)
+    assert logger.logs == []
+
+
 def test_load_csv_invalid_or_missing(tmp_path: Path):
     logger = EventLogger(tmp_path / "log.txt")
 
@@ -97,3 +110,115 @@ def test_load_csv_invalid_or_missing(tmp_path: Path):
     bad.write_text("bad,data")
     logger.load_log_csv(bad)
     assert logger.logs == []
+
+
+def test_buffered_logger_batches_and_flushes(tmp_path: Path):
+    log_file = tmp_path / "log.txt"
+    logger = EventLogger(log_file, buffered=True, flush_interval=60)
+
+    for i in range(5):
+        logger.log_event("info", f"event {i}", {"i": i})
+    assert len(logger.logs) == 5
+    assert log_file.read_text() == ""  # still queued
+
+    logger.flush()
+    lines = [json.loads(line) for line in log_file.read_text().splitlines()]
+    assert [line["message"] for line in lines] == [f"event {i}" for i in range(5)]
+
+    logger.log_event("warn", "last")
+    logger.close()
+    assert json.loads(log_file.read_text().splitlines()[-1])["message"] == "last"
+
+
+def test_buffered_logger_writes_when_batch_full(tmp_path: Path):
+    import time
+
+    log_file = tmp_path / "log.txt"
+    with EventLogger(log_file, buffered=True, flush_interval=60, batch_size=3) as logger:
+        for i in range(3):
+            logger.log_event("info", str(i))
+        deadline = time.monotonic() + 2
+        while len(log_file.read_text().splitlines()) < 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert len(log_file.read_text().splitlines()) == 3
+
+
+def test_logs_window_spills_to_file(tmp_path: Path):
+    log_file = tmp_path / "log.txt"
+    log_file.write_text('{"timestamp": "old", "event_type": "info", "message": "previous run", "metadata": null}\n')
+    logger = EventLogger(log_file, max_entries=3)
+    logger.logs.checkpoint_every = 2
+    for i in range(10):
+        logger.log_event("info", f"event {i}", {"i": i})
+
+    assert len(logger.logs) == 10
+    assert logger.logs.spilled == 7
+    assert [e.message for e in logger.logs] == [f"event {i}" for i in range(10)]
+    assert logger.logs[0].metadata == {"i": 0}
+    assert logger.logs[5].message == "event 5"
+    assert logger.logs[-1].message == "event 9"
+    assert [e.message for e in logger.logs[2:4]] == ["event 2", "event 3"]
+
+    out = tmp_path / "events.json"
+    logger.save_log_json(out)
+    assert json.loads(out.read_text()) == [
+        {"timestamp": e.timestamp, "event_type": "info", "message": e.message, "metadata": e.metadata}
+        for e in logger.logs
+    ]
+
+
+def test_logs_window_buffered_and_reload(tmp_path: Path):
+    logger = EventLogger(tmp_path / "log.txt", buffered=True, flush_interval=60, max_entries=2)
+    for i in range(5):
+        logger.log_event("info", str(i))
+    # spilled entries are flushed before they are read back
+    assert [e.message for e in logger.logs] == ["0", "1", "2", "3", "4"]
+
+    out = tmp_path / "events.json"
+    logger.save_log_json(out)
+    logger.load_log_json(out)
+    assert len(logger.logs) == 5 and logger.logs.spilled == 0
+    logger.close()
+
+
+def test_logs_stored_column_wise(tmp_path: Path):
+    logger = EventLogger(tmp_path / "log.txt", max_entries=2)
+    for i in range(4):
+        logger.log_event("info", "tick", {"i": i} if i % 2 else None)
+
+    cols = logger.logs.columns()
+    assert cols["message"] == ["tick"] * 4
+    assert cols["metadata"] == [None, '{"i": 1}', None, '{"i": 3}']
+    assert cols["event_type"][2] is cols["event_type"][3]  # interned
+
+    csv_path = tmp_path / "events.csv"
+    logger.save_log_csv(csv_path)
+    other = EventLogger(tmp_path / "other.txt")
+    other.load_log_csv(csv_path)
+    assert other.logs == logger.logs
+
+
+@pytest.mark.parametrize(
+    "content", ['[{"timestamp": "t", "event_type": "info", "message": "m"}, 1]', '"x"\n1\n']
+)
+def test_readers_reject_non_object_items(tmp_path: Path, content: str):
+    from event_logger import iter_events, tail
+
+    path = tmp_path / "events.json"
+    path.write_text(content)
+    with pytest.raises(TypeError):
+        list(iter_events(path))
+    with pytest.raises(TypeError):
+        tail(path, 5)
+
+    logger = EventLogger(tmp_path / "log.txt")
+    logger.load_log_json(path)
+    assert logger.logs == []
+
+
+def test_entry_from_row_decodes_metadata():
+    from event_logger import LogEntry, entry_from_row
+
+    row = ("2026-01-01T00:00:00", "info", "m", '{"n": 1}')
+    assert entry_from_row(row) == LogEntry("2026-01-01T00:00:00", "info", "m", {"n": 1})
+    assert entry_from_row(row[:3] + (None,)).metadata is None
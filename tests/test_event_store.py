@@ -0,0 +1,71 @@
+from datetime import datetime
+from pathlib import Path
+import sqlite3
+
+import pytest
+
+from event_logger import EventLogger
+from event_store import EventStore
+
+
+def _rows():
+    return [
+        ("2026-01-01T08:00:00", "info", "capture complete", '{"serial": "AB12", "model": "ModelA"}'),
+        ("2026-01-02T08:00:00", "error", "NG", '{"serial": "AB12", "model": "ModelA"}'),
+        ("2026-01-03T08:00:00", "error", "NG", '{"serial": "CD34", "model": "ModelB"}'),
+        ("2026-01-04T08:00:00", "error", "NG", '{"serial": "AB12", "model": "ModelA"}'),
+        ("2026-01-05T08:00:00", "warn", "no metadata", None),
+    ]
+
+
+def test_query_filters(tmp_path: Path):
+    with EventStore(tmp_path / "events.db", chunk_size=2) as store:
+        assert store.add_many(_rows()) == 5
+
+        result = store.query(event_type="error", serial="AB12")
+        assert not isinstance(result, list)
+        assert [e.timestamp for e in result] == ["2026-01-02T08:00:00", "2026-01-04T08:00:00"]
+
+        week = store.query(since=datetime(2026, 1, 2), until="2026-01-04T08:00:00")
+        assert [e.metadata["serial"] for e in week] == ["AB12", "CD34"]
+
+        assert [e.message for e in store.query(model="ModelB")] == ["NG"]
+        newest = list(store.query(newest_first=True, limit=2))
+        assert [e.event_type for e in newest] == ["warn", "error"]
+        assert newest[0].metadata is None
+        assert len(list(store.query())) == 5
+
+
+def test_store_uses_wal_and_indexes(tmp_path: Path):
+    path = tmp_path / "events.db"
+    EventStore(path).close()
+    conn = sqlite3.connect(path)
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    plan = " ".join(
+        row[-1]
+        for row in conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM events WHERE serial = 'x' AND timestamp >= 'y'"
+        )
+    )
+    assert "USING INDEX" in plan
+    conn.close()
+
+
+@pytest.mark.parametrize("buffered", [False, True])
+def test_logger_writes_to_store(tmp_path: Path, buffered: bool):
+    store = EventStore(tmp_path / "events.db")
+    with EventLogger(tmp_path / "log.txt", buffered=buffered, store=store) as logger:
+        logger.log_event("info", "capture complete", {"serial": "AB12", "model": "ModelA"})
+        logger.log_event("error", "NG", {"serial": "AB12"})
+        logger.log_event("error", "NG", {"serial": "CD34"})
+
+        ng = list(logger.query(event_type="error", serial="AB12"))
+        assert [(e.message, e.metadata) for e in ng] == [("NG", {"serial": "AB12"})]
+        assert list(logger.query()) == list(logger.logs)
+    store.close()
+
+
+def test_query_without_store(tmp_path: Path):
+    logger = EventLogger(tmp_path / "log.txt")
+    with pytest.raises(RuntimeError):
+        logger.query(event_type="error")
@@ -0,0 +1,36 @@
+import pytest
+
+from frame_buffer import FrameRing
+
+
+def test_ring_keeps_last_frames():
+    ring = FrameRing(capacity=2)
+    assert ring.latest() is None
+
+    ring.push(b"a")
+    ring.push(b"b")
+    last = ring.push(b"c", suffix=".png")
+
+    assert len(ring) == 2
+    assert [f.data for f in ring] == [b"b", b"c"]
+    assert ring.latest() is last
+    assert last.seq == 3 and last.suffix == ".png"
+
+    ring.clear()
+    assert ring.latest() is None
+
+
+def test_ring_rejects_invalid_capacity():
+    with pytest.raises(ValueError):
+        FrameRing(capacity=0)
+
+
+def test_discard_removes_frame_by_identity():
+    ring = FrameRing(capacity=3)
+    first = ring.push(b"same")
+    second = ring.push(b"same")
+
+    ring.discard(second)
+    assert ring.snapshot() == [first]
+    ring.discard(second)
+    assert len(ring) == 1
@@ -0,0 +1,95 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import Future
+
+import pytest
+
+from frame_buffer import FrameRing
+from frame_stream import FrameStream
+
+
+def make_capture(ring, gate=None):
+    def capture():
+        if gate is not None:
+            gate.acquire()
+        future = Future()
+        future.set_result(ring.push(b"img"))
+        return future
+
+    return capture
+
+
+def test_stream_iterates_frames():
+    ring = FrameRing(16)
+    with FrameStream(make_capture(ring), maxsize=4) as stream:
+        frames = [next(stream) for _ in range(3)]
+    assert [f.seq for f in frames] == sorted(f.seq for f in frames)
+    assert stream.stats()["delivered"] == 3
+
+
+@pytest.mark.parametrize("policy,expected", [("drop-oldest", [3, 4]), ("drop-newest", [1, 2])])
+def test_stream_drop_policies(policy, expected):
+    ring = FrameRing(16)
+    gate = threading.Semaphore(4)
+    stream = FrameStream(make_capture(ring, gate), maxsize=2, policy=policy)
+    stream.start()
+    deadline = time.monotonic() + 5
+    while stream.stats()["captured"] < 4:
+        assert time.monotonic() < deadline, "stream did not capture 4 frames"
+        time.sleep(0.001)
+    stream.close(timeout=0)
+    gate.release()  # unblock the producer so it can exit
+    stream.close()
+    base = ring.snapshot()[0].seq - 1
+    assert [f.seq - base for f in stream] == expected
+    assert stream.dropped == 2
+
+
+def test_stream_counts_errors_and_keeps_running():
+    calls = []
+
+    def capture():
+        calls.append(1)
+        future = Future()
+        future.set_exception(RuntimeError("Camera not connected"))
+        return future
+
+    stream = FrameStream(capture, fps=100)
+    stream.start()
+    assert stream.get(timeout=0.3) is None
+    stream.close()
+    assert stream.stats()["errors"] >= 2
+
+
+def test_stream_async_iteration():
+    ring = FrameRing(16)
+
+    async def consume():
+        stream = FrameStream(make_capture(ring), fps=200)
+        stream.start()
+        seen = []
+        async for frame in stream:
+            seen.append(frame)
+            if len(seen) == 3:
+                stream.close()
+        return seen
+
+    assert len(asyncio.run(consume())) >= 3
+
+
+def test_stream_rejects_bad_arguments():
+    with pytest.raises(ValueError):
+        FrameStream(lambda: Future(), policy="drop-all")
+    with pytest.raises(ValueError):
+        FrameStream(lambda: Future(), fps=0)
+
+
+def test_close_does_not_hang_on_a_stuck_capture(caplog):
+    stream = FrameStream(lambda: Future(), name="stuck")  # never completes
+    stream.start()
+    start = time.monotonic()
+    stream.close(timeout=0.1)
+    assert time.monotonic() - start < 2
+    assert stream.closed
+    assert "stuck capture thread still running" in caplog.text
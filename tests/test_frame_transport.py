@@ -0,0 +1,121 @@
+import multiprocessing as mp
+
+import numpy as np
+import pytest
+
+from frame_transport import FrameTransport
+
+
+@pytest.fixture
+def transport():
+    t = FrameTransport.create(slots=3, slot_size=256)
+    yield t
+    t.close()
+    t.unlink()
+
+
+def test_publish_and_read_latest(transport):
+    assert transport.latest() is None
+
+    transport.publish(1, b"first", timestamp=1.0)
+    arr = np.arange(12, dtype=np.uint16).reshape(3, 4)
+    seq = transport.publish(2, arr, timestamp=2.0)
+
+    reader = FrameTransport.attach(transport.name)
+    frame = reader.latest()
+    assert (frame.cam_id, frame.seq, frame.timestamp) == (2, seq, 2.0)
+    assert np.array_equal(frame.data, arr)
+    assert bytes(reader.latest(cam_id=1).data) == b"first"
+    assert reader.latest(cam_id=9) is None
+    del frame
+    reader.close()
+
+
+def test_views_are_zero_copy_and_invalidated(transport):
+    transport.publish(1, b"a" * 4)
+    frame = transport.latest(1)
+    copy = frame.copy()
+    assert frame.is_valid()
+
+    for i in range(3):  # wraps the ring and reuses the slot
+        transport.publish(2, b"b" * 4)
+    assert not frame.is_valid()
+    assert bytes(frame.data) == b"bbbb"
+    assert copy == b"aaaa"
+    assert transport.latest(1) is None
+    del frame
+
+
+def test_rejects_oversized_frame(transport):
+    with pytest.raises(ValueError):
+        transport.publish(1, bytes(257))
+
+
+def _read_in_child(name, queue):
+    reader = FrameTransport.attach(name)
+    frame = reader.latest(cam_id=7)
+    queue.put((frame.seq, frame.copy().tolist()))
+    del frame
+    reader.close()
+
+
+def test_attach_from_other_process(transport):
+    seq = transport.publish(7, np.array([[1, 2], [3, 4]], dtype=np.uint8))
+    queue = mp.get_context("spawn").Queue()
+    proc = mp.get_context("spawn").Process(target=_read_in_child, args=(transport.name, queue))
+    proc.start()
+    assert queue.get(timeout=20) == (seq, [[1, 2], [3, 4]])
+    proc.join(20)
+    # The block survives the reader exiting
+    assert transport.latest(7) is not None
+
+
+def test_attach_leaves_other_shared_memory_tracked(transport, monkeypatch):
+    from concurrent.futures import ThreadPoolExecutor
+    from multiprocessing import resource_tracker, shared_memory
+
+    registered = []
+    original = resource_tracker.register
+
+    def spy(name, rtype):
+        registered.append(name)
+        original(name, rtype)
+
+    monkeypatch.setattr(resource_tracker, "register", spy)
+
+    def attach_and_close(_):
+        reader = FrameTransport.attach(transport.name)
+        reader.close()
+
+    def create(_):
+        shm = shared_memory.SharedMemory(create=True, size=16)
+        shm.close()
+        shm.unlink()
+        return shm._name
+
+    with ThreadPoolExecutor(8) as pool:
+        attaches = [pool.submit(attach_and_close, i) for i in range(32)]
+        created = list(pool.map(create, range(8)))
+        for future in attaches:
+            future.result()
+    assert set(created) <= set(registered)
+    assert resource_tracker.register is spy
+
+
+def test_unrelated_reader_does_not_unlink_block(transport):
+    import subprocess
+    import sys
+    from pathlib import Path
+
+    transport.publish(3, b"abc")
+    code = (
+        "from frame_transport import FrameTransport\n"
+        f"t = FrameTransport.attach({transport.name!r})\n"
+        "f = t.latest(3); assert f.copy() == b'abc'; del f\n"
+        "t.close()\n"
+    )
+    root = Path(__file__).resolve().parents[1]
+    proc = subprocess.run([sys.executable, "-c", code], cwd=root, capture_output=True, text=True)
+    assert proc.returncode == 0, proc.stderr
+    assert "leaked" not in proc.stderr
+    assert FrameTransport.attach(transport.name).latest(3) is not None
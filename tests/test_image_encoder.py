@@ -0,0 +1,50 @@
+import io
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from image_encoder import FrameEncoder, format_for_path
+
+
+@pytest.fixture(scope="module")
+def encoder():
+    with FrameEncoder(fmt="JPEG", quality=80, max_workers=2) as enc:
+        yield enc
+
+
+def test_encode_formats(encoder):
+    frame = np.zeros((8, 12, 3), dtype=np.uint8)
+    frame[:, :6] = 255
+
+    jpeg = encoder.encode(frame)
+    assert jpeg[:2] == b"\xff\xd8"
+    png = encoder.encode(frame, fmt="PNG")
+    decoded = np.array(Image.open(io.BytesIO(png)))
+    assert np.array_equal(decoded, frame)
+    webp = encoder.encode(frame, fmt="webp", quality=50)
+    assert webp[:4] == b"RIFF"
+
+
+def test_parallel_submit(encoder):
+    frames = [np.full((4, 4), i, dtype=np.uint8) for i in range(6)]
+    futures = [encoder.submit(f, fmt="PNG") for f in frames]
+    values = [np.array(Image.open(io.BytesIO(f.result())))[0, 0] for f in futures]
+    assert values == list(range(6))
+
+
+def test_encode_image_and_suffix(encoder):
+    img = Image.new("RGBA", (3, 3), "red")
+    data = encoder.encode_image(img)  # alpha dropped for JPEG
+    assert Image.open(io.BytesIO(data)).mode == "RGB"
+    assert encoder.suffix() == ".jpg"
+    assert format_for_path("a/b.PNG") == "PNG"
+
+
+def test_workers_are_not_forked(encoder):
+    assert encoder._pool._mp_context.get_start_method() != "fork"
+
+
+def test_rejects_unknown_format():
+    with pytest.raises(ValueError):
+        FrameEncoder(fmt="BMPX")
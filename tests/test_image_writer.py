@@ -0,0 +1,192 @@
+import errno
+import os
+from pathlib import Path
+
+import pytest
+
+from frame_buffer import FrameRing
+from image_writer import ImageWriter, save_frame
+
+
+def file_frame(tmp_path: Path, data: bytes = b"jpeg bytes"):
+    src = tmp_path / "src.jpg"
+    src.write_bytes(data)
+    return FrameRing().push(data, path=src), src
+
+
+def test_in_memory_frame_written_directly(tmp_path: Path):
+    frame = FrameRing().push(b"raw")
+    out = save_frame(frame, tmp_path / "out.jpg", strategy="move")
+    assert out.read_bytes() == b"raw"
+
+
+def test_hardlink_shares_inode(tmp_path: Path):
+    frame, src = file_frame(tmp_path)
+    out = save_frame(frame, tmp_path / "out.jpg", strategy="hardlink")
+    assert out.read_bytes() == b"jpeg bytes"
+    assert os.stat(out).st_ino == os.stat(src).st_ino
+
+
+def test_move_and_copy(tmp_path: Path):
+    frame, src = file_frame(tmp_path)
+    copied = save_frame(frame, tmp_path / "copy.jpg", strategy="copy")
+    assert src.is_file() and copied.read_bytes() == b"jpeg bytes"
+
+    moved = save_frame(frame, tmp_path / "moved.jpg", strategy="move")
+    assert not src.exists() and moved.read_bytes() == b"jpeg bytes"
+
+    # Source is gone; the in-memory bytes are written instead
+    again = save_frame(frame, tmp_path / "again.jpg", strategy="move")
+    assert again.read_bytes() == b"jpeg bytes"
+
+
+def test_unowned_files_are_never_moved_or_linked(tmp_path: Path):
+    src = tmp_path / "corpus.jpg"
+    src.write_bytes(b"corpus")
+    frame = FrameRing().push(b"corpus", path=src, owned=False)
+
+    for strategy in ("move", "hardlink"):
+        out = save_frame(frame, tmp_path / f"{strategy}.jpg", strategy=strategy)
+        assert out.read_bytes() == b"corpus"
+        assert out.stat().st_ino != src.stat().st_ino
+    assert src.read_bytes() == b"corpus"
+
+
+def test_reflink_falls_back_to_copy(tmp_path: Path):
+    frame, _ = file_frame(tmp_path)
+    out = save_frame(frame, tmp_path / "out.jpg", strategy="reflink")
+    assert out.read_bytes() == b"jpeg bytes"
+
+
+def test_cross_device_falls_back(tmp_path: Path, monkeypatch):
+    frame, src = file_frame(tmp_path)
+
+    def cross_device(*args):
+        raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+    monkeypatch.setattr(os, "link", cross_device)
+    out = save_frame(frame, tmp_path / "out.jpg", strategy="hardlink")
+    assert out.read_bytes() == b"jpeg bytes"
+    assert os.stat(out).st_ino != os.stat(src).st_ino
+
+
+def test_unknown_strategy(tmp_path: Path):
+    frame, _ = file_frame(tmp_path)
+    with pytest.raises(ValueError):
+        save_frame(frame, tmp_path / "out.jpg", strategy="teleport")
+
+
+def test_writer_writes_in_background(tmp_path: Path):
+    ring = FrameRing()
+    with ImageWriter(durability="batch", batch_size=4) as writer:
+        paths = [
+            writer.submit(ring.push(f"img{i}".encode()), tmp_path / f"{i}.jpg")
+            for i in range(10)
+        ]
+        writer.flush()
+        metrics = writer.metrics()
+
+    assert [p.read_bytes() for p in paths] == [f"img{i}".encode() for i in range(10)]
+    assert metrics["written"] == 10 and metrics["failed"] == 0
+    assert metrics["queue_depth"] == 0
+    assert metrics["latency_max"] >= metrics["latency_p50"] >= 0
+
+
+def test_writer_backpressure(tmp_path: Path):
+    import queue
+    import threading
+    import time
+
+    gate = threading.Event()
+    frame = FrameRing().push(b"x")
+    writer = ImageWriter(max_queue=1, durability="file")
+    original = writer._write
+
+    def slow_write(job):
+        gate.wait(5)
+        return original(job)
+
+    writer._write = slow_write
+    writer.submit(frame, tmp_path / "a.jpg")  # picked up by the worker
+    deadline = time.monotonic() + 2
+    while writer.queue_depth and time.monotonic() < deadline:
+        time.sleep(0.01)
+    writer.submit(frame, tmp_path / "b.jpg")  # fills the queue
+    with pytest.raises(queue.Full):
+        writer.submit(frame, tmp_path / "c.jpg", block=False)
+    assert writer.queue_depth == 1
+
+    gate.set()
+    writer.close()
+    assert (tmp_path / "a.jpg").is_file() and (tmp_path / "b.jpg").is_file()
+
+
+def test_writer_reports_errors(tmp_path: Path):
+    errors = []
+    frame = FrameRing().push(b"x")
+    with ImageWriter(on_error=lambda job, exc: errors.append(job.dest)) as writer:
+        writer.submit(frame, tmp_path / "missing" / "a.jpg")
+        writer.flush()
+        assert writer.metrics()["failed"] == 1
+    assert errors == [tmp_path / "missing" / "a.jpg"]
+
+
+def test_writer_encodes_arrays_with_encoder(tmp_path: Path):
+    import numpy as np
+    from PIL import Image
+    from image_encoder import FrameEncoder
+
+    frame = FrameRing().push(np.zeros((4, 5, 3), dtype=np.uint8), suffix=".png")
+    with FrameEncoder(max_workers=1) as encoder:
+        with ImageWriter(encoder=encoder) as writer:
+            out = writer.submit(frame, tmp_path / "a.webp")
+            writer.flush()
+    assert Image.open(out).format == "WEBP"
+
+
+class RecordingEncoder:
+    """Encoder that records when frames are submitted and collected."""
+
+    def __init__(self):
+        import threading
+
+        self.events = []
+        self.entered = threading.Event()
+        self.gate = threading.Event()
+
+    def submit(self, array, *, fmt=None):
+        from concurrent.futures import Future
+
+        index = int(array.flat[0])
+        self.events.append(("submit", index))
+        if not self.entered.is_set():
+            self.entered.set()
+            self.gate.wait(5)  # hold the writer while the next batch queues up
+        events = self.events
+
+        class Result(Future):
+            def result(self, timeout=None):
+                events.append(("result", index))
+                return b"encoded"
+
+        return Result()
+
+
+def test_writer_submits_whole_batch_before_collecting(tmp_path: Path):
+    import numpy as np
+
+    encoder = RecordingEncoder()
+    ring = FrameRing()
+    frames = [ring.push(np.full((2, 2), i, dtype=np.uint8)) for i in range(4)]
+    with ImageWriter(encoder=encoder) as writer:
+        writer.submit(frames[0], tmp_path / "0.png")
+        assert encoder.entered.wait(5)
+        for i in range(1, 4):
+            writer.submit(frames[i], tmp_path / f"{i}.png")
+        encoder.gate.set()
+        writer.flush()
+
+    assert encoder.events[2:] == [("submit", i) for i in (1, 2, 3)] + [
+        ("result", i) for i in (1, 2, 3)
+    ]
+    assert (tmp_path / "3.png").read_bytes() == b"encoded"
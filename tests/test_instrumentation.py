@@ -0,0 +1,78 @@
+import random
+import time
+
+import pytest
+
+from instrumentation import Instrumentation, LatencyHistogram
+
+
+class ListLogger:
+    def __init__(self):
+        self.events = []
+
+    def log_event(self, event_type, message, metadata=None):
+        self.events.append((event_type, message, metadata))
+
+
+def test_histogram_percentiles_within_precision():
+    hist = LatencyHistogram(significant_figures=2)
+    rng = random.Random(0)
+    values = sorted(rng.uniform(0.0001, 2.0) for _ in range(5000))
+    for v in values:
+        hist.record(v)
+
+    for p in (50, 90, 99):
+        exact = values[int(len(values) * p / 100) - 1]
+        assert hist.percentile(p) == pytest.approx(exact, rel=0.02)
+    assert hist.count == 5000
+    assert hist.percentile(100) == pytest.approx(values[-1], rel=0.01)
+
+
+def test_histogram_merge_and_summary():
+    a, b = LatencyHistogram(), LatencyHistogram()
+    a.record(0.001)
+    b.record(0.003)
+    a.merge(b)
+    summary = a.summary()
+    assert summary["count"] == 2
+    assert summary["min_ms"] == pytest.approx(1.0)
+    assert summary["max_ms"] == pytest.approx(3.0)
+    assert LatencyHistogram().summary() == {"count": 0}
+    with pytest.raises(ValueError):
+        a.merge(LatencyHistogram(significant_figures=3))
+
+
+def test_spans_per_stage_and_camera():
+    inst = Instrumentation()
+    with inst.span("capture", cam_id=1):
+        pass
+    with pytest.raises(RuntimeError):
+        with inst.span("save", cam_id=2):
+            raise RuntimeError("disk full")
+
+    snap = inst.snapshot()
+    assert snap["stages"]["capture"]["count"] == 1
+    assert snap["stages"]["save"]["count"] == 1
+    assert snap["cameras"][2]["save"]["count"] == 1
+    assert inst.histogram("capture", 1).count == 1
+
+
+def test_dump_to_event_logger():
+    inst = Instrumentation()
+    inst.record("log", 0.002)
+    logger = ListLogger()
+
+    inst.dump(logger, reset=True)
+    event_type, _, metadata = logger.events[0]
+    assert event_type == "metrics"
+    assert metadata["stages"]["log"]["count"] == 1
+    assert inst.snapshot()["stages"] == {}
+
+    inst.start_periodic_dump(logger, interval=0.01)
+    try:
+        deadline = time.monotonic() + 2
+        while len(logger.events) < 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        inst.stop_periodic_dump()
+    assert len(logger.events) >= 3
@@ -0,0 +1,72 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from iv2_result import (
+    IV2_INPUT_SIZE,
+    IV2Field,
+    as_iv2_array,
+    decode_iv2_batch,
+    decode_iv2_result,
+    extract,
+    load_iv2_batch,
+    overall_ok,
+)
+
+
+def make_assembly(ok=True, program=3) -> bytes:
+    raw = bytearray(IV2_INPUT_SIZE)
+    raw[4] = 0b01 if ok else 0b10
+    raw[12] = program
+    return bytes(raw)
+
+
+def test_decode_single_from_int_list():
+    raw = list(make_assembly())
+    result = decode_iv2_result(raw)
+
+    assert result.overall_ok
+    # Matches the legacy "word4 & 1" check
+    assert result.overall_ok == bool(raw[4] & 1)
+    assert result.get(IV2Field("program", 12)) == 3
+    assert result.get(IV2Field("ng", 4, 1)) is False
+
+
+def test_decode_keeps_word_sized_elements():
+    raw = [0] * IV2_INPUT_SIZE
+    raw[4] = 0x0101
+    raw[12] = 1000
+    result = decode_iv2_result(raw)
+    assert result.overall_ok
+    assert result.get(IV2Field("value", 12)) == 1000
+
+
+def test_decode_rejects_short_buffer():
+    with pytest.raises(ValueError):
+        decode_iv2_result(b"\x00" * 10)
+
+
+def test_array_view_is_zero_copy():
+    buf = bytearray(make_assembly())
+    arr = as_iv2_array(buf)
+    assert arr.shape == (1, IV2_INPUT_SIZE)
+    buf[4] = 0
+    assert not overall_ok(arr)[0]
+
+
+def test_batch_decoding(tmp_path: Path):
+    assemblies = [make_assembly(ok=i % 2 == 0, program=i) for i in range(4)]
+
+    records = decode_iv2_batch(assemblies)
+    assert overall_ok(records).tolist() == [True, False, True, False]
+    assert extract(records, IV2Field("program", 12)).tolist() == [0, 1, 2, 3]
+
+    rows = np.frombuffer(b"".join(assemblies), dtype=np.uint8).reshape(4, -1)
+    assert decode_iv2_batch(rows).shape == (4, IV2_INPUT_SIZE)
+
+    path = tmp_path / "results.bin"
+    path.write_bytes(b"".join(assemblies))
+    stored = load_iv2_batch(path)
+    assert len(stored) == 4
+    assert overall_ok(stored).tolist() == [True, False, True, False]
@@ -0,0 +1,90 @@
+from datetime import datetime
+from pathlib import Path
+import json
+
+import pytest
+
+from event_logger import EventLogger, iter_events, iter_rows, tail
+from log_rotation import RotationPolicy
+
+
+def _write_lines(path: Path, n: int) -> None:
+    with path.open("w") as fh:
+        for i in range(n):
+            event = {
+                "timestamp": f"2026-01-{i % 28 + 1:02d}T08:00:00",
+                "event_type": "error" if i % 3 == 0 else "info",
+                "message": f"event {i}",
+                "metadata": {"n": i},
+            }
+            fh.write(json.dumps(event) + "\n")
+
+
+@pytest.mark.parametrize("use_mmap", [False, True])
+def test_iter_events_json_lines_with_filters(tmp_path: Path, use_mmap: bool):
+    log = tmp_path / "events.txt"
+    _write_lines(log, 28)
+
+    events = iter_events(log, use_mmap=use_mmap, chunk_size=64)
+    assert not isinstance(events, list)
+    assert [e.metadata["n"] for e in events] == list(range(28))
+
+    errors = iter_events(log, event_type="error", use_mmap=use_mmap)
+    assert [e.metadata["n"] for e in errors] == list(range(0, 28, 3))
+
+    week = iter_events(log, since=datetime(2026, 1, 3), until="2026-01-10", use_mmap=use_mmap)
+    assert [e.metadata["n"] for e in week] == list(range(2, 9))
+
+    odd = iter_events(log, event_type="info", where=lambda e: e.metadata["n"] % 2 == 1)
+    assert [e.metadata["n"] for e in odd] == [1, 5, 7, 11, 13, 17, 19, 23, 25]
+
+
+def test_iter_events_json_array_and_csv(tmp_path: Path):
+    logger = EventLogger(tmp_path / "log.txt")
+    for i in range(50):
+        logger.log_event("info" if i % 2 else "error", f"event, {i}\nline two", {"n": i})
+    logger.save_log_json(tmp_path / "out.json")
+    logger.save_log_csv(tmp_path / "out.csv")
+
+    for name in ("out.json", "out.csv", "log.txt"):
+        assert list(iter_events(tmp_path / name, chunk_size=16)) == list(logger.logs)
+        errors = list(iter_rows(tmp_path / name, event_type="error"))
+        assert len(errors) == 25
+
+    (tmp_path / "empty.json").write_text(" [ ] ")
+    assert list(iter_events(tmp_path / "empty.json")) == []
+    (tmp_path / "truncated.json").write_text('[{"timestamp": "t", "event_type": "info"')
+    with pytest.raises(ValueError):
+        list(iter_events(tmp_path / "truncated.json"))
+
+
+def test_tail_reads_from_end(tmp_path: Path):
+    log = tmp_path / "events.txt"
+    _write_lines(log, 1000)
+    assert [e.metadata["n"] for e in tail(log, 3, chunk_size=50)] == [997, 998, 999]
+    assert len(tail(log, 5000)) == 1000
+    assert tail(log, 0) == []
+
+    logger = EventLogger(tmp_path / "log.txt")
+    for i in range(5):
+        logger.log_event("info", f"event {i}")
+    logger.save_log_csv(tmp_path / "out.csv")
+    assert [e.message for e in tail(tmp_path / "out.csv", 2)] == ["event 3", "event 4"]
+
+
+def test_readers_span_rotated_segments(tmp_path: Path):
+    log = tmp_path / "events.txt"
+    policy = RotationPolicy(max_bytes=250, compression="gzip")
+    with EventLogger(log, rotation=policy) as logger:
+        for i in range(30):
+            logger.log_event("info", f"event {i}", {"n": i})
+    assert len(logger.segments()) > 3
+
+    assert [e.metadata["n"] for e in iter_events(log)] == list(range(30))
+    assert [e.metadata["n"] for e in tail(log, 12)] == list(range(18, 30))
+    # segments rotated before `since` are skipped
+    assert list(iter_events(log, since="2999-01-01")) == []
+
+    loader = EventLogger(tmp_path / "other.txt")
+    loader.load_log_json(log)
+    assert len(loader.logs) == 30
@@ -0,0 +1,127 @@
+from datetime import datetime
+from pathlib import Path
+import json
+import os
+import time
+
+import pytest
+
+from event_logger import EventLogger
+from log_rotation import (
+    RotationPolicy,
+    apply_retention,
+    compress_segment,
+    list_segments,
+    open_segment,
+    segment_path,
+)
+
+
+def test_policy_periods():
+    day = RotationPolicy(when="day")
+    assert not day.should_rotate(100, 10, datetime(2026, 1, 1, 23, 59), datetime(2026, 1, 1, 23, 59, 59))
+    assert day.should_rotate(100, 10, datetime(2026, 1, 1, 23, 59), datetime(2026, 1, 2, 0, 0))
+
+    shift = RotationPolicy(when="shift", shift_starts=("06:00", "18:00"))
+    assert shift.period(datetime(2026, 1, 2, 5, 0)) == shift.period(datetime(2026, 1, 1, 19, 0))
+    assert shift.should_rotate(1, 1, datetime(2026, 1, 2, 5, 59), datetime(2026, 1, 2, 6, 0))
+    # an empty segment is never rotated
+    assert not shift.should_rotate(0, 1, datetime(2026, 1, 2, 5, 59), datetime(2026, 1, 2, 6, 0))
+
+    size = RotationPolicy(max_bytes=100)
+    assert not size.should_rotate(90, 10, datetime.now(), datetime.now())
+    assert size.should_rotate(91, 10, datetime.now(), datetime.now())
+
+    with pytest.raises(ValueError):
+        RotationPolicy(when="hourly")
+    with pytest.raises(ValueError):
+        RotationPolicy(compression="zip")
+
+
+def test_segments_compress_and_list(tmp_path: Path):
+    log = tmp_path / "events.txt"
+    log.write_text("live\n")
+    first = segment_path(log, datetime(2026, 1, 1, 6, 0))
+    first.write_text("one\n")
+    second = segment_path(log, datetime(2026, 1, 1, 6, 0))
+    assert second.name == "events.20260101-060000-1.txt"
+    second.write_text("two\n")
+
+    # names keep sorting after earlier ones even once those are deleted
+    later = segment_path(log, datetime(2026, 1, 1, 6, 0), taken=[second])
+    assert later.name == "events.20260101-060000-2.txt"
+
+    compressed = compress_segment(first, "lzma")
+    assert compressed.name == "events.20260101-060000.txt.xz"
+    assert not first.exists()
+
+    assert list_segments(log) == [compressed, second, log]
+    assert [open_segment(p).read() for p in list_segments(log)] == ["one\n", "two\n", "live\n"]
+    # the plain name still opens after compression
+    with open_segment(first, "rb") as fh:
+        assert fh.read() == b"one\n"
+
+    deleted = apply_retention(log, RotationPolicy(max_segments=1))
+    assert deleted == [compressed]
+    assert list_segments(log) == [second, log]
+
+    old = time.time() - 3 * 86400
+    os.utime(second, (old, old))
+    assert apply_retention(log, RotationPolicy(retention_days=1)) == [second]
+
+
+@pytest.mark.parametrize("buffered", [False, True])
+def test_logger_rotates_by_size(tmp_path: Path, buffered: bool):
+    log = tmp_path / "events.txt"
+    policy = RotationPolicy(max_bytes=300, compression="gzip")
+    with EventLogger(log, buffered=buffered, max_entries=3, rotation=policy) as logger:
+        for i in range(20):
+            logger.log_event("info", f"event {i}", {"n": i})
+        assert logger.segments()[-1] == log
+        # spilled entries are read back across rotated segments
+        assert [e.metadata["n"] for e in logger.logs] == list(range(20))
+        assert logger.logs[1].message == "event 1"
+
+    segments = list_segments(log)
+    assert len(segments) > 2 and segments[-1] == log
+    assert all(p.name.endswith(".txt.gz") for p in segments[:-1])
+    assert log.stat().st_size <= 300
+    lines = [json.loads(line) for p in segments for line in open_segment(p)]
+    assert [row["metadata"]["n"] for row in lines] == list(range(20))
+
+
+def test_logger_retention_forgets_deleted_entries(tmp_path: Path):
+    log = tmp_path / "events.txt"
+    policy = RotationPolicy(max_bytes=200, compression=None, max_segments=1)
+    with EventLogger(log, max_entries=2, rotation=policy) as logger:
+        for i in range(20):
+            logger.log_event("info", f"event {i}")
+    kept = [json.loads(line)["message"] for p in list_segments(log) for line in open_segment(p)]
+    assert len(list_segments(log)) == 2
+    assert [e.message for e in logger.logs] == kept
+    assert kept[-1] == "event 19"
+
+
+def test_retention_skips_segments_still_queued_for_compression(tmp_path, monkeypatch, caplog):
+    import event_logger
+
+    original = event_logger.compress_segment
+    calls = []
+
+    def slow_compress(path, method):
+        calls.append(path)
+        if len(calls) == 1:
+            time.sleep(0.2)  # let later rotations queue up behind this one
+        return original(path, method)
+
+    monkeypatch.setattr(event_logger, "compress_segment", slow_compress)
+    log = tmp_path / "events.txt"
+    policy = RotationPolicy(max_bytes=300, compression="gzip", max_segments=2)
+    with EventLogger(log, max_entries=3, rotation=policy) as logger:
+        for i in range(30):
+            logger.log_event("info", f"event {i}", {"n": i})
+
+    assert "Failed to compress" not in caplog.text
+    segments = list_segments(log)
+    assert len(segments) == 3
+    assert all(p.name.endswith(".txt.gz") for p in segments[:-1])
@@ -19,3 +19,16 @@ def test_logs_to_dataframe_and_html(tmp_path: Path):
 
     html = logs_to_dataframe(logger.logs, as_html=True)
     assert "<table" in html and "</table>" in html
+
+
+def test_logs_to_dataframe_includes_spilled_history(tmp_path: Path):
+    pytest.importorskip("pandas")
+
+    logger = EventLogger(tmp_path / "log.txt", max_entries=2)
+    for i in range(5):
+        logger.log_event("info", f"event {i}", {"i": i})
+
+    df = logs_to_dataframe(logger.logs)
+    assert list(df["message"]) == [f"event {i}" for i in range(5)]
+    assert df.iloc[0]["metadata"] == {"i": 0}
+    assert list(logs_to_dataframe(list(logger.logs))["message"]) == list(df["message"])
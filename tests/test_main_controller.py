@@ -87,6 +87,10 @@ def test_on_trigger_success(tmp_path: Path):
     saved = Path(ui.logs[0])
     assert saved.is_file()
 
+    stages = controller.instrumentation.snapshot()["stages"]
+    for stage in ("cycle", "serial_read", "model_lookup", "capture", "save", "log"):
+        assert stages[stage]["count"] == 1
+
 
 def test_on_trigger_error(tmp_path: Path):
     ui = DummyUI()
@@ -124,3 +128,57 @@ def test_export_logs(tmp_path: Path):
 
     assert out.is_file()
     assert "exported" in ui.status.lower()
+
+
+class FakeImageWriter:
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+def test_close_stops_writer_and_logger(tmp_path: Path):
+    ui = DummyUI()
+    logger = EventLogger(tmp_path / "log.txt", buffered=True)
+    writer = FakeImageWriter()
+    controller = MainController(
+        ui,
+        camera_manager=FakeCameraManager(tmp_path),
+        input_manager=FakeInputManager(),
+        event_logger=logger,
+        image_writer=writer,
+        metrics_interval=60,
+        image_dir=tmp_path / "images",
+    )
+    logger.log_event("info", "queued")
+
+    controller.close()
+
+    assert writer.closed
+    assert "queued" in (tmp_path / "log.txt").read_text()
+
+
+def test_injected_camera_manager_is_not_modified(tmp_path: Path, monkeypatch):
+    import main
+
+    cam = FakeCameraManager(tmp_path)
+    cam.instrumentation = None
+    MainController(
+        DummyUI(),
+        camera_manager=cam,
+        input_manager=FakeInputManager(),
+        event_logger=EventLogger(tmp_path / "log.txt"),
+    )
+    assert cam.instrumentation is None
+
+    class CreatedManager:
+        instrumentation = None
+
+    monkeypatch.setattr(main, "CameraManager", CreatedManager)
+    controller = MainController(
+        DummyUI(),
+        input_manager=FakeInputManager(),
+        event_logger=EventLogger(tmp_path / "log2.txt"),
+    )
+    assert controller.camera_manager.instrumentation is controller.instrumentation
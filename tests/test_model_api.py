@@ -28,3 +28,18 @@ def test_reload_mapping(tmp_path: Path):
     cfg.write_text(json.dumps({"serialMapping": {"DD44": "Model4"}}))
     model_api.reload_mapping()  # reload same path
     assert model_api.select_model("DD44bbbb") == "Model4"
+
+
+def test_temporary_mapping_restores_previous(tmp_path: Path):
+    outer = tmp_path / "outer.json"
+    outer.write_text(json.dumps({"serialMapping": {"EE55": "Outer"}}))
+    inner = tmp_path / "inner.json"
+    inner.write_text(json.dumps({"serialMapping": {"FF66": "Inner"}}))
+    model_api.reload_mapping(outer)
+
+    with model_api.temporary_mapping(inner):
+        assert model_api.select_model("FF66aaaa") == "Inner"
+        assert model_api.select_model("EE55aaaa") is None
+    assert model_api.select_model("EE55aaaa") == "Outer"
+    model_api.reload_mapping()
+    assert model_api.select_model("FF66aaaa") is None
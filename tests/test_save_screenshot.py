@@ -24,3 +24,13 @@ def test_save_logs_error(monkeypatch, tmp_path: Path):
     with pytest.raises(OSError):
         save_screenshot(img, tmp_path, "bad.png", log_func=messages.append)
     assert messages and "fail" in messages[0]
+
+
+def test_save_with_encoder(tmp_path: Path):
+    from image_encoder import FrameEncoder
+
+    img = Image.new("RGB", (3, 2), "blue")
+    with FrameEncoder(max_workers=1) as encoder:
+        out = save_screenshot(img, tmp_path, "img.png", encoder=encoder)
+    assert Image.open(out).format == "PNG"
+    assert Image.open(out).size == (3, 2)
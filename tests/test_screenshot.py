@@ -32,3 +32,23 @@ def test_capture_file(monkeypatch, tmp_path):
     assert path.is_file()
     img = Image.open(path)
     assert img.size == (4, 4)
+
+
+def test_capture_numpy_into_pool(monkeypatch):
+    import types
+    from buffer_pool import BufferPool
+
+    pool = BufferPool()
+    sc = ScreenCapture(pool=pool)
+    bgra = np.zeros((2, 3, 4), dtype=np.uint8)
+    bgra[..., 0] = 10  # blue
+    bgra[..., 2] = 30  # red
+    shot = types.SimpleNamespace(size=(3, 2), bgra=bgra.tobytes())
+    monkeypatch.setattr(sc._sct, "grab", lambda box: shot)
+
+    arr = sc.capture(region=(0, 0, 3, 2), as_numpy=True)
+    assert arr.shape == (2, 3, 3)
+    assert arr[0, 0].tolist() == [30, 0, 10]
+    pool.release(arr)
+    again = sc.capture(region=(0, 0, 3, 2), as_numpy=True)
+    assert again is arr and pool.stats()["hits"] == 1